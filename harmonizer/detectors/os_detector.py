@@ -19,15 +19,71 @@ WSL is particularly important to detect separately because it:
 - Has unique behaviors around file permissions and executables
 """
 
+import json
 import platform
 import os
-import subprocess
-from typing import Tuple
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 from harmonizer.models import OSType
 from harmonizer.utils.subprocess_utils import run_command_safe
 
 
+# On-disk cache of the OS detection result (see get_system_info_cached),
+# kept in $XDG_CACHE_HOME (~/.cache when unset) as the XDG spec asks
+OS_CACHE_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "harmonizer"
+    / "os.json"
+)
+
+# Changes on every boot, so it is a natural key for "same machine state"
+BOOT_ID_FILE = "/proc/sys/kernel/random/boot_id"
+
+# Rewritten by distro upgrades, which don't need a reboot to take effect
+OS_RELEASE_FILES = ("/etc/os-release", "/usr/lib/os-release")
+
+# KEY=value or KEY="value" lines of /etc/os-release and /etc/lsb-release
+_RELEASE_LINE = re.compile(r'^([A-Za-z0-9_]+)="?([^"\n]*)', re.MULTILINE)
+
+
+def clear_os_cache() -> None:
+    """
+    Forget the OS detection results remembered for this process.
+
+    EDUCATIONAL NOTE - Per-Process Memoization:
+    The OS can't change while the program is running, yet detect_os_type()
+    is called by get_os_version(), get_wsl_version(), get_system_info()
+    and the quirks detector. Each call used to re-open /proc files (and
+    possibly run lsb_release). lru_cache(maxsize=1) on these argument-less
+    functions keeps the first answer; tests that fake a different OS
+    clear it with this function.
+    """
+
+    detect_os_type.cache_clear()
+    _get_linux_distribution.cache_clear()
+    _read_proc_version.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _read_proc_version() -> Optional[str]:
+    """
+    Read /proc/version (the kernel build string), lowercased.
+
+    Returns:
+        The file contents, or None if it doesn't exist or can't be read
+    """
+
+    try:
+        with open("/proc/version", "r") as f:
+            return f.read().lower()
+    except (FileNotFoundError, PermissionError):
+        return None
+
+
+@lru_cache(maxsize=1)
 def detect_os_type() -> OSType:
     """
     Detect the operating system type with special WSL detection.
@@ -71,15 +127,11 @@ def detect_os_type() -> OSType:
     if system == "Linux":
         # Method 1: Check /proc/version for Microsoft signature
         # This is the most reliable method for both WSL 1 and WSL 2
-        try:
-            with open("/proc/version", "r") as f:
-                proc_version = f.read().lower()
-                if "microsoft" in proc_version or "wsl" in proc_version:
-                    return OSType.WSL
-        except (FileNotFoundError, PermissionError):
-            # /proc/version doesn't exist or can't be read
-            # This is normal on some Linux systems, continue with other checks
-            pass
+        # /proc/version may not exist or be readable; this is normal on some
+        # Linux systems, so we just continue with the other checks
+        proc_version = _read_proc_version()
+        if proc_version and ("microsoft" in proc_version or "wsl" in proc_version):
+            return OSType.WSL
 
         # Method 2: Check /proc/sys/kernel/osrelease for WSL marker
         try:
@@ -164,6 +216,7 @@ def get_os_version() -> str:
         return f"{platform.system()} {platform.release()}"
 
 
+@lru_cache(maxsize=1)
 def _get_linux_distribution() -> str:
     """
     Get Linux distribution name and version.
@@ -189,49 +242,33 @@ def _get_linux_distribution() -> str:
     """
 
     # Try /etc/os-release (modern standard)
-    try:
-        with open("/etc/os-release", "r") as f:
-            lines = f.readlines()
-            distro_info = {}
-
-            for line in lines:
-                if "=" in line:
-                    key, value = line.strip().split("=", 1)
-                    # Remove quotes from value
-                    distro_info[key] = value.strip('"')
-
-            # Build version string from available information
-            name = distro_info.get("PRETTY_NAME") or distro_info.get("NAME", "")
-            if name:
-                return name
-
-            # Fallback: construct from NAME and VERSION
-            version = distro_info.get("VERSION", "")
-            if version:
-                return f"{distro_info.get('NAME', 'Linux')} {version}"
-
-    except (FileNotFoundError, PermissionError, ValueError):
-        pass
+    distro_info = _read_os_release()
+
+    # Build version string from available information
+    name = distro_info.get("PRETTY_NAME") or distro_info.get("NAME", "")
+    if name:
+        return name
+
+    # Fallback: construct from NAME and VERSION
+    version = distro_info.get("VERSION", "")
+    if version:
+        return f"{distro_info.get('NAME', 'Linux')} {version}"
 
     # Try /etc/lsb-release (LSB systems)
-    try:
-        with open("/etc/lsb-release", "r") as f:
-            lines = f.readlines()
-            lsb_info = {}
+    lsb_info = _read_release_file("/etc/lsb-release")
 
-            for line in lines:
-                if "=" in line:
-                    key, value = line.strip().split("=", 1)
-                    lsb_info[key] = value.strip('"')
+    description = lsb_info.get("DISTRIB_DESCRIPTION", "")
+    if description:
+        return description
 
-            description = lsb_info.get("DISTRIB_DESCRIPTION", "")
-            if description:
-                return description
+    # Try using lsb_release command if available. Look it up on PATH first:
+    # that is a few stat() calls, while trying to run a missing command
+    # still pays for starting the subprocess machinery.
+    import shutil
 
-    except (FileNotFoundError, PermissionError, ValueError):
-        pass
+    if shutil.which("lsb_release") is None:
+        return ""
 
-    # Try using lsb_release command if available
     success, stdout, _ = run_command_safe(["lsb_release", "-d"], timeout=2)
 
     if success:
@@ -244,6 +281,57 @@ def _get_linux_distribution() -> str:
     return ""
 
 
+def _read_os_release() -> Dict[str, str]:
+    """
+    Read the os-release file.
+
+    Returns:
+        Dictionary of os-release keys to values (empty if there is none)
+
+    EDUCATIONAL NOTE - Prefer the Standard Library Parser:
+    Python 3.10 added platform.freedesktop_os_release(). It follows the
+    os-release spec (shell-style quoting and backslash escapes, and the
+    /usr/lib/os-release fallback location), which a simple KEY="value"
+    match gets wrong for unusual values. It also caches its result, so
+    later calls in the process don't touch the disk. Older Pythons use
+    our own reader.
+    """
+
+    freedesktop_os_release = getattr(platform, "freedesktop_os_release", None)
+    if freedesktop_os_release is None:  # Python < 3.10
+        return _read_release_file("/etc/os-release")
+
+    try:
+        return freedesktop_os_release()
+    except OSError:
+        return {}
+
+
+def _read_release_file(path: str) -> Dict[str, str]:
+    """
+    Read a KEY=value release file such as /etc/os-release.
+
+    Args:
+        path: File to read
+
+    Returns:
+        Dictionary of keys to unquoted values (empty if the file can't be read)
+
+    EDUCATIONAL NOTE - One Pass with findall:
+    Reading the whole (small) file and running one precompiled regex over
+    it replaces a Python loop that stripped, split and unquoted each line
+    separately. The regex engine does the looping in C.
+    """
+
+    try:
+        with open(path, "r") as f:
+            content = f.read()
+    except (FileNotFoundError, PermissionError, UnicodeDecodeError):
+        return {}
+
+    return dict(_RELEASE_LINE.findall(content))
+
+
 def get_wsl_version() -> str:
     """
     Detect WSL version (WSL 1 or WSL 2).
@@ -265,20 +353,16 @@ def get_wsl_version() -> str:
     if os_type != OSType.WSL:
         return "Not WSL"
 
-    try:
-        with open("/proc/version", "r") as f:
-            proc_version = f.read().lower()
-
-            # WSL 2 has "microsoft-standard" in kernel version
-            if "microsoft-standard" in proc_version:
-                return "WSL 2"
+    # Shares the /proc/version read already done by detect_os_type()
+    proc_version = _read_proc_version() or ""
 
-            # WSL 1 has "microsoft" but not "microsoft-standard"
-            if "microsoft" in proc_version:
-                return "WSL 1"
+    # WSL 2 has "microsoft-standard" in kernel version
+    if "microsoft-standard" in proc_version:
+        return "WSL 2"
 
-    except (FileNotFoundError, PermissionError):
-        pass
+    # WSL 1 has "microsoft" but not "microsoft-standard"
+    if "microsoft" in proc_version:
+        return "WSL 1"
 
     return "Unknown WSL version"
 
@@ -301,6 +385,97 @@ def get_system_info() -> Tuple[OSType, str]:
     return detect_os_type(), get_os_version()
 
 
+def _get_boot_id() -> Optional[str]:
+    """
+    Get an identifier for the current boot of the machine.
+
+    Returns:
+        Boot ID string on Linux/WSL, None where it isn't available
+    """
+
+    try:
+        with open(BOOT_ID_FILE, "r") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _get_os_release_mtime() -> Optional[int]:
+    """
+    Get the modification time of the os-release file.
+
+    Returns:
+        st_mtime_ns of the first OS_RELEASE_FILES entry that exists, or None
+    """
+
+    for path in OS_RELEASE_FILES:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+    return None
+
+
+def get_system_info_cached() -> Tuple[OSType, str]:
+    """
+    Get OS type and version, reusing the result from an earlier run.
+
+    The result of get_system_info() is stored in OS_CACHE_FILE together
+    with the current boot ID and the os-release modification time. Later
+    runs during the same boot read it back instead of re-reading /proc and
+    /etc files or running lsb_release.
+
+    Returns:
+        Tuple[OSType, str]: (os_type, os_version)
+
+    EDUCATIONAL NOTE - Choosing a Cache Key:
+    Every boot gets a fresh random boot ID, so keying the cache on it
+    means a reboot (a kernel update, a WSL restart) invalidates it with
+    no expiry time to tune. That alone misses an in-place distro upgrade,
+    which rewrites /etc/os-release while the machine keeps running, so
+    that file's modification time is part of the key too. Where no boot
+    ID exists (Windows, macOS) detection simply runs every time; it is
+    cheap there anyway.
+    """
+
+    boot_id = _get_boot_id()
+    if boot_id is None:
+        return get_system_info()
+    os_release_mtime = _get_os_release_mtime()
+
+    try:
+        cached = json.loads(OS_CACHE_FILE.read_text(encoding="utf-8"))
+        if (
+            cached.get("boot_id") == boot_id
+            and cached.get("os_release_mtime_ns") == os_release_mtime
+        ):
+            return OSType(cached["os_type"]), cached["os_version"]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        # Missing or corrupt cache - fall through and detect again
+        pass
+
+    os_type, os_version = get_system_info()
+
+    try:
+        OS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        OS_CACHE_FILE.write_text(
+            json.dumps(
+                {
+                    "boot_id": boot_id,
+                    "os_release_mtime_ns": os_release_mtime,
+                    "os_type": os_type.value,
+                    "os_version": os_version,
+                }
+            ),
+            encoding="utf-8",
+        )
+    except OSError:
+        # Caching is an optimization only - never fail detection over it
+        pass
+
+    return os_type, os_version
+
+
 # Example usage and testing (only runs when module executed directly)
 if __name__ == "__main__":
     """
@@ -18,12 +18,53 @@ Projects often specify minimum Python versions to ensure:
 - Code runs with expected behavior
 """
 
+import os
+import re
 import sys
 import subprocess
+import time
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, Set, Tuple
 
 from harmonizer.models import Issue, IssueSeverity
+from harmonizer.utils.toml_utils import load_toml
+
+
+# Files that can declare the project's Python version, in the order
+# get_project_python_requirement() checks them
+REQUIREMENT_FILES = (
+    ".python-version",
+    "runtime.txt",
+    "pyproject.toml",
+    "setup.py",
+    ".tool-versions",
+)
+
+# Windows and macOS filesystems ignore case by default, so a project's
+# "Setup.py" is the setup.py the requirement checks read. REQUIREMENT_FILES
+# keyed by casefolded name, for matching directory entries on those platforms.
+_CASE_INSENSITIVE_FS = os.name == "nt" or sys.platform == "darwin"
+_REQUIREMENT_FILES_BY_FOLD = {name.casefold(): name for name in REQUIREMENT_FILES}
+
+# Resolved requirements, keyed by absolute project path and holding
+# (fingerprint of REQUIREMENT_FILES, requirement)
+_REQUIREMENT_CACHE: Dict[str, Tuple[Tuple, Optional[str]]] = {}
+
+# Files modified more recently than this are not cached (the same "racy"
+# window the config and dependency detectors use)
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Python version lines of pyproject.toml: Poetry's python = "^3.10" and
+# PEP 621's requires-python = ">=3.10". Compiled once at import.
+_PYPROJECT_PYTHON = re.compile(
+    r"""^\s*(?:python|requires-python)\s*=\s*["']([^"']*)["']""", re.MULTILINE
+)
+
+# setup.py's python_requires=">=3.10" keyword argument
+_SETUP_PY_PYTHON = re.compile(r"""python_requires\s*=\s*["']([^"']*)["']""")
+
+# Specifier prefixes dropped to leave the minimum version (^3.10 -> 3.10)
+_VERSION_SPEC_PREFIX = re.compile(r"\^|~|>=")
 
 
 def detect_python_version() -> Dict[str, str]:
@@ -100,13 +141,87 @@ def get_project_python_requirement(project_path: str = ".") -> Optional[str]:
         >>> req = get_project_python_requirement("/path/to/project")
         >>> print(f"Project requires Python {req}")
         Project requires Python 3.10
+
+    EDUCATIONAL NOTE - Caching on File Fingerprints:
+    Tools that scan the same project repeatedly (watch loops, test
+    suites) would re-read and re-parse these files every time. We stat()
+    each candidate instead and reuse the previous answer while every
+    file's (modification time, size) - or absence - is unchanged.
+
+    The candidates are found with one os.scandir() of the project rather
+    than an exists() check per file, so a missing file costs nothing and
+    only the files that are present are stat()-ed.
+    """
+
+    cache_key = os.path.abspath(project_path)
+    stats = _stat_requirement_files(cache_key)
+    fingerprint = tuple(stats.get(name) for name in REQUIREMENT_FILES)
+
+    cached = _REQUIREMENT_CACHE.get(cache_key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    requirement = _find_project_python_requirement(Path(project_path), set(stats))
+
+    # A file changed within the racy window could change again without
+    # its modification time moving, so don't trust the fingerprint yet
+    newest_mtime_ns = max((mtime_ns for mtime_ns, _ in stats.values()), default=0)
+    if time.time_ns() - newest_mtime_ns > _RACY_WINDOW_NS:
+        _REQUIREMENT_CACHE[cache_key] = (fingerprint, requirement)
+    return requirement
+
+
+def _stat_requirement_files(project_path: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Find and stat the files that can declare the project's Python version.
+
+    Args:
+        project_path: Absolute path to the project directory
+
+    Returns:
+        Dictionary mapping each REQUIREMENT_FILES name that exists to its
+        (mtime_ns, size)
+    """
+
+    stats = {}
+    try:
+        with os.scandir(project_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if _CASE_INSENSITIVE_FS:
+                    name = _REQUIREMENT_FILES_BY_FOLD.get(name.casefold(), name)
+                if name not in REQUIREMENT_FILES:
+                    continue
+                try:
+                    # Follows symlinks, like Path.exists(); a dangling
+                    # link counts as missing
+                    st = entry.stat()
+                except OSError:
+                    continue
+                stats[name] = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        pass
+
+    return stats
+
+
+def _find_project_python_requirement(
+    project: Path, present: Set[str]
+) -> Optional[str]:
     """
+    Read the project's Python version requirement from its files.
 
-    project = Path(project_path)
+    Args:
+        project: Project directory
+        present: Names of the REQUIREMENT_FILES that exist in it
+
+    Returns:
+        Required Python version string if found, None otherwise
+    """
 
     # Check .python-version (pyenv format)
-    python_version_file = project / ".python-version"
-    if python_version_file.exists():
+    if ".python-version" in present:
+        python_version_file = project / ".python-version"
         try:
             version = python_version_file.read_text().strip()
             if version:
@@ -115,8 +230,8 @@ def get_project_python_requirement(project_path: str = ".") -> Optional[str]:
             pass
 
     # Check runtime.txt (Heroku and other platforms)
-    runtime_file = project / "runtime.txt"
-    if runtime_file.exists():
+    if "runtime.txt" in present:
+        runtime_file = project / "runtime.txt"
         try:
             content = runtime_file.read_text().strip()
             # Format: "python-3.10.6"
@@ -126,30 +241,32 @@ def get_project_python_requirement(project_path: str = ".") -> Optional[str]:
             pass
 
     # Check pyproject.toml
-    pyproject_file = project / "pyproject.toml"
-    if pyproject_file.exists():
+    if "pyproject.toml" in present:
+        pyproject_file = project / "pyproject.toml"
         version = _parse_python_version_from_pyproject(pyproject_file)
         if version:
             return version
 
     # Check setup.py
-    setup_file = project / "setup.py"
-    if setup_file.exists():
+    if "setup.py" in present:
+        setup_file = project / "setup.py"
         version = _parse_python_version_from_setup(setup_file)
         if version:
             return version
 
     # Check .tool-versions (asdf)
-    tool_versions_file = project / ".tool-versions"
-    if tool_versions_file.exists():
+    if ".tool-versions" in present:
+        tool_versions_file = project / ".tool-versions"
         try:
-            content = tool_versions_file.read_text()
-            for line in content.splitlines():
-                if line.strip().startswith("python"):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        return parts[1]
-        except (OSError, PermissionError):
+            # Iterate the file lazily and stop at the python line, rather
+            # than reading it whole and splitting it into a list first
+            with open(tool_versions_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip().startswith("python"):
+                        parts = line.split()
+                        if len(parts) >= 2:
+                            return parts[1]
+        except (OSError, UnicodeDecodeError):
             pass
 
     return None
@@ -166,62 +283,86 @@ def _parse_python_version_from_pyproject(pyproject_path: Path) -> Optional[str]:
         Python version requirement string or None
 
     EDUCATIONAL NOTE - TOML Parsing:
-    We use simple string parsing here to avoid adding toml/tomli dependency.
-    In production code, you might use:
-    - tomli (Python < 3.11)
-    - tomllib (Python 3.11+, standard library)
-
-    This simplified parser looks for patterns like:
+    The file is read with tomllib (Python 3.11+) or tomli when available,
+    and the version taken from the two places it can be declared:
+    - [project] requires-python = ">=3.10" (PEP 621)
+    - [tool.poetry.dependencies] python = "^3.10" (Poetry)
+
+    A parser knows which table each key belongs to, so a `python = ...`
+    somewhere else in the file isn't mistaken for the requirement. Without
+    a TOML parser, a simple regex looks for patterns like:
     - python = "^3.10"
     - python = ">=3.10,<4.0"
     - requires-python = ">=3.10"
     """
 
     try:
-        content = pyproject_path.read_text()
-
-        # Look for common patterns
-        for line in content.splitlines():
-            line = line.strip()
-
-            # Poetry format: python = "^3.10" or python = ">=3.10"
-            if line.startswith("python") and "=" in line:
-                # Extract version from quotes
-                if '"' in line:
-                    version_part = line.split('"')[1]
-                elif "'" in line:
-                    version_part = line.split("'")[1]
-                else:
-                    continue
+        with open(pyproject_path, "r", encoding="utf-8") as f:
+            content = f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
 
-                # Clean up common version specifiers
-                version_part = (
-                    version_part.replace("^", "")
-                    .replace("~", "")
-                    .replace(">=", "")
-                    .split(",")[0]
-                    .strip()
-                )
-
-                if version_part and version_part[0].isdigit():
-                    return version_part
-
-            # PEP 621 format: requires-python = ">=3.10"
-            if "requires-python" in line and "=" in line:
-                if '"' in line:
-                    version_part = line.split('"')[1]
-                elif "'" in line:
-                    version_part = line.split("'")[1]
-                else:
-                    continue
+    data = load_toml(content)
+    if data is not None:
+        return _pyproject_python_version(data)
 
-                version_part = version_part.replace(">=", "").split(",")[0].strip()
+    # One regex pass over the whole file instead of a Python loop per line
+    for match in _PYPROJECT_PYTHON.finditer(content):
+        version_part = _minimum_version(match.group(1))
+        if version_part:
+            return version_part
 
-                if version_part and version_part[0].isdigit():
-                    return version_part
+    return None
 
-    except (OSError, PermissionError):
-        pass
+
+def _pyproject_python_version(data: Dict[str, any]) -> Optional[str]:
+    """
+    Find the Python version requirement in a parsed pyproject.toml.
+
+    Args:
+        data: Parsed pyproject.toml document
+
+    Returns:
+        Python version requirement string or None
+    """
+
+    project = data.get("project")
+    if isinstance(project, dict):
+        requires_python = project.get("requires-python")
+        version = (
+            _minimum_version(requires_python)
+            if isinstance(requires_python, str)
+            else None
+        )
+        if version:
+            return version
+
+    tool = data.get("tool")
+    poetry = tool.get("poetry") if isinstance(tool, dict) else None
+    dependencies = poetry.get("dependencies") if isinstance(poetry, dict) else None
+    if isinstance(dependencies, dict):
+        python = dependencies.get("python")
+        if isinstance(python, str):
+            return _minimum_version(python)
+
+    return None
+
+
+def _minimum_version(specifier: str) -> Optional[str]:
+    """
+    Reduce a version specifier to the lowest version it allows.
+
+    Args:
+        specifier: Version specifier such as "^3.10" or ">=3.9,<4.0"
+
+    Returns:
+        The version ("3.10", "3.9"), or None if it doesn't start with one
+    """
+
+    version_part = _VERSION_SPEC_PREFIX.sub("", specifier).split(",")[0].strip()
+
+    if version_part and version_part[0].isdigit():
+        return version_part
 
     return None
 
@@ -244,34 +385,20 @@ def _parse_python_version_from_setup(setup_path: Path) -> Optional[str]:
             ...
         )
 
-    We parse this with simple string matching to avoid executing setup.py
+    We find it with a regex over the file text to avoid executing setup.py
     (which could be a security risk).
     """
 
     try:
-        content = setup_path.read_text()
-
-        # Look for python_requires parameter
-        for line in content.splitlines():
-            line = line.strip()
-
-            if "python_requires" in line and "=" in line:
-                # Extract version from quotes
-                if '"' in line:
-                    version_part = line.split('"')[1]
-                elif "'" in line:
-                    version_part = line.split("'")[1]
-                else:
-                    continue
-
-                # Clean up version specifier
-                version_part = version_part.replace(">=", "").split(",")[0].strip()
-
-                if version_part and version_part[0].isdigit():
-                    return version_part
-
-    except (OSError, PermissionError):
-        pass
+        with open(setup_path, "r", encoding="utf-8") as f:
+            content = f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    for match in _SETUP_PY_PYTHON.finditer(content):
+        version_part = _minimum_version(match.group(1))
+        if version_part:
+            return version_part
 
     return None
 
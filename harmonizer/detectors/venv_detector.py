@@ -22,6 +22,7 @@ Common Virtual Environment Types:
 import sys
 import os
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
@@ -123,6 +124,53 @@ def detect_venv_type() -> Dict[str, any]:
     return {"type": VenvType.NONE, "active": False, "path": None, "name": None}
 
 
+# Environment variables that detect_venv_type() reads. Together with the
+# working directory they decide its result, so they form the cache key.
+VENV_ENV_VARS = (
+    "VIRTUAL_ENV",
+    "CONDA_DEFAULT_ENV",
+    "CONDA_PREFIX",
+    "PIPX_HOME",
+    "PIPX_BIN_DIR",
+    "POETRY_ACTIVE",
+    "PIPENV_ACTIVE",
+)
+
+
+@lru_cache(maxsize=1)
+def _detect_venv_cached(cwd_resolved: str, env_values: Tuple) -> Dict[str, any]:
+    """
+    Run detect_venv_type() once per (working directory, environment) pair.
+
+    Args:
+        cwd_resolved: Resolved current working directory (cache key only)
+        env_values: Values of VENV_ENV_VARS (cache key only)
+
+    Returns:
+        The detect_venv_type() result for that key
+    """
+    return detect_venv_type()
+
+
+def detect_venv_type_cached() -> Dict[str, any]:
+    """
+    Memoized variant of detect_venv_type() for repeated scans in one process.
+
+    Returns:
+        A fresh copy of the detect_venv_type() dictionary
+
+    EDUCATIONAL NOTE - Choosing a Cache Key:
+    A cache is only safe if its key covers everything the result depends
+    on. Venv detection looks at the working directory and a handful of
+    activation variables, so those are the key: activating another
+    environment or changing directory gives a cache miss, while repeated
+    scans of the same shell state reuse the first answer. A copy is
+    returned so callers can't modify the cached dictionary.
+    """
+    env_values = tuple(os.environ.get(name) for name in VENV_ENV_VARS)
+    return dict(_detect_venv_cached(str(Path.cwd().resolve()), env_values))
+
+
 def _detect_conda() -> Dict[str, any]:
     """
     Detect Conda virtual environment.
@@ -120,6 +120,14 @@ class DependencyFixer(BaseFixer):
             result = self._install_missing_packages(dry_run)
             results.append(result)
 
+        # Anything installed makes the detector's cached package list stale
+        if not dry_run and results:
+            from harmonizer.detectors.dependency_detector import (
+                invalidate_installed_cache,
+            )
+
+            invalidate_installed_cache()
+
         return results
 
     def _install_from_requirements_file(self, dry_run: bool = False) -> FixResult:
@@ -295,6 +295,20 @@ class EnvironmentStatus:
         """
         return [issue for issue in self.issues if issue.fixable]
 
+    def fixable_count(self) -> int:
+        """
+        Count the issues that can be automatically fixed.
+
+        Returns:
+            Number of fixable issues
+
+        Use this instead of len(get_fixable_issues()) when only the number
+        is needed; it counts with a generator and never builds the list.
+        It is a method rather than a cached attribute because issues can
+        still be added after it is first read.
+        """
+        return sum(1 for issue in self.issues if issue.fixable)
+
     def issue_summary(self) -> Dict[str, int]:
         """
         Get a summary count of issues by severity.
@@ -15,10 +15,26 @@ Text reports are for humans, so we prioritize readability over precision.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional, TextIO
 from harmonizer.models import EnvironmentStatus, IssueSeverity
 
 
+# Icon shown next to each issue in the fixable-issues summary
+SEVERITY_ICONS = {
+    IssueSeverity.ERROR: "✗",
+    IssueSeverity.WARNING: "⚠",
+    IssueSeverity.INFO: "ℹ",
+}
+
+# Fixed report title and section headings
+REPORT_TITLE = "ENVIRONMENT HARMONIZER - Diagnostic Report"
+SECTION_OS = "[OS ENVIRONMENT]"
+SECTION_PYTHON = "[PYTHON ENVIRONMENT]"
+SECTION_VENV = "[VIRTUAL ENVIRONMENT]"
+SECTION_DEPENDENCIES = "[DEPENDENCIES]"
+SECTION_CONFIG = "[CONFIGURATION FILES]"
+
+
 class TextReporter:
     """
     Generate human-readable text reports from EnvironmentStatus.
@@ -66,6 +82,28 @@ class TextReporter:
             "cyan": "\033[96m" if use_color else "",
         }
 
+        # EDUCATIONAL NOTE - Precomputing Fixed Strings:
+        # The separators and headings only depend on the width and color
+        # settings, so they are built once here rather than on every report.
+        self._rule = "=" * width
+        self._thin_rule = "-" * width
+        self._header = (
+            self._rule,
+            self._colorize(REPORT_TITLE, "bold"),
+            self._rule,
+            "",
+        )
+        self._headings = {
+            title: self._colorize(title, "bold")
+            for title in (
+                SECTION_OS,
+                SECTION_PYTHON,
+                SECTION_VENV,
+                SECTION_DEPENDENCIES,
+                SECTION_CONFIG,
+            )
+        }
+
     def generate(self, env_status: EnvironmentStatus) -> str:
         """
         Generate a complete text report from EnvironmentStatus.
@@ -77,62 +115,97 @@ class TextReporter:
             Formatted text report as a string
 
         EDUCATIONAL NOTE - String Building:
-        We build the report by accumulating lines in a list and joining
-        them at the end. This is more efficient than string concatenation:
+        Lines are produced by _iter_lines() and joined once at the end.
+        This is more efficient than string concatenation:
 
         SLOW:  report = report + line + "\\n"  # Creates new string each time
-        FAST:  lines.append(line)              # Appends to list
-               return "\\n".join(lines)        # Join once at end
+        FAST:  "\\n".join(lines)                # Join once at end
+
+        When the report is only going to be printed, write() avoids
+        building the joined string at all.
         """
 
-        lines = []
+        return "\n".join(self._iter_lines(env_status))
+
+    def write(self, env_status: EnvironmentStatus, stream: TextIO) -> None:
+        """
+        Write a text report directly to a file-like object.
+
+        Args:
+            env_status: Environment status data to report on
+            stream: Writable text stream (open file, sys.stdout, ...)
+
+        EDUCATIONAL NOTE - Write Granularity:
+        Writing line by line means around a hundred write() calls, and a
+        terminal's line-buffered stdout flushes after every one of them.
+        Writing one whole section per call cuts that to about ten system
+        calls, while the full report still never has to exist as a single
+        string in memory.
+        """
+
+        write = stream.write
+        for chunk in self.iter_chunks(env_status):
+            write(chunk)
+
+    def iter_chunks(self, env_status: EnvironmentStatus) -> Iterator[str]:
+        """
+        Yield the report one section at a time, ready to be written.
+
+        Args:
+            env_status: Environment status data to report on
+
+        Returns:
+            Iterator of newline-terminated text chunks; concatenated they
+            are the same text write() produces
+        """
+
+        for section in self._iter_sections(env_status):
+            if section:
+                yield "\n".join(section) + "\n"
+
+    def _iter_lines(self, env_status: EnvironmentStatus) -> Iterator[str]:
+        """Yield every line of the report, section by section."""
+
+        for section in self._iter_sections(env_status):
+            yield from section
+
+    def _iter_sections(self, env_status: EnvironmentStatus) -> Iterator[list]:
+        """Yield the lines of each report section as a list."""
 
         # Header
-        lines.extend(self._generate_header())
+        yield self._generate_header()
 
         # Project information
-        lines.extend(self._generate_project_info(env_status))
+        yield self._generate_project_info(env_status)
 
         # OS Environment section
-        lines.extend(self._generate_os_section(env_status))
+        yield self._generate_os_section(env_status)
 
         # Python Environment section
-        lines.extend(self._generate_python_section(env_status))
+        yield self._generate_python_section(env_status)
 
         # Virtual Environment section
-        lines.extend(self._generate_venv_section(env_status))
+        yield self._generate_venv_section(env_status)
 
         # Dependencies section
-        lines.extend(self._generate_dependencies_section(env_status))
+        yield self._generate_dependencies_section(env_status)
 
         # Configuration Files section
-        lines.extend(self._generate_config_section(env_status))
+        yield self._generate_config_section(env_status)
 
         # Issues section
-        lines.extend(self._generate_issues_section(env_status))
+        yield self._generate_issues_section(env_status)
 
         # Fixable Issues Highlight section
-        lines.extend(self._generate_fixable_summary(env_status))
+        yield self._generate_fixable_summary(env_status)
 
         # Footer with summary
-        lines.extend(self._generate_footer(env_status))
-
-        return "\n".join(lines)
+        yield self._generate_footer(env_status)
 
     def _generate_header(self) -> list:
         """Generate report header."""
 
-        lines = []
-        separator = "=" * self.width
-
-        lines.append(separator)
-        lines.append(
-            self._colorize("ENVIRONMENT HARMONIZER - Diagnostic Report", "bold")
-        )
-        lines.append(separator)
-        lines.append("")
-
-        return lines
+        return list(self._header)
 
     def _generate_project_info(self, env_status: EnvironmentStatus) -> list:
         """Generate project information section."""
@@ -150,7 +223,7 @@ class TextReporter:
 
         lines = []
 
-        lines.append(self._colorize("[OS ENVIRONMENT]", "bold"))
+        lines.append(self._headings[SECTION_OS])
         lines.append(f"  Type: {env_status.os_type.value}")
         lines.append(f"  Version: {env_status.os_version}")
         lines.append("")
@@ -162,7 +235,7 @@ class TextReporter:
 
         lines = []
 
-        lines.append(self._colorize("[PYTHON ENVIRONMENT]", "bold"))
+        lines.append(self._headings[SECTION_PYTHON])
         lines.append(f"  Version: {env_status.python_version}")
         lines.append(f"  Executable: {env_status.python_executable}")
         lines.append("")
@@ -174,7 +247,7 @@ class TextReporter:
 
         lines = []
 
-        lines.append(self._colorize("[VIRTUAL ENVIRONMENT]", "bold"))
+        lines.append(self._headings[SECTION_VENV])
         lines.append(f"  Type: {env_status.venv_type.value}")
 
         # Color code active status
@@ -197,7 +270,7 @@ class TextReporter:
 
         lines = []
 
-        lines.append(self._colorize("[DEPENDENCIES]", "bold"))
+        lines.append(self._headings[SECTION_DEPENDENCIES])
 
         if env_status.requirements_file:
             lines.append(f"  Requirements File: {env_status.requirements_file}")
@@ -230,7 +303,7 @@ class TextReporter:
 
         lines = []
 
-        lines.append(self._colorize("[CONFIGURATION FILES]", "bold"))
+        lines.append(self._headings[SECTION_CONFIG])
 
         if env_status.config_files:
             lines.append(f"  Found: {len(env_status.config_files)} files")
@@ -339,10 +412,7 @@ class TextReporter:
         if not fixable_issues:
             return []
 
-        lines = []
-        separator = "-" * self.width
-
-        lines.append(separator)
+        lines = [self._thin_rule]
         lines.append(
             self._colorize(
                 f"[FIXABLE ISSUES] - {len(fixable_issues)} issue(s) can be automatically fixed",
@@ -368,11 +438,7 @@ class TextReporter:
 
             for issue in issues:
                 # Show the issue message
-                severity_icon = {
-                    IssueSeverity.ERROR: "✗",
-                    IssueSeverity.WARNING: "⚠",
-                    IssueSeverity.INFO: "ℹ",
-                }.get(issue.severity, "•")
+                severity_icon = SEVERITY_ICONS.get(issue.severity, "•")
 
                 lines.append(f"      {severity_icon} {issue.message}")
 
@@ -402,10 +468,7 @@ class TextReporter:
     def _generate_footer(self, env_status: EnvironmentStatus) -> list:
         """Generate report footer with summary."""
 
-        lines = []
-        separator = "=" * self.width
-
-        lines.append(separator)
+        lines = [self._rule]
 
         if env_status.issues:
             summary = env_status.issue_summary()
@@ -435,7 +498,7 @@ class TextReporter:
             lines.append(f"Summary: {', '.join(summary_parts)}")
 
             # Show fixable issues count
-            fixable = len(env_status.get_fixable_issues())
+            fixable = env_status.fixable_count()
             if fixable > 0:
                 lines.append(
                     self._colorize(
@@ -449,7 +512,7 @@ class TextReporter:
                 )
             )
 
-        lines.append(separator)
+        lines.append(self._rule)
 
         return lines
 
@@ -15,22 +15,25 @@ This is a common design pattern in software architecture,
 separating concerns and making the system more maintainable.
 """
 
+import stat
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import AbstractSet, Dict, Optional, Union
 
 from harmonizer.models import EnvironmentStatus, OSType, VenvType, IssueSeverity
-from harmonizer.detectors.os_detector import detect_os_type, get_os_version
+from harmonizer.detectors.os_detector import get_system_info_cached
 from harmonizer.detectors.python_detector import (
     detect_python_version,
     get_project_python_requirement,
     check_version_compatibility,
 )
-from harmonizer.detectors.venv_detector import detect_venv_type
+from harmonizer.detectors.venv_detector import detect_venv_type_cached
 from harmonizer.detectors.dependency_detector import scan_dependencies
 from harmonizer.detectors.config_detector import (
     detect_config_files,
     detect_config_issues,
+    snapshot_project,
 )
 from harmonizer.detectors.quirks_detector import detect_platform_quirks
 from harmonizer.utils.progress import ProgressReporter
@@ -38,6 +41,11 @@ from harmonizer.utils.logging_config import HarmonizerLogger
 from harmonizer.utils.performance import get_global_monitor
 
 
+# The order checks always run in. Later checks may read what earlier ones
+# stored on the EnvironmentStatus (quirks detection uses the OS type).
+SCAN_ORDER = ("os", "python", "venv", "dependencies", "config", "quirks")
+
+
 class ProjectScanner:
     """
     Main project scanner that orchestrates all detection modules.
@@ -63,7 +71,11 @@ class ProjectScanner:
     """
 
     def __init__(
-        self, project_path: str = ".", verbose: bool = False, use_color: bool = True
+        self,
+        project_path: Union[str, Path] = ".",
+        verbose: bool = False,
+        use_color: bool = True,
+        validated: bool = False,
     ):
         """
         Initialize the project scanner.
@@ -72,23 +84,35 @@ class ProjectScanner:
             project_path: Path to project directory (default: current directory)
             verbose: Enable verbose output during scanning
             use_color: Enable colored output (default: True)
+            validated: Set when project_path is already resolved (absolute,
+                       symlinks followed) and the caller has checked it is
+                       a directory, as the CLI does in validate_arguments.
+                       Skips the second resolve() and stat().
 
         Raises:
             ValueError: If project_path doesn't exist or isn't a directory
         """
 
-        self.project_path = Path(project_path).resolve()
         self.verbose = verbose
         self.progress = ProgressReporter(use_color=use_color, verbose=verbose)
         self.logger = HarmonizerLogger.get_logger(__name__)
         self.perf_monitor = get_global_monitor()
 
-        # Validate project path
-        if not self.project_path.exists():
+        if validated:
+            self.project_path = Path(project_path)
+            self.logger.info(f"ProjectScanner initialized for: {self.project_path}")
+            return
+
+        self.project_path = Path(project_path).resolve()
+
+        # Validate project path with a single stat() call
+        try:
+            is_dir = stat.S_ISDIR(self.project_path.stat().st_mode)
+        except (FileNotFoundError, NotADirectoryError):
             self.logger.error(f"Project path does not exist: {project_path}")
             raise ValueError(f"Project path does not exist: {project_path}")
 
-        if not self.project_path.is_dir():
+        if not is_dir:
             self.logger.error(f"Project path is not a directory: {project_path}")
             raise ValueError(f"Project path is not a directory: {project_path}")
 
@@ -113,23 +137,33 @@ class ProjectScanner:
         - Easier testing (test each module independently)
         - Better performance (skip expensive checks if not needed)
         - Clear separation of concerns
+
+        The order of `checks` only selects what runs; the checks themselves
+        always run in SCAN_ORDER so that each one sees the results it
+        depends on.
         """
 
         if checks is None:
-            checks = ["os", "python", "venv", "dependencies", "config", "quirks"]
+            checks = SCAN_ORDER
+
+        # One conversion up front makes every membership test below O(1)
+        checks = frozenset(checks)
 
         # Initialize environment status with default values
         env_status = self._initialize_environment_status()
 
+        # Gather the independent environment probes concurrently
+        detected = self._run_detectors_concurrently(checks)
+
         # Run detection modules in logical order
         if "os" in checks:
-            self._scan_os(env_status)
+            self._scan_os(env_status, detected.get("os"))
 
         if "python" in checks:
-            self._scan_python(env_status)
+            self._scan_python(env_status, detected.get("python"))
 
         if "venv" in checks:
-            self._scan_venv(env_status)
+            self._scan_venv(env_status, detected.get("venv"))
 
         if "dependencies" in checks:
             self._scan_dependencies(env_status)
@@ -142,6 +176,46 @@ class ProjectScanner:
 
         return env_status
 
+    def _run_detectors_concurrently(
+        self, checks: AbstractSet[str]
+    ) -> Dict[str, Future]:
+        """
+        Run the OS, Python and virtual environment detectors in parallel.
+
+        Args:
+            checks: Names of the checks requested for this scan
+
+        Returns:
+            Dictionary mapping check name to a finished Future holding the
+            raw detector result. Empty when fewer than two of these checks
+            were requested.
+
+        EDUCATIONAL NOTE - Threads for I/O-Bound Work:
+        These detectors mostly wait on the operating system (reading
+        /proc files, probing directories, running small commands). The
+        GIL is released while a thread waits on a system call, so running
+        them in threads overlaps that waiting and the scan takes roughly
+        as long as the slowest detector instead of the sum of all three.
+        Progress output and issue creation still happen afterwards, in
+        the usual order, on the main thread. A detector's exception stays
+        in its Future until the matching _scan_* method calls result(), so
+        it is logged and timed just as in a sequential scan.
+        """
+
+        detectors = {
+            "os": get_system_info_cached,
+            "python": detect_python_version,
+            "venv": detect_venv_type_cached,
+        }
+        selected = {name: func for name, func in detectors.items() if name in checks}
+
+        if len(selected) < 2:
+            return {}
+
+        # Leaving the with block waits for every detector to finish
+        with ThreadPoolExecutor(max_workers=len(selected)) as executor:
+            return {name: executor.submit(func) for name, func in selected.items()}
+
     def _initialize_environment_status(self) -> EnvironmentStatus:
         """
         Initialize EnvironmentStatus with required fields.
@@ -160,10 +234,16 @@ class ProjectScanner:
             project_path=str(self.project_path),
         )
 
-    def _scan_os(self, env_status: EnvironmentStatus) -> None:
+    def _scan_os(
+        self, env_status: EnvironmentStatus, detected: Optional[Future] = None
+    ) -> None:
         """
         Scan operating system information.
 
+        Args:
+            env_status: Environment status to update
+            detected: Optional Future of a concurrent get_system_info_cached()
+
         Updates env_status with:
         - os_type
         - os_version
@@ -174,8 +254,11 @@ class ProjectScanner:
         self.logger.debug("Starting OS detection")
 
         try:
-            env_status.os_type = detect_os_type()
-            env_status.os_version = get_os_version()
+            if detected is None:
+                os_info = get_system_info_cached()
+            else:
+                os_info = detected.result()
+            env_status.os_type, env_status.os_version = os_info
 
             self.logger.info(
                 f"Detected OS: {env_status.os_type.value} - {env_status.os_version}"
@@ -183,8 +266,8 @@ class ProjectScanner:
             self.progress.complete_step(
                 f"OS: {env_status.os_type.value} ({env_status.os_version})"
             )
-            self.progress.verbose(f"OS Type: {env_status.os_type.value}")
-            self.progress.verbose(f"OS Version: {env_status.os_version}")
+            self.progress.verbose("OS Type: %s", env_status.os_type.value)
+            self.progress.verbose("OS Version: %s", env_status.os_version)
 
         except Exception as e:
             self.logger.error(f"Error during OS detection: {e}", exc_info=True)
@@ -197,10 +280,16 @@ class ProjectScanner:
                 else "OS detection timer not found"
             )
 
-    def _scan_python(self, env_status: EnvironmentStatus) -> None:
+    def _scan_python(
+        self, env_status: EnvironmentStatus, detected: Optional[Future] = None
+    ) -> None:
         """
         Scan Python environment information.
 
+        Args:
+            env_status: Environment status to update
+            detected: Optional Future of a concurrent detect_python_version()
+
         Updates env_status with:
         - python_version
         - python_executable
@@ -209,18 +298,21 @@ class ProjectScanner:
 
         self.progress.start_step("Detecting Python version")
 
-        py_info = detect_python_version()
+        if detected is None:
+            py_info = detect_python_version()
+        else:
+            py_info = detected.result()
         env_status.python_version = py_info["version"]
         env_status.python_executable = py_info["executable"]
 
         self.progress.complete_step(f"Python {env_status.python_version} detected")
-        self.progress.verbose(f"Python Version: {env_status.python_version}")
-        self.progress.verbose(f"Python Executable: {env_status.python_executable}")
+        self.progress.verbose("Python Version: %s", env_status.python_version)
+        self.progress.verbose("Python Executable: %s", env_status.python_executable)
 
         # Check for Python version compatibility
         required_version = get_project_python_requirement(str(self.project_path))
         if required_version:
-            self.progress.verbose(f"Project requires Python {required_version}")
+            self.progress.verbose("Project requires Python %s", required_version)
 
             compatible, issue = check_version_compatibility(
                 env_status.python_version, required_version
@@ -232,10 +324,16 @@ class ProjectScanner:
                     f"Python version mismatch: current {env_status.python_version}, required {required_version}"
                 )
 
-    def _scan_venv(self, env_status: EnvironmentStatus) -> None:
+    def _scan_venv(
+        self, env_status: EnvironmentStatus, detected: Optional[Future] = None
+    ) -> None:
         """
         Scan virtual environment information.
 
+        Args:
+            env_status: Environment status to update
+            detected: Optional Future of a concurrent detect_venv_type_cached()
+
         Updates env_status with:
         - venv_type
         - venv_active
@@ -245,7 +343,10 @@ class ProjectScanner:
 
         self.progress.start_step("Detecting virtual environment")
 
-        venv_info = detect_venv_type()
+        if detected is None:
+            venv_info = detect_venv_type_cached()
+        else:
+            venv_info = detected.result()
         env_status.venv_type = venv_info["type"]
         env_status.venv_active = venv_info["active"]
 
@@ -256,10 +357,10 @@ class ProjectScanner:
         self.progress.complete_step(
             f"Virtual Env: {env_status.venv_type.value} ({status_str})"
         )
-        self.progress.verbose(f"Venv Type: {env_status.venv_type.value}")
-        self.progress.verbose(f"Venv Active: {env_status.venv_active}")
+        self.progress.verbose("Venv Type: %s", env_status.venv_type.value)
+        self.progress.verbose("Venv Active: %s", env_status.venv_active)
         if env_status.venv_path:
-            self.progress.verbose(f"Venv Path: {env_status.venv_path}")
+            self.progress.verbose("Venv Path: %s", env_status.venv_path)
 
         # Check if virtual environment should be active but isn't
         if env_status.venv_type != VenvType.NONE and not env_status.venv_active:
@@ -268,7 +369,7 @@ class ProjectScanner:
                 "venv",
                 f"Virtual environment detected ({env_status.venv_type.value}) but not active",
                 fixable=True,
-                fix_command=f"Activate virtual environment at {venv_info.get('path', 'unknown')}",
+                fix_command=f"Activate virtual environment at {env_status.venv_path or 'unknown'}",
             )
             self.progress.warning(f"Virtual environment is not active")
 
@@ -283,8 +384,7 @@ class ProjectScanner:
         - Issues related to missing dependencies
         """
 
-        if self.verbose:
-            print("Scanning dependencies...")
+        self.progress.verbose("Scanning dependencies...")
 
         dep_results = scan_dependencies(str(self.project_path))
 
@@ -292,14 +392,19 @@ class ProjectScanner:
         env_status.installed_packages = dep_results["installed_packages"]
         env_status.missing_packages = dep_results["missing_packages"]
 
-        if self.verbose:
-            if env_status.requirements_file:
-                print(f"  Requirements file: {env_status.requirements_file}")
-                print(f"  Required packages: {len(dep_results['required_packages'])}")
-                print(f"  Installed packages: {len(env_status.installed_packages)}")
-                print(f"  Missing packages: {len(env_status.missing_packages)}")
-            else:
-                print(f"  No requirements file found")
+        if env_status.requirements_file:
+            self.progress.verbose("Requirements file: %s", env_status.requirements_file)
+            self.progress.verbose(
+                "Required packages: %d", len(dep_results["required_packages"])
+            )
+            self.progress.verbose(
+                "Installed packages: %d", len(env_status.installed_packages)
+            )
+            self.progress.verbose(
+                "Missing packages: %d", len(env_status.missing_packages)
+            )
+        else:
+            self.progress.verbose("No requirements file found")
 
         # Add issues for missing packages
         if env_status.missing_packages:
@@ -316,10 +421,9 @@ class ProjectScanner:
                 ),
             )
 
-            if self.verbose:
-                print(
-                    f"  ✗ Missing packages: {', '.join(env_status.missing_packages[:5])}"
-                )
+            self.progress.verbose(
+                "Missing packages: %s", ", ".join(env_status.missing_packages[:5])
+            )
 
         elif not env_status.requirements_file:
             # No requirements file found - might be intentional or might be an issue
@@ -339,34 +443,31 @@ class ProjectScanner:
         - Issues related to missing or problematic config files
         """
 
-        if self.verbose:
-            print("Scanning configuration files...")
+        self.progress.verbose("Scanning configuration files...")
+
+        # Both config checks share one listing of the project directory
+        project_path = str(self.project_path)
+        snapshot = snapshot_project(project_path)
 
-        config_results = detect_config_files(str(self.project_path))
+        config_results = detect_config_files(project_path, snapshot)
         env_status.config_files = config_results["found"]
 
-        if self.verbose:
-            print(f"  Found {len(env_status.config_files)} config files")
+        self.progress.verbose("Found %d config files", len(env_status.config_files))
 
         # Add issues from config detection
-        config_issues = detect_config_issues(str(self.project_path))
+        config_issues = detect_config_issues(project_path, snapshot)
 
         for issue_dict in config_issues:
-            severity_map = {
-                "error": IssueSeverity.ERROR,
-                "warning": IssueSeverity.WARNING,
-                "info": IssueSeverity.INFO,
-            }
-
             env_status.add_issue(
-                severity_map[issue_dict["severity"]],
+                IssueSeverity(issue_dict["severity"]),
                 issue_dict["category"],
                 issue_dict["message"],
                 fixable=False,
             )
 
-            if self.verbose:
-                print(f"  [{issue_dict['severity'].upper()}] {issue_dict['message']}")
+            self.progress.verbose(
+                "[%s] %s", issue_dict["severity"].upper(), issue_dict["message"]
+            )
 
         # Warn about missing required files
         if config_results["missing_required"]:
@@ -385,8 +486,7 @@ class ProjectScanner:
         - Issues related to platform-specific quirks (WSL, Windows, etc.)
         """
 
-        if self.verbose:
-            print("Detecting platform-specific quirks...")
+        self.progress.verbose("Detecting platform-specific quirks...")
 
         quirk_issues = detect_platform_quirks(
             str(self.project_path), env_status.os_type
@@ -395,8 +495,10 @@ class ProjectScanner:
         # Add quirk issues to environment status
         env_status.issues.extend(quirk_issues)
 
-        if self.verbose and quirk_issues:
-            print(f"  Found {len(quirk_issues)} platform-specific issues")
+        if quirk_issues:
+            self.progress.verbose(
+                "Found %d platform-specific issues", len(quirk_issues)
+            )
 
 
 # Convenience function for quick scanning
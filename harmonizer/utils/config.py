@@ -19,13 +19,23 @@ Alternative formats considered:
 - Python files: Security risk (code execution)
 """
 
+import copy
 import json
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 
 DEFAULT_CONFIG_FILENAME = ".harmonizer.json"
 
+# Parsed configuration files, keyed by resolved path. Each entry keeps the
+# (st_mtime_ns, st_size) it was parsed from so edits are picked up.
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+# Files modified more recently than this are not cached (the same "racy"
+# window the detectors use for their file caches)
+_RACY_WINDOW_NS = 2_000_000_000
+
 
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -57,6 +67,15 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     - json.loads(string): Parses JSON string
 
     We use json.load() here for efficiency (doesn't load entire file to string).
+
+    EDUCATIONAL NOTE - Caching on File Metadata:
+    Parsed files are cached in memory, keyed by their modification time
+    and size. A repeat load costs a single stat() call. Editing the file
+    changes its metadata, which forces a fresh parse. Files edited within
+    the last couple of seconds aren't cached, because a second edit in the
+    same clock tick could keep the same modification time and size.
+    Callers get a deep copy, so changing the returned dictionary (or any
+    list or dictionary nested inside it) never changes the cache.
     """
 
     if config_path is None:
@@ -64,13 +83,20 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
 
     config_file = Path(config_path)
 
-    if not config_file.exists():
+    try:
+        file_stat = config_file.stat()
+    except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
+    cache_key = str(config_file.resolve())
+    signature = (file_stat.st_mtime_ns, file_stat.st_size)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return copy.deepcopy(cached[1])
+
     try:
         with open(config_file, "r", encoding="utf-8") as f:
             config = json.load(f)
-            return config
     except json.JSONDecodeError as e:
         raise json.JSONDecodeError(
             f"Invalid JSON in configuration file {config_path}: {e.msg}",
@@ -78,6 +104,24 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
             e.pos,
         )
 
+    if (
+        isinstance(config, dict)
+        and time.time_ns() - file_stat.st_mtime_ns > _RACY_WINDOW_NS
+    ):
+        _CONFIG_CACHE[cache_key] = (signature, copy.deepcopy(config))
+    return config
+
+
+def clear_config_cache() -> None:
+    """
+    Forget every configuration file parsed by load_config().
+
+    Mainly useful in tests, or after editing a file within the same
+    timestamp tick.
+    """
+
+    _CONFIG_CACHE.clear()
+
 
 def save_config(config: Dict[str, Any], config_path: Optional[str] = None) -> None:
     """
@@ -112,6 +156,9 @@ def save_config(config: Dict[str, Any], config_path: Optional[str] = None) -> No
     # Create parent directories if they don't exist
     config_file.parent.mkdir(parents=True, exist_ok=True)
 
+    # The file is about to change, so drop any cached copy of it
+    _CONFIG_CACHE.pop(str(config_file.resolve()), None)
+
     try:
         with open(config_file, "w", encoding="utf-8") as f:
             json.dump(
@@ -23,6 +23,7 @@ Good logging should:
 import logging
 import logging.handlers
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 import os
@@ -148,6 +149,11 @@ class HarmonizerLogger:
             console_handler.setFormatter(console_formatter)
             root_logger.addHandler(console_handler)
 
+        # With no handlers at all, Python's last-resort handler would print
+        # warnings to stderr; a NullHandler keeps logging silent instead
+        if not root_logger.handlers:
+            root_logger.addHandler(logging.NullHandler())
+
         cls._initialized = True
 
         # Log initialization
@@ -227,8 +233,6 @@ class HarmonizerLogger:
         if cls._log_dir is None or not cls._log_dir.exists():
             return 0
 
-        import time
-
         current_time = time.time()
         cutoff_time = current_time - (days * 24 * 60 * 60)  # Convert days to seconds
 
@@ -364,16 +368,12 @@ class LogTimer:
 
     def __enter__(self):
         """Start timing when entering context."""
-        import time
-
         self.start_time = time.perf_counter()
         self.logger.debug(f"{self.operation} started")
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Log elapsed time when exiting context."""
-        import time
-
         elapsed = time.perf_counter() - self.start_time
         self.logger.info(f"{self.operation} completed in {elapsed:.3f}s")
         return False  # Don't suppress exceptions
@@ -412,8 +412,6 @@ if __name__ == "__main__":
     perf_logger = create_performance_logger()
 
     # Test timer context manager
-    import time
-
     with LogTimer("example_operation", main_logger):
         time.sleep(0.1)
 
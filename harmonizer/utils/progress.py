@@ -79,7 +79,9 @@ class ProgressReporter:
             verbose: Whether to show verbose messages
         """
         self.use_color = use_color and self._supports_color()
-        self.verbose = verbose
+        # Stored under a different name than the verbose() method so the
+        # attribute doesn't shadow it
+        self.verbose_enabled = verbose
         self._current_step = None
 
     def _supports_color(self) -> bool:
@@ -223,20 +225,33 @@ class ProgressReporter:
         output = f"{icon} {message}"
         print(self._colorize(output, Color.BLUE))
 
-    def verbose(self, message: str) -> None:
+    def verbose(self, message: str, *args) -> None:
         """
         Display a verbose/debug message (only if verbose mode enabled).
 
         Args:
-            message: Verbose message to display
+            message: Verbose message to display, optionally with %-style
+                     placeholders
+            *args: Values for the placeholders in message
+
+        EDUCATIONAL NOTE - Lazy Formatting:
+        Like the logging module, this accepts the format arguments
+        separately: reporter.verbose("Found %d files", count). The message
+        is only formatted when verbose mode is on, so disabled verbose
+        calls cost almost nothing. An f-string would be built every time,
+        even when the result is thrown away.
 
         Example:
-            >>> reporter.verbose("Checking /proc/version for WSL markers")
+            >>> reporter.verbose("Checking %s for WSL markers", "/proc/version")
               DEBUG: Checking /proc/version for WSL markers
         """
-        if self.verbose:
-            output = f"  DEBUG: {message}"
-            print(self._colorize(output, Color.DIM))
+        if not self.verbose_enabled:
+            return
+
+        if args:
+            message = message % args
+        output = f"  DEBUG: {message}"
+        print(self._colorize(output, Color.DIM))
 
     def section(self, title: str) -> None:
         """
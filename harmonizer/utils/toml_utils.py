@@ -0,0 +1,45 @@
+"""
+TOML Parsing Utilities.
+
+This module gives the detectors one place to parse TOML files such as
+pyproject.toml and Pipfile.
+
+EDUCATIONAL NOTE - An Optional Parser:
+The standard library has only been able to read TOML since Python 3.11
+(tomllib). On older versions the same parser is available from PyPI as
+tomli. Harmonizer has no required dependencies, so when neither is
+available we return None and callers fall back to simpler pattern
+matching instead of failing.
+"""
+
+from typing import Any, Dict, Optional
+
+
+def load_toml(content: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse TOML text with tomllib (or tomli on older Pythons).
+
+    Args:
+        content: TOML document
+
+    Returns:
+        Parsed document, or None if no TOML parser is available or the
+        document isn't valid TOML
+
+    Example:
+        >>> load_toml('[project]\\nrequires-python = ">=3.10"')
+        {'project': {'requires-python': '>=3.10'}}
+    """
+
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        try:
+            import tomli as tomllib
+        except ImportError:
+            return None
+
+    try:
+        return tomllib.loads(content)
+    except tomllib.TOMLDecodeError:
+        return None
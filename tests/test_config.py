@@ -0,0 +1,106 @@
+"""
+Unit tests for configuration loading.
+
+Tests load_config() and its in-memory cache of parsed files.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from harmonizer.utils.config import (
+    clear_config_cache,
+    load_config,
+    load_config_or_default,
+    get_default_config,
+    save_config,
+)
+
+
+class TestLoadConfig(unittest.TestCase):
+    """Test cases for load_config and its cache."""
+
+    def setUp(self):
+        """Create a temporary directory with a config file."""
+        clear_config_cache()
+        self.test_dir = tempfile.mkdtemp()
+        self.config_path = str(Path(self.test_dir) / ".harmonizer.json")
+        save_config({"verbose": True}, self.config_path)
+        self._age_config_file()
+
+    def _age_config_file(self):
+        """Move the file's mtime past the racy window so it can be cached."""
+        old_ns = time.time_ns() - 60_000_000_000
+        os.utime(self.config_path, ns=(old_ns, old_ns))
+
+    def tearDown(self):
+        """Clean up the temporary directory and the cache."""
+        clear_config_cache()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_repeat_load_uses_cache(self):
+        """Test an unchanged file is parsed only once."""
+        self.assertEqual(load_config(self.config_path), {"verbose": True})
+
+        with patch("harmonizer.utils.config.json.load") as mock_load:
+            config = load_config(self.config_path)
+
+        mock_load.assert_not_called()
+        self.assertEqual(config, {"verbose": True})
+
+    def test_returned_config_is_a_copy(self):
+        """Test changing a returned config does not change the cache."""
+        config = load_config(self.config_path)
+        config["verbose"] = False
+
+        self.assertEqual(load_config(self.config_path), {"verbose": True})
+
+    def test_nested_values_are_copied(self):
+        """Test nested values in a returned config are not shared with the cache."""
+        save_config({"checks": {"python": True}}, self.config_path)
+        self._age_config_file()
+
+        config = load_config(self.config_path)
+        config["checks"]["python"] = False
+
+        self.assertEqual(load_config(self.config_path), {"checks": {"python": True}})
+
+    def test_recently_modified_file_not_cached(self):
+        """Test a file edited within the racy window is parsed again."""
+        save_config({"verbose": False}, self.config_path)
+        load_config(self.config_path)
+
+        with patch("harmonizer.utils.config.json.load") as mock_load:
+            mock_load.return_value = {"verbose": False}
+            load_config(self.config_path)
+
+        mock_load.assert_called_once()
+
+    def test_modified_file_is_reparsed(self):
+        """Test a change in mtime/size invalidates the cached entry."""
+        load_config(self.config_path)
+
+        with open(self.config_path, "w", encoding="utf-8") as f:
+            json.dump({"verbose": False, "timeout": 10}, f)
+        os.utime(self.config_path, ns=(0, 0))
+
+        self.assertEqual(
+            load_config(self.config_path), {"verbose": False, "timeout": 10}
+        )
+
+    def test_missing_file_falls_back_to_defaults(self):
+        """Test load_config_or_default with no file on disk."""
+        missing = str(Path(self.test_dir) / "missing.json")
+
+        with self.assertRaises(FileNotFoundError):
+            load_config(missing)
+        self.assertEqual(load_config_or_default(missing), get_default_config())
+
+
+if __name__ == "__main__":
+    unittest.main()
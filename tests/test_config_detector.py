@@ -0,0 +1,280 @@
+"""
+Unit tests for configuration file detection module.
+
+This module tests the config detection functionality including:
+- Config file detection and categorization
+- .gitignore completeness checks
+- .env security checks
+- Configuration issue reporting
+"""
+
+import os
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+from harmonizer.detectors.config_detector import (
+    COMMON_CONFIG_FILES,
+    GITIGNORE_PATTERNS,
+    ProjectSnapshot,
+    check_env_file_in_gitignore,
+    check_gitignore_completeness,
+    detect_config_files,
+    detect_config_issues,
+    get_recommended_config_files,
+    snapshot_project,
+)
+
+
+class TestDetectConfigFiles(unittest.TestCase):
+    """Test cases for config file detection."""
+
+    def setUp(self):
+        """Create a temporary project directory."""
+        self.test_dir = tempfile.mkdtemp()
+        self.project = Path(self.test_dir)
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.test_dir)
+
+    def test_empty_project(self):
+        """Test every known file is reported missing in an empty project."""
+        results = detect_config_files(self.test_dir)
+
+        self.assertEqual(results["found"], [])
+        self.assertEqual(results["total_missing"], len(COMMON_CONFIG_FILES))
+        self.assertEqual(
+            sorted(results["missing_required"]), [".gitignore", "README.md"]
+        )
+
+    def test_found_files_are_categorized(self):
+        """Test present files are found and filed under their category."""
+        (self.project / "README.md").write_text("# Project")
+        (self.project / "requirements.txt").write_text("requests\n")
+        (self.project / "unrelated.txt").write_text("")
+
+        results = detect_config_files(self.test_dir)
+
+        self.assertEqual(results["found"], ["requirements.txt", "README.md"])
+        self.assertEqual(results["missing_required"], [".gitignore"])
+        self.assertEqual(
+            results["by_category"]["dependencies"]["found"], ["requirements.txt"]
+        )
+        self.assertIn("README.md", results["by_category"]["documentation"]["found"])
+
+    def test_github_workflows(self):
+        """Test .github/workflows is only reported when it exists."""
+        (self.project / ".github").mkdir()
+        results = detect_config_files(self.test_dir)
+        self.assertNotIn(".github/workflows", results["found"])
+
+        (self.project / ".github" / "workflows").mkdir()
+        results = detect_config_files(self.test_dir)
+
+        self.assertIn(".github/workflows", results["found"])
+        self.assertIn(".github/workflows", results["by_category"]["ci_cd"]["found"])
+
+    def test_single_directory_read(self):
+        """Test the project directory is listed once rather than stat()-ed per file."""
+        (self.project / ".gitignore").write_text("")
+
+        with patch("pathlib.Path.exists") as mock_exists:
+            results = detect_config_files(self.test_dir)
+
+        mock_exists.assert_not_called()
+        self.assertEqual(results["found"], [".gitignore"])
+
+    def test_unchanged_directory_listing_is_reused(self):
+        """Test an unchanged directory is not listed again, a changed one is."""
+        old = 1_000_000_000
+        os.utime(self.test_dir, (old, old))
+        detect_config_files(self.test_dir)
+
+        with patch("os.scandir", wraps=os.scandir) as mock_scandir:
+            detect_config_files(self.test_dir)
+            mock_scandir.assert_not_called()
+
+            (self.project / "README.md").write_text("# Project")
+            results = detect_config_files(self.test_dir)
+
+        mock_scandir.assert_called_once()
+        self.assertEqual(results["found"], ["README.md"])
+
+    def test_recently_changed_directory_is_not_cached(self):
+        """Test listings of just-modified directories are always re-read."""
+        detect_config_files(self.test_dir)
+
+        with patch("os.scandir", wraps=os.scandir) as mock_scandir:
+            detect_config_files(self.test_dir)
+
+        mock_scandir.assert_called_once()
+
+    def test_missing_directory(self):
+        """Test a directory that can't be read reports everything missing."""
+        results = detect_config_files(str(self.project / "does-not-exist"))
+
+        self.assertEqual(results["total_found"], 0)
+
+    @patch("harmonizer.detectors.config_detector._CASE_INSENSITIVE_FS", True)
+    def test_case_insensitive_filesystem(self):
+        """Test files in another case are found where the filesystem ignores case."""
+        (self.project / "readme.md").write_text("# Project")
+        (self.project / "Setup.py").write_text("")
+
+        results = detect_config_files(self.test_dir)
+        messages = [issue["message"] for issue in detect_config_issues(self.test_dir)]
+
+        self.assertEqual(results["found"], ["setup.py", "README.md"])
+        self.assertFalse(any("No README" in message for message in messages))
+        self.assertFalse(any("No dependency file" in message for message in messages))
+
+    @patch("harmonizer.detectors.config_detector._CASE_INSENSITIVE_FS", False)
+    def test_case_sensitive_filesystem(self):
+        """Test names must match exactly where the filesystem is case-sensitive."""
+        (self.project / "readme.md").write_text("# Project")
+
+        results = detect_config_files(self.test_dir)
+
+        self.assertNotIn("README.md", results["found"])
+
+
+class TestGitignoreChecks(unittest.TestCase):
+    """Test cases for .gitignore and .env checks."""
+
+    def setUp(self):
+        """Create a temporary project directory."""
+        self.test_dir = tempfile.mkdtemp()
+        self.project = Path(self.test_dir)
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.test_dir)
+
+    def test_missing_gitignore(self):
+        """Test a missing .gitignore is incomplete and leaks .env."""
+        (self.project / ".env").write_text("SECRET=1\n")
+
+        self.assertEqual(
+            check_gitignore_completeness(self.test_dir),
+            (False, list(GITIGNORE_PATTERNS)),
+        )
+        self.assertFalse(check_env_file_in_gitignore(self.test_dir))
+
+    def test_complete_gitignore(self):
+        """Test a .gitignore with every pattern is complete and covers .env."""
+        (self.project / ".env").write_text("SECRET=1\n")
+        (self.project / ".gitignore").write_text("\n".join(GITIGNORE_PATTERNS))
+
+        self.assertEqual(check_gitignore_completeness(self.test_dir), (True, []))
+        self.assertTrue(check_env_file_in_gitignore(self.test_dir))
+
+    def test_non_utf8_gitignore(self):
+        """Test a .gitignore with a non-UTF-8 byte is still checked."""
+        (self.project / ".env").write_text("SECRET=1\n")
+        (self.project / ".gitignore").write_bytes(b"# caf\xe9\n.env\n")
+
+        self.assertTrue(check_env_file_in_gitignore(self.test_dir))
+        self.assertNotIn(".env", check_gitignore_completeness(self.test_dir)[1])
+
+    def test_gitignore_only_read_when_needed(self):
+        """Test .gitignore isn't read when no check needs its contents."""
+        (self.project / ".gitignore").write_text("__pycache__\n")
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            self.assertTrue(check_env_file_in_gitignore(self.test_dir))
+            get_recommended_config_files(self.test_dir)
+
+        mock_open.assert_not_called()
+
+    def test_gitignore_edits_are_seen(self):
+        """Test cached .gitignore contents are refreshed when the file changes."""
+        gitignore = self.project / ".gitignore"
+        gitignore.write_text("__pycache__\n")
+        self.assertIn(".env", check_gitignore_completeness(self.test_dir)[1])
+
+        gitignore.write_text("__pycache__\n.env\n")
+        self.assertNotIn(".env", check_gitignore_completeness(self.test_dir)[1])
+
+    def test_recent_gitignore_edit_in_same_tick_is_seen(self):
+        """Test a just-edited .gitignore is re-read even if mtime and size match."""
+        gitignore = self.project / ".gitignore"
+        gitignore.write_text("__pycache__\n.venv\n")
+        st = os.stat(gitignore)
+        self.assertIn(".env", check_gitignore_completeness(self.test_dir)[1])
+
+        # Same size, same mtime: indistinguishable by the cache key
+        gitignore.write_text("__pycache__\n.env\n\n")
+        os.utime(gitignore, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        self.assertNotIn(".env", check_gitignore_completeness(self.test_dir)[1])
+
+    def test_issues_read_gitignore_once(self):
+        """Test detect_config_issues opens .gitignore at most once."""
+        (self.project / ".env").write_text("SECRET=1\n")
+        (self.project / ".gitignore").write_text("# nothing useful yet\n")
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            issues = detect_config_issues(self.test_dir)
+
+        self.assertLessEqual(mock_open.call_count, 1)
+        self.assertEqual(
+            [issue["severity"] for issue in issues],
+            ["info", "error", "warning", "warning"],
+        )
+
+    def test_issues_for_complete_project(self):
+        """Test a well set up project has no configuration issues."""
+        (self.project / ".gitignore").write_text("\n".join(GITIGNORE_PATTERNS))
+        (self.project / "README.md").write_text("# Project")
+        (self.project / "pyproject.toml").write_text("")
+
+        self.assertEqual(detect_config_issues(self.test_dir), [])
+
+
+
+class TestProjectSnapshot(unittest.TestCase):
+    """Test cases for sharing one directory snapshot between checks."""
+
+    def test_snapshot_contents(self):
+        """Test a snapshot records the entries and the .gitignore text."""
+        with tempfile.TemporaryDirectory() as tmp:
+            (Path(tmp) / ".gitignore").write_text(".env\n")
+            (Path(tmp) / "tests").mkdir()
+
+            snapshot = snapshot_project(tmp)
+
+        self.assertEqual(snapshot.names, frozenset({".gitignore", "tests"}))
+        self.assertEqual(snapshot.gitignore_text, ".env\n")
+        self.assertTrue(snapshot.has("tests"))
+        self.assertFalse(snapshot.has("README.md"))
+
+    def test_checks_answer_from_snapshot(self):
+        """Test the checks use a given snapshot instead of the filesystem."""
+        snapshot = ProjectSnapshot(
+            root="/nonexistent/project",
+            names=frozenset({".git", ".env", ".gitignore", "README.md", "tests"}),
+            gitignore_text="__pycache__\n",
+        )
+        path = snapshot.root
+
+        self.assertEqual(
+            detect_config_files(path, snapshot)["found"],
+            [".gitignore", ".env", "README.md"],
+        )
+        self.assertFalse(check_env_file_in_gitignore(path, snapshot))
+        self.assertFalse(check_gitignore_completeness(path, snapshot)[0])
+        self.assertEqual(
+            [name for name, _ in get_recommended_config_files(path, snapshot)],
+            [".editorconfig", ".env.example", "pytest.ini", ".pre-commit-config.yaml"],
+        )
+        self.assertIn(
+            "security",
+            [issue["category"] for issue in detect_config_issues(path, snapshot)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,10 @@ This module tests dependency scanning functionality including:
 - Installed package listing
 """
 
+import os
+import shutil
+import sys
+import tempfile
 import unittest
 from unittest.mock import patch, mock_open, MagicMock
 from pathlib import Path
@@ -22,12 +26,19 @@ from harmonizer.detectors.dependency_detector import (
     find_missing_packages,
     check_package_installed,
     get_package_version,
+    invalidate_installed_cache,
+    invalidate_parse_cache,
 )
+from harmonizer.utils.toml_utils import load_toml
 
 
 class TestRequirementsTxtParsing(unittest.TestCase):
     """Test cases for parsing requirements.txt files."""
 
+    def setUp(self):
+        """Start without cached parser results for the mocked files."""
+        invalidate_parse_cache()
+
     def test_parse_simple_requirements(self):
         """Test parsing simple package names."""
         content = """requests
@@ -71,6 +82,21 @@ numpy  # Required by pandas
 
         self.assertEqual(sorted(result), ["flask", "numpy", "pandas"])
 
+    def test_parse_requirements_skips_options(self):
+        """Test option lines and git URLs are not taken for packages."""
+        content = """-r base.txt
+--index-url https://example.org/simple
+-e ./local-package
+git+https://github.com/user/repo.git
+requests
+"""
+        mock_file = mock_open(read_data=content)
+
+        with patch("builtins.open", mock_file):
+            result = parse_requirements_txt(Path("requirements.txt"))
+
+        self.assertEqual(result, ["requests"])
+
     def test_parse_requirements_with_extras(self):
         """Test parsing packages with extras."""
         content = """requests[security]>=2.28.0
@@ -106,6 +132,10 @@ numpy; sys_platform == 'linux'
 class TestPyprojectTomlParsing(unittest.TestCase):
     """Test cases for parsing pyproject.toml files."""
 
+    def setUp(self):
+        """Start without cached parser results for the mocked files."""
+        invalidate_parse_cache()
+
     def test_parse_poetry_dependencies(self):
         """Test parsing Poetry-style dependencies."""
         content = """
@@ -146,6 +176,54 @@ dependencies = [
         self.assertIn("flask", result)
         self.assertIn("numpy", result)
 
+    @unittest.skipIf(load_toml("") is None, "needs tomllib or tomli")
+    def test_parse_pyproject_only_dependency_tables(self):
+        """Test only runtime dependencies are read, not other string values."""
+        content = """
+[build-system]
+requires = ["setuptools>=61", "wheel"]
+
+[project]
+name = "myproject"
+dependencies = ["requests[socks]>=2.28 ; python_version > '3.7'", "Flask"]
+
+[project.optional-dependencies]
+dev = ["pytest"]
+
+[tool.poetry.dependencies]
+python = "^3.10"
+numpy = { version = "^1.23", optional = true }
+"""
+        mock_file = mock_open(read_data=content)
+
+        with patch("builtins.open", mock_file):
+            result = parse_pyproject_toml(Path("pyproject.toml"))
+
+        self.assertEqual(result, ["requests", "Flask", "numpy"])
+
+    @patch("harmonizer.detectors.dependency_detector.load_toml", return_value=None)
+    def test_parse_pyproject_fallback_skips_other_tables(self, mock_load):
+        """Test the regex fallback also ignores build and optional requirements."""
+        content = """
+[build-system]
+requires = ["setuptools>=61", "wheel"]
+
+[project]
+dependencies = ["requests>=2.28", "Flask"]
+
+[project.optional-dependencies]
+dev = ["pytest"]
+"""
+        mock_file = mock_open(read_data=content)
+
+        with patch("builtins.open", mock_file):
+            result = parse_pyproject_toml(Path("pyproject.toml"))
+
+        self.assertIn("requests", result)
+        self.assertNotIn("setuptools", result)
+        self.assertNotIn("wheel", result)
+        self.assertNotIn("pytest", result)
+
     def test_parse_pyproject_file_not_found(self):
         """Test handling of missing pyproject.toml."""
         with patch("builtins.open", side_effect=FileNotFoundError):
@@ -157,6 +235,10 @@ dependencies = [
 class TestSetupPyParsing(unittest.TestCase):
     """Test cases for parsing setup.py files."""
 
+    def setUp(self):
+        """Start without cached parser results for the mocked files."""
+        invalidate_parse_cache()
+
     def test_parse_setup_py_install_requires(self):
         """Test parsing setup.py install_requires."""
         content = """
@@ -201,10 +283,37 @@ setup(
         self.assertIn("requests", result)
         self.assertIn("pandas", result)
 
+    def test_parse_setup_py_ast(self):
+        """Test install_requires is read from the setup() call, not the text."""
+        content = """
+import setuptools
+
+REQUIREMENTS = (
+    "requests[socks]>=2.28.0",  # ] in a comment
+    "click",
+)
+
+setuptools.setup(
+    name="myproject",
+    install_requires=REQUIREMENTS,
+    extras_require={"dev": ["pytest"]},
+)
+"""
+        mock_file = mock_open(read_data=content)
+
+        with patch("builtins.open", mock_file):
+            result = parse_setup_py(Path("setup.py"))
+
+        self.assertEqual(result, ["requests", "click"])
+
 
 class TestPipfileParsing(unittest.TestCase):
     """Test cases for parsing Pipfile."""
 
+    def setUp(self):
+        """Start without cached parser results for the mocked files."""
+        invalidate_parse_cache()
+
     def test_parse_pipfile_packages(self):
         """Test parsing Pipfile packages section."""
         content = """
@@ -228,30 +337,80 @@ pytest = "*"
         self.assertNotIn("pytest", result)
 
 
+class TestParseCache(unittest.TestCase):
+    """Test cases for reusing parser results for unchanged files."""
+
+    def setUp(self):
+        """Create a requirements file old enough to be cached."""
+        invalidate_parse_cache()
+        self.test_dir = tempfile.mkdtemp()
+        self.req_file = Path(self.test_dir) / "requirements.txt"
+        self.req_file.write_text("requests\n")
+        os.utime(self.req_file, (1_000_000_000, 1_000_000_000))
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.test_dir)
+
+    def test_unchanged_file_parsed_once(self):
+        """Test an unchanged file is only read the first time."""
+        self.assertEqual(parse_requirements_txt(self.req_file), ["requests"])
+
+        with patch("builtins.open", wraps=open) as mock_file:
+            result = parse_requirements_txt(self.req_file)
+
+        mock_file.assert_not_called()
+        self.assertEqual(result, ["requests"])
+
+    def test_changed_file_parsed_again(self):
+        """Test editing the file invalidates the cached result."""
+        parse_requirements_txt(self.req_file)
+
+        self.req_file.write_text("requests\nflask\n")
+
+        self.assertEqual(parse_requirements_txt(self.req_file), ["requests", "flask"])
+
+
 class TestInstalledPackages(unittest.TestCase):
     """Test cases for getting installed packages."""
 
-    @patch("harmonizer.utils.subprocess_utils.run_command_safe")
-    def test_get_installed_packages_success(self, mock_run):
-        """Test getting list of installed packages."""
-        mock_run.return_value = (
-            True,
-            """requests==2.28.1
-flask==2.0.3
-numpy==1.23.5
-""",
-            "",
-        )
+    def setUp(self):
+        """Make sure every test lists packages afresh."""
+        invalidate_installed_cache()
+
+    def tearDown(self):
+        """Don't leave test data in the cache."""
+        invalidate_installed_cache()
+
+    @staticmethod
+    def _dists(*names):
+        """Build fake distributions with the given metadata names."""
+        return [MagicMock(metadata={"Name": name}) for name in names]
+
+    @patch("harmonizer.detectors.dependency_detector.run_command_safe")
+    @patch("importlib.metadata.distributions")
+    def test_get_installed_packages_success(self, mock_dists, mock_run):
+        """Test getting list of installed packages from package metadata."""
+        mock_dists.return_value = self._dists("Requests", "Flask", "numpy", "requests")
 
         result = get_installed_packages()
 
-        self.assertIn("requests", result)
-        self.assertIn("flask", result)
-        self.assertIn("numpy", result)
-        self.assertEqual(len(result), 3)
+        self.assertEqual(result, ["requests", "flask", "numpy"])
+        mock_run.assert_not_called()
 
-    @patch("harmonizer.utils.subprocess_utils.run_command_safe")
-    def test_get_installed_packages_failure(self, mock_run):
+    @patch("harmonizer.detectors.dependency_detector.run_command_safe")
+    @patch("importlib.metadata.distributions", side_effect=OSError)
+    def test_get_installed_packages_pip_fallback(self, mock_dists, mock_run):
+        """Test pip list is used when the metadata can't be read."""
+        mock_run.return_value = (True, "requests==2.28.1\nFlask==2.0.3\n", "")
+
+        result = get_installed_packages()
+
+        self.assertEqual(result, ["requests", "flask"])
+
+    @patch("harmonizer.detectors.dependency_detector.run_command_safe")
+    @patch("importlib.metadata.distributions", side_effect=OSError)
+    def test_get_installed_packages_failure(self, mock_dists, mock_run):
         """Test handling of pip list failure."""
         mock_run.return_value = (False, "", "pip not found")
 
@@ -260,9 +419,11 @@ numpy==1.23.5
         # Should return empty list on failure
         self.assertEqual(result, [])
 
-    @patch("harmonizer.utils.subprocess_utils.run_command_safe")
-    def test_get_installed_packages_empty(self, mock_run):
+    @patch("harmonizer.detectors.dependency_detector.run_command_safe")
+    @patch("importlib.metadata.distributions")
+    def test_get_installed_packages_empty(self, mock_dists, mock_run):
         """Test with no packages installed."""
+        mock_dists.return_value = []
         mock_run.return_value = (True, "", "")
 
         result = get_installed_packages()
@@ -270,6 +431,54 @@ numpy==1.23.5
         self.assertEqual(result, [])
 
 
+class TestInstalledPackageCache(unittest.TestCase):
+    """Test cases for caching installed package information."""
+
+    def setUp(self):
+        """Start every test with an empty cache."""
+        invalidate_installed_cache()
+
+    def tearDown(self):
+        """Don't leave test data in the cache."""
+        invalidate_installed_cache()
+
+    @patch("harmonizer.detectors.dependency_detector._list_installed_packages")
+    def test_installed_packages_listed_once(self, mock_list):
+        """Test the package list is computed once until invalidated."""
+        mock_list.return_value = ["requests", "flask"]
+
+        self.assertEqual(get_installed_packages(), ["requests", "flask"])
+        self.assertEqual(get_installed_packages(), ["requests", "flask"])
+        mock_list.assert_called_once()
+
+        invalidate_installed_cache()
+        get_installed_packages()
+        self.assertEqual(mock_list.call_count, 2)
+
+    @patch("harmonizer.detectors.dependency_detector.run_command_safe")
+    @patch("importlib.metadata.distributions")
+    def test_package_lookups_use_metadata(self, mock_dists, mock_run):
+        """Test installed packages are found without running pip show."""
+        mock_dists.return_value = [
+            MagicMock(metadata={"Name": "Requests"}, version="2.28.1")
+        ]
+
+        self.assertTrue(check_package_installed("requests"))
+        self.assertEqual(get_package_version("Requests"), "2.28.1")
+        mock_run.assert_not_called()
+
+    @patch("harmonizer.detectors.dependency_detector.run_command_safe")
+    def test_package_lookups_without_metadata(self, mock_run):
+        """Test pip show is used when importlib.metadata can't be imported."""
+        mock_run.return_value = (True, "Name: requests\nVersion: 2.28.1\n", "")
+
+        with patch.dict(sys.modules, {"importlib.metadata": None}):
+            self.assertTrue(check_package_installed("requests"))
+            self.assertEqual(get_package_version("requests"), "2.28.1")
+
+        self.assertEqual(mock_run.call_count, 2)
+
+
 class TestMissingPackages(unittest.TestCase):
     """Test cases for finding missing packages."""
 
@@ -309,6 +518,15 @@ class TestMissingPackages(unittest.TestCase):
 
         self.assertEqual(result, [])
 
+    def test_find_missing_packages_normalized_names(self):
+        """Test "-", "_" and "." spellings of a name are treated as the same."""
+        required = ["Flask_Login", "zope.interface", "typing-extensions"]
+        installed = frozenset({"flask-login", "zope-interface"})
+
+        result = find_missing_packages(required, installed)
+
+        self.assertEqual(result, ["typing-extensions"])
+
 
 class TestPackageChecks(unittest.TestCase):
     """Test cases for individual package checks."""
@@ -360,16 +578,24 @@ Summary: HTTP library
 class TestScanDependencies(unittest.TestCase):
     """Test cases for comprehensive dependency scanning."""
 
+    def setUp(self):
+        """Create a temporary project directory."""
+        self.test_dir = tempfile.mkdtemp()
+        self.project = Path(self.test_dir)
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.test_dir)
+
     @patch("harmonizer.detectors.dependency_detector.get_installed_packages")
     @patch("harmonizer.detectors.dependency_detector.parse_requirements_txt")
-    @patch("pathlib.Path.exists")
-    def test_scan_with_requirements_txt(self, mock_exists, mock_parse, mock_installed):
+    def test_scan_with_requirements_txt(self, mock_parse, mock_installed):
         """Test scanning with requirements.txt."""
-        mock_exists.return_value = True
+        (self.project / "requirements.txt").write_text("")
         mock_parse.return_value = ["requests", "flask", "numpy"]
         mock_installed.return_value = ["requests", "flask"]
 
-        result = scan_dependencies(".")
+        result = scan_dependencies(self.test_dir)
 
         self.assertIn("requirements.txt", result["requirements_file"])
         self.assertEqual(
@@ -378,18 +604,35 @@ class TestScanDependencies(unittest.TestCase):
         self.assertEqual(sorted(result["missing_packages"]), ["numpy"])
 
     @patch("harmonizer.detectors.dependency_detector.get_installed_packages")
-    @patch("pathlib.Path.exists")
-    def test_scan_no_requirements_file(self, mock_exists, mock_installed):
+    def test_scan_no_requirements_file(self, mock_installed):
         """Test scanning when no requirements file exists."""
-        mock_exists.return_value = False
         mock_installed.return_value = ["requests", "flask"]
 
-        result = scan_dependencies(".")
+        result = scan_dependencies(self.test_dir)
 
+        # Nothing to compare against, so installed packages aren't listed
+        mock_installed.assert_not_called()
         self.assertIsNone(result["requirements_file"])
         self.assertEqual(result["required_packages"], [])
+        self.assertEqual(result["installed_packages"], [])
         self.assertEqual(result["missing_packages"], [])
 
+    @patch("harmonizer.detectors.dependency_detector.get_installed_packages")
+    def test_scan_file_priority(self, mock_installed):
+        """Test the highest priority dependency file is used, found in one listing."""
+        mock_installed.return_value = []
+        (self.project / "Pipfile").write_text('[packages]\nflask = "*"\n')
+        (self.project / "setup.py").write_text('setup(install_requires=["click"])\n')
+        # A directory with a dependency file's name is not a dependency file
+        (self.project / "requirements.txt").mkdir()
+
+        with patch("pathlib.Path.exists") as mock_exists:
+            result = scan_dependencies(self.test_dir)
+
+        mock_exists.assert_not_called()
+        self.assertTrue(result["requirements_file"].endswith("setup.py"))
+        self.assertEqual(result["missing_packages"], ["click"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,6 +5,7 @@ This module tests the full end-to-end functionality of the tool,
 including CLI interface, scanning, and reporting.
 """
 
+import io
 import unittest
 import tempfile
 import shutil
@@ -13,10 +14,45 @@ from unittest.mock import patch
 import sys
 
 from harmonizer.scanners.project_scanner import ProjectScanner
-from harmonizer.cli import create_parser, validate_arguments, run_scan
+from harmonizer.cli import (
+    create_parser,
+    validate_arguments,
+    run_scan,
+    main,
+    display_fix_results,
+    ALL_CHECKS,
+    _determine_checks,
+    _parse_fast_argv,
+    _sniff_groups,
+    _parse_args,
+    _asks_for_version,
+    _get_parser,
+    _get_logger,
+    _wants_file_logging,
+)
+from harmonizer.detectors.venv_detector import (
+    detect_venv_type_cached,
+    _detect_venv_cached,
+)
 from harmonizer.models import OSType, VenvType, IssueSeverity
 
 
+def setUpModule():
+    """Keep the scans' OS detection cache out of the user's home directory."""
+    global _cache_dir, _cache_patcher
+    _cache_dir = tempfile.mkdtemp()
+    _cache_patcher = patch(
+        "harmonizer.detectors.os_detector.OS_CACHE_FILE", Path(_cache_dir) / "os.json"
+    )
+    _cache_patcher.start()
+
+
+def tearDownModule():
+    """Restore the OS cache location and remove the temporary cache."""
+    _cache_patcher.stop()
+    shutil.rmtree(_cache_dir, ignore_errors=True)
+
+
 class TestProjectScanner(unittest.TestCase):
     """Integration tests for ProjectScanner."""
 
@@ -87,6 +123,66 @@ class TestProjectScanner(unittest.TestCase):
         self.assertIsNotNone(env_status)
         self.assertIsNotNone(env_status.os_type)
 
+    def test_scan_skipping_venv(self):
+        """Test that skipping the venv check leaves venv fields at defaults."""
+        scanner = ProjectScanner(str(self.test_project))
+        env_status = scanner.scan(checks=["os", "python", "config"])
+
+        self.assertEqual(env_status.venv_type, VenvType.NONE)
+        self.assertIsNone(env_status.venv_path)
+
+    @patch("harmonizer.scanners.project_scanner.get_system_info_cached")
+    def test_concurrent_detector_error_is_logged(self, mock_os_info):
+        """Test a detector failing in a worker thread is logged and timed."""
+        mock_os_info.side_effect = RuntimeError("boom")
+        scanner = ProjectScanner(str(self.test_project))
+
+        with patch.object(scanner.logger, "error") as mock_error, patch.object(
+            scanner.perf_monitor, "stop_timer", return_value=0.0
+        ) as mock_stop:
+            with self.assertRaises(RuntimeError):
+                scanner.scan(checks=["os", "python"])
+
+        mock_error.assert_called_once()
+        mock_stop.assert_called_with("scan_os")
+
+
+class TestVenvDetectionCache(unittest.TestCase):
+    """Tests for the memoized venv detection helper."""
+
+    def setUp(self):
+        _detect_venv_cached.cache_clear()
+
+    def tearDown(self):
+        _detect_venv_cached.cache_clear()
+
+    def test_repeated_calls_detect_once(self):
+        """Test that the same shell state only runs detection once."""
+        result = {"type": VenvType.NONE, "active": False, "path": None, "name": None}
+        with patch(
+            "harmonizer.detectors.venv_detector.detect_venv_type", return_value=result
+        ) as mock_detect:
+            first = detect_venv_type_cached()
+            second = detect_venv_type_cached()
+
+        self.assertEqual(mock_detect.call_count, 1)
+        self.assertEqual(first, second)
+        # Callers get copies, not the cached dictionary itself
+        self.assertIsNot(first, second)
+
+    def test_changed_virtual_env_misses_cache(self):
+        """Test that activating another environment triggers a new detection."""
+        result = {"type": VenvType.NONE, "active": False, "path": None, "name": None}
+        with patch(
+            "harmonizer.detectors.venv_detector.detect_venv_type", return_value=result
+        ) as mock_detect:
+            with patch.dict("os.environ", {"VIRTUAL_ENV": "/tmp/env-a"}):
+                detect_venv_type_cached()
+            with patch.dict("os.environ", {"VIRTUAL_ENV": "/tmp/env-b"}):
+                detect_venv_type_cached()
+
+        self.assertEqual(mock_detect.call_count, 2)
+
 
 class TestCLIArgumentParsing(unittest.TestCase):
     """Integration tests for CLI argument parsing."""
@@ -130,6 +226,18 @@ class TestCLIArgumentParsing(unittest.TestCase):
         self.assertTrue(args.fix)
         self.assertTrue(args.dry_run)
 
+    def test_parser_with_selected_groups(self):
+        """Test building only some option groups keeps the other defaults."""
+        parser = create_parser(groups=["output options"])
+        args = parser.parse_args(["--json"])
+
+        self.assertTrue(args.json)
+        self.assertFalse(args.fix)
+        self.assertEqual(args.log_level, "INFO")
+
+        with patch("sys.stderr"), self.assertRaises(SystemExit):
+            parser.parse_args(["--fix"])
+
     def test_parser_with_check_filters(self):
         """Test parser with specific check filters."""
         parser = create_parser()
@@ -138,6 +246,278 @@ class TestCLIArgumentParsing(unittest.TestCase):
         self.assertEqual(args.check, ["os", "python"])
 
 
+class TestCLICheckSelection(unittest.TestCase):
+    """Integration tests for --check/--skip resolution."""
+
+    def test_default_runs_all_checks(self):
+        """Test all checks run when neither flag is given."""
+        args = create_parser().parse_args([])
+
+        self.assertEqual(_determine_checks(args), ALL_CHECKS)
+
+    def test_check_selects_and_deduplicates(self):
+        """Test --check keeps only the named checks, once each."""
+        args = create_parser().parse_args(["--check", "os", "--check", "os"])
+
+        self.assertEqual(_determine_checks(args), ("os",))
+
+    def test_skip_removes_checks(self):
+        """Test --skip removes the named checks."""
+        args = create_parser().parse_args(["--skip", "venv", "--skip", "quirks"])
+
+        self.assertEqual(
+            _determine_checks(args), ("os", "python", "dependencies", "config")
+        )
+
+    def test_check_uses_standard_order(self):
+        """Test --check results follow ALL_CHECKS, not the given order."""
+        args = create_parser().parse_args(
+            ["--check", "venv", "--check", "os", "--check", "venv"]
+        )
+
+        self.assertEqual(_determine_checks(args), ("os", "venv"))
+
+
+class TestLazyDetectorsPackage(unittest.TestCase):
+    """Tests for the lazy re-exports in harmonizer and harmonizer.detectors."""
+
+    def test_detectors_package_loads_lazily(self):
+        """Test harmonizer.detectors only imports a detector when it is used."""
+        import subprocess
+
+        code = (
+            "import sys, harmonizer.detectors as d; "
+            "before = 'harmonizer.detectors.venv_detector' in sys.modules; "
+            "d.detect_os_type; "
+            "print(before, 'harmonizer.detectors.os_detector' in sys.modules, "
+            "'harmonizer.detectors.venv_detector' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        self.assertEqual(result.stdout.split(), ["False", "True", "False"])
+
+    def test_package_exports_models_lazily(self):
+        """Test the top-level model re-exports still resolve."""
+        import harmonizer
+        from harmonizer.models import EnvironmentStatus
+
+        self.assertIs(harmonizer.EnvironmentStatus, EnvironmentStatus)
+        with self.assertRaises(AttributeError):
+            harmonizer.no_such_model
+
+    def test_detectors_package_unknown_name(self):
+        """Test unknown names still raise AttributeError."""
+        import harmonizer.detectors
+
+        with self.assertRaises(AttributeError):
+            harmonizer.detectors.no_such_detector
+
+
+class TestCLIFastPath(unittest.TestCase):
+    """Integration tests for the argparse-free fast path."""
+
+    def test_fast_path_matches_parser_defaults(self):
+        """Test fast path returns the same Namespace as argparse."""
+        parser = create_parser()
+
+        self.assertEqual(_parse_fast_argv([]), parser.parse_args([]))
+        self.assertEqual(
+            _parse_fast_argv(["/path/to/project"]),
+            parser.parse_args(["/path/to/project"]),
+        )
+
+    def test_fast_path_matches_parser_with_options(self):
+        """Test common option combinations parse exactly like argparse."""
+        parser = create_parser()
+
+        for argv in (
+            ["--json", "-v"],
+            [".", "--no-color", "--output", "report.txt"],
+            ["--check", "os", "--check", "venv", "/tmp"],
+            ["--fix", "--dry-run", "-y", "--log-level", "DEBUG"],
+            ["--skip", "quirks", "--compact", "--json"],
+        ):
+            with self.subTest(argv=argv):
+                self.assertEqual(_parse_fast_argv(argv), parser.parse_args(argv))
+
+    def test_fast_path_falls_through_for_options(self):
+        """Test anything beyond the plain forms is left to argparse."""
+        self.assertIsNone(_parse_fast_argv(["--help"]))
+        self.assertIsNone(_parse_fast_argv(["--output=report.txt"]))
+        self.assertIsNone(_parse_fast_argv(["--comp"]))
+        self.assertIsNone(_parse_fast_argv(["-vy"]))
+        self.assertIsNone(_parse_fast_argv(["--check", "bogus"]))
+        self.assertIsNone(_parse_fast_argv(["--output"]))
+        self.assertIsNone(_parse_fast_argv(["one", "two"]))
+
+    def test_cli_import_skips_scanner_stack(self):
+        """Test importing the CLI doesn't load the scanner, detectors or reporters."""
+        import subprocess
+
+        code = (
+            "import sys, harmonizer.cli; "
+            "print(' '.join(m for m in sys.modules if m.startswith('harmonizer.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        loaded = result.stdout.split()
+
+        for prefix in (
+            "harmonizer.models",
+            "harmonizer.scanners",
+            "harmonizer.detectors",
+            "harmonizer.reporters",
+            "harmonizer.fixers",
+            "harmonizer.utils",
+        ):
+            self.assertFalse(
+                any(name.startswith(prefix) for name in loaded),
+                f"{prefix} imported by harmonizer.cli: {loaded}",
+            )
+
+    @patch("harmonizer.cli._get_parser")
+    def test_version_skips_parser(self, mock_get_parser):
+        """Test --version is answered without building the parser."""
+        with patch("sys.stdout"):
+            exit_code = main(["--version"])
+
+        self.assertEqual(exit_code, 0)
+        mock_get_parser.assert_not_called()
+
+    def test_version_detection_follows_argparse(self):
+        """Test --version is found where argparse would act on it."""
+        self.assertTrue(_asks_for_version(["--json", "--version"]))
+        self.assertTrue(_asks_for_version([".", "-V"]))
+        self.assertFalse(_asks_for_version(["--help", "--version"]))
+        self.assertFalse(_asks_for_version(["--output", "--version"]))
+        self.assertFalse(_asks_for_version(["--", "--version"]))
+
+    @patch("harmonizer.cli._get_parser")
+    def test_init_config_skips_parser(self, mock_get_parser):
+        """Test a bare --init-config is handled without building a parser."""
+        with patch("harmonizer.utils.config.create_default_config_file"):
+            exit_code = main(["--init-config"])
+
+        self.assertEqual(exit_code, 0)
+        mock_get_parser.assert_not_called()
+
+    @patch("harmonizer.cli._get_parser")
+    def test_short_version_skips_parser(self, mock_get_parser):
+        """Test -V is answered by the fast path as well."""
+        with patch("sys.stdout"):
+            exit_code = main(["-V"])
+
+        self.assertEqual(exit_code, 0)
+        mock_get_parser.assert_not_called()
+
+    @patch("harmonizer.cli._LOGGER", None)
+    @patch("harmonizer.utils.logging_config.HarmonizerLogger.initialize")
+    def test_logger_is_set_up_once(self, mock_initialize):
+        """Test repeated in-process runs reuse the cached logger."""
+        first = _get_logger("INFO")
+        second = _get_logger("DEBUG")
+
+        self.assertIs(first, second)
+        mock_initialize.assert_called_once()
+
+    def test_file_logging_only_when_useful(self):
+        """Test machine-output runs skip the log file unless DEBUG is asked for."""
+        parser = create_parser()
+
+        with patch("sys.stdout") as mock_stdout:
+            mock_stdout.isatty.return_value = True
+            self.assertTrue(_wants_file_logging(parser.parse_args([])))
+            self.assertFalse(_wants_file_logging(parser.parse_args(["--json"])))
+            self.assertTrue(
+                _wants_file_logging(
+                    parser.parse_args(["--json", "--log-level", "DEBUG"])
+                )
+            )
+
+            mock_stdout.isatty.return_value = False
+            self.assertFalse(_wants_file_logging(parser.parse_args([])))
+
+    @patch("harmonizer.utils.config.create_default_config_file")
+    @patch("harmonizer.utils.logging_config.HarmonizerLogger.initialize")
+    def test_init_config_skips_logging_and_validation(
+        self, mock_initialize, mock_create
+    ):
+        """Test --init-config works even with a bogus project path."""
+        exit_code = main(["--init-config", "/nonexistent/path/12345"])
+
+        self.assertEqual(exit_code, 0)
+        mock_create.assert_called_once_with()
+        mock_initialize.assert_not_called()
+
+    @patch("harmonizer.utils.logging_config.HarmonizerLogger.initialize")
+    def test_help_skips_logging_setup(self, mock_initialize):
+        """Test --help exits before the log directory is touched."""
+        with patch("sys.stdout"), self.assertRaises(SystemExit):
+            main(["--help"])
+
+        mock_initialize.assert_not_called()
+
+
+class TestCLIGroupSniffing(unittest.TestCase):
+    """Tests for building only the argument groups a command line uses."""
+
+    def test_sniff_selects_used_groups(self):
+        """Test each option maps to the group that defines it."""
+        self.assertEqual(_sniff_groups(["--json"]), ("output options",))
+        self.assertEqual(
+            _sniff_groups(["--fix", "--dry-run", "."]), ("fix options",)
+        )
+        self.assertEqual(
+            _sniff_groups(["--check", "os", "--log-level=DEBUG"]),
+            ("configuration", "scanning options"),
+        )
+
+    def test_sniff_falls_back_to_full_parser(self):
+        """Test help, ambiguous prefixes and unknown options use every group."""
+        self.assertIsNone(_sniff_groups(["--help"]))
+        self.assertIsNone(_sniff_groups(["--c"]))
+        self.assertIsNone(_sniff_groups(["-vy"]))
+        self.assertIsNone(_sniff_groups(["--bogus"]))
+
+    def test_parsers_are_cached(self):
+        """Test repeated lookups return the same parser object."""
+        groups = _sniff_groups(["--json"])
+
+        self.assertIs(_get_parser(groups), _get_parser(groups))
+        self.assertIsNot(_get_parser(groups), _get_parser(None))
+
+    def test_sniffed_parser_matches_full_parser(self):
+        """Test the reduced parser produces the same Namespace."""
+        for argv in (
+            ["--json", "--comp"],
+            ["--fix", "--yes", "/tmp"],
+            ["--skip", "venv", "-v"],
+        ):
+            with self.subTest(argv=argv):
+                self.assertEqual(
+                    create_parser(groups=_sniff_groups(argv)).parse_args(argv),
+                    create_parser().parse_args(argv),
+                )
+
+    def test_sniffed_parser_errors_use_full_usage(self):
+        """Test a rejected argument prints the full parser's usage and error."""
+        argv = ["--check", "bogus"]
+
+        with patch("sys.stderr", new_callable=io.StringIO) as expected:
+            with self.assertRaises(SystemExit):
+                create_parser().parse_args(argv)
+        with patch("sys.stderr", new_callable=io.StringIO) as actual:
+            with self.assertRaises(SystemExit) as raised:
+                _parse_args(argv)
+
+        self.assertEqual(raised.exception.code, 2)
+        self.assertEqual(actual.getvalue(), expected.getvalue())
+        self.assertIn("[--fix]", actual.getvalue())
+
+
 class TestCLIValidation(unittest.TestCase):
     """Integration tests for CLI argument validation."""
 
@@ -160,6 +540,46 @@ class TestCLIValidation(unittest.TestCase):
         except ValueError:
             self.fail("validate_arguments raised ValueError unexpectedly")
 
+    def test_validate_stores_resolved_path(self):
+        """Test validation keeps the resolved path for run_scan."""
+        args = create_parser().parse_args([self.test_dir])
+        validate_arguments(args)
+
+        self.assertEqual(
+            args.project_path_resolved, str(Path(self.test_dir).resolve())
+        )
+
+        # The scanner is handed the resolved path instead of resolving it again
+        with patch(
+            "harmonizer.scanners.project_scanner.ProjectScanner"
+        ) as mock_scanner:
+            run_scan(args)
+        mock_scanner.assert_called_once_with(
+            args.project_path_resolved, verbose=False, validated=True
+        )
+
+    def test_validate_config_json(self):
+        """Test inline JSON configuration is parsed during validation."""
+        args = create_parser().parse_args(
+            [self.test_dir, "--config-json", '{"verbose": true, "timeout": 10}']
+        )
+        validate_arguments(args)
+
+        self.assertEqual(args.config_data, {"verbose": True, "timeout": 10})
+
+    def test_validate_config_json_errors(self):
+        """Test invalid or conflicting inline configuration is rejected."""
+        for extra in (
+            ["--config-json", "{not json"],
+            ["--config-json", "[1, 2]"],
+            ["--config-json", '{"timeout": -1}'],
+            ["--config-json", "{}", "--config", "x.json"],
+        ):
+            with self.subTest(extra=extra):
+                args = create_parser().parse_args([self.test_dir] + extra)
+                with self.assertRaises(ValueError):
+                    validate_arguments(args)
+
     def test_validate_nonexistent_path(self):
         """Test validation with non-existent path."""
         parser = create_parser()
@@ -170,6 +590,21 @@ class TestCLIValidation(unittest.TestCase):
 
         self.assertIn("does not exist", str(context.exception))
 
+    def test_validate_file_path(self):
+        """Test validation rejects a file, and a path that runs through one."""
+        file_path = Path(self.test_dir) / "setup.py"
+        file_path.write_text("")
+
+        for path, message in (
+            (file_path, "not a directory"),
+            (file_path / "child", "does not exist"),
+        ):
+            with self.subTest(path=path):
+                args = create_parser().parse_args([str(path)])
+                with self.assertRaises(ValueError) as context:
+                    validate_arguments(args)
+                self.assertIn(message, str(context.exception))
+
     def test_validate_dry_run_without_fix(self):
         """Test validation fails when dry-run without fix."""
         parser = create_parser()
@@ -240,6 +675,125 @@ class TestCLIScan(unittest.TestCase):
         self.assertIsNotNone(env_status)
 
 
+class TestFixResultsDisplay(unittest.TestCase):
+    """Tests for the fix results summary."""
+
+    def test_summary_counts_and_single_write(self):
+        """Test successes and failures are counted and written in one call."""
+        from harmonizer.fixers.base_fixer import FixResult
+
+        results = [
+            FixResult(True, "Created .gitignore", dry_run=True),
+            FixResult(False, "Could not create venv"),
+            FixResult(True, "Installed packages", dry_run=True),
+        ]
+        args = create_parser().parse_args(["--fix", "--dry-run"])
+
+        with patch("sys.stdout") as mock_stdout:
+            display_fix_results(results, args)
+
+        mock_stdout.write.assert_called_once()
+        output = mock_stdout.write.call_args[0][0]
+        self.assertIn("Successful fixes (2)", output)
+        self.assertIn("Failed fixes (1)", output)
+        self.assertIn("Total: 2 succeeded, 1 failed", output)
+        self.assertIn("[DRY-RUN] ✓ Created .gitignore", output)
+
+
+class TestReporterOutput(unittest.TestCase):
+    """Integration tests for report output."""
+
+    def setUp(self):
+        """Create a small EnvironmentStatus to report on."""
+        from harmonizer.models import EnvironmentStatus
+
+        self.env = EnvironmentStatus(
+            os_type=OSType.LINUX,
+            os_version="Ubuntu 22.04",
+            python_version="3.10.6",
+            python_executable="/usr/bin/python3",
+            venv_type=VenvType.NONE,
+            venv_active=False,
+            project_path=".",
+        )
+        self.env.add_issue(IssueSeverity.ERROR, "test", "Test error", fixable=True)
+
+    def test_json_write_matches_generate(self):
+        """Test streamed JSON output matches the generated string."""
+        import io
+        from harmonizer.reporters.json_reporter import JSONReporter
+
+        reporter = JSONReporter(include_metadata=False)
+        stream = io.StringIO()
+        reporter.write(self.env, stream)
+
+        self.assertEqual(stream.getvalue(), reporter.generate(self.env) + "\n")
+
+    def test_json_write_is_a_single_call(self):
+        """Test the JSON report reaches the stream in one write()."""
+        from unittest.mock import MagicMock
+        from harmonizer.reporters.json_reporter import JSONReporter
+
+        stream = MagicMock()
+        JSONReporter(include_metadata=False).write(self.env, stream)
+
+        stream.write.assert_called_once()
+
+    def test_text_write_matches_generate(self):
+        """Test streamed text output matches the generated string."""
+        import io
+        from harmonizer.reporters.text_reporter import TextReporter
+
+        reporter = TextReporter(use_color=False)
+        stream = io.StringIO()
+        with patch("harmonizer.reporters.text_reporter.datetime") as mock_datetime:
+            mock_datetime.now.return_value.strftime.return_value = "2024-01-01 00:00:00"
+            reporter.write(self.env, stream)
+            expected = reporter.generate(self.env) + "\n"
+
+        self.assertEqual(stream.getvalue(), expected)
+
+    def test_text_chunks_are_whole_sections(self):
+        """Test text chunks are newline-terminated and rebuild the report."""
+        from harmonizer.reporters.text_reporter import TextReporter
+
+        reporter = TextReporter(use_color=False)
+        with patch("harmonizer.reporters.text_reporter.datetime") as mock_datetime:
+            mock_datetime.now.return_value.strftime.return_value = "2024-01-01 00:00:00"
+            chunks = list(reporter.iter_chunks(self.env))
+            expected = reporter.generate(self.env) + "\n"
+
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(chunk.endswith("\n") for chunk in chunks))
+        self.assertEqual("".join(chunks), expected)
+
+    def test_display_json_to_file(self):
+        """Test the JSON display helper works without a Namespace."""
+        import json
+        from harmonizer.cli import _display_json
+
+        with tempfile.TemporaryDirectory() as tmp:
+            output = str(Path(tmp) / "report.json")
+            with patch("sys.stdout"):
+                _display_json(self.env, output, True)
+
+            with open(output, encoding="utf-8") as f:
+                data = json.load(f)
+
+        self.assertEqual(data["summary"]["errors"], 1)
+
+    def test_compact_output(self):
+        """Test compact mode drops indentation and separator spaces."""
+        import json
+        from harmonizer.reporters.json_reporter import JSONReporter
+
+        output = JSONReporter(include_metadata=False, compact=True).generate(self.env)
+
+        self.assertNotIn("\n", output)
+        self.assertNotIn(": ", output)
+        self.assertEqual(json.loads(output)["summary"]["errors"], 1)
+
+
 class TestEnvironmentStatusModel(unittest.TestCase):
     """Integration tests for EnvironmentStatus data model."""
 
@@ -321,6 +875,27 @@ class TestEnvironmentStatusModel(unittest.TestCase):
         )
         self.assertTrue(env.has_errors())
 
+    def test_fixable_count_method(self):
+        """Test fixable_count matches get_fixable_issues and tracks new issues."""
+        from harmonizer.models import EnvironmentStatus
+
+        env = EnvironmentStatus(
+            os_type=OSType.LINUX,
+            os_version="Ubuntu 22.04",
+            python_version="3.10.6",
+            python_executable="/usr/bin/python3",
+            venv_type=VenvType.NONE,
+            venv_active=False,
+            project_path=".",
+        )
+
+        self.assertEqual(env.fixable_count(), 0)
+
+        env.add_issue(IssueSeverity.WARNING, "test", "Not fixable", fixable=False)
+        env.add_issue(IssueSeverity.ERROR, "test", "Fixable", fixable=True)
+        self.assertEqual(env.fixable_count(), 1)
+        self.assertEqual(env.fixable_count(), len(env.get_fixable_issues()))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -11,12 +11,17 @@ This module tests the OS detection functionality including:
 import unittest
 from unittest.mock import patch, mock_open, MagicMock
 import platform
+import tempfile
+import shutil
+from pathlib import Path
 
 from harmonizer.detectors.os_detector import (
+    clear_os_cache,
     detect_os_type,
     get_os_version,
     get_wsl_version,
     get_system_info,
+    get_system_info_cached,
     _get_linux_distribution,
 )
 from harmonizer.models import OSType
@@ -25,6 +30,14 @@ from harmonizer.models import OSType
 class TestOSDetection(unittest.TestCase):
     """Test cases for OS type detection."""
 
+    def setUp(self):
+        """Forget OS detection results remembered by earlier tests."""
+        clear_os_cache()
+
+    def tearDown(self):
+        """Don't leave results detected under mocks behind."""
+        clear_os_cache()
+
     @patch("platform.system")
     def test_detect_windows_native(self, mock_system):
         """Test detection of Windows native OS."""
@@ -73,6 +86,21 @@ class TestOSDetection(unittest.TestCase):
         self.assertEqual(result, OSType.UNKNOWN)
 
 
+    @patch("platform.system")
+    @patch("builtins.open", new_callable=mock_open, read_data="5.15.0-generic")
+    @patch.dict("os.environ", {}, clear=True)
+    def test_detection_is_remembered(self, mock_file, mock_system):
+        """Test /proc is only read the first time the OS is detected."""
+        mock_system.return_value = "Linux"
+
+        self.assertEqual(detect_os_type(), OSType.LINUX)
+        reads = mock_file.call_count
+        self.assertEqual(detect_os_type(), OSType.LINUX)
+        self.assertEqual(get_wsl_version(), "Not WSL")
+
+        self.assertEqual(mock_file.call_count, reads)
+
+
 class TestOSVersion(unittest.TestCase):
     """Test cases for OS version detection."""
 
@@ -133,6 +161,30 @@ class TestOSVersion(unittest.TestCase):
 class TestLinuxDistribution(unittest.TestCase):
     """Test cases for Linux distribution detection."""
 
+    def setUp(self):
+        """Forget remembered results and read os-release with our own parser."""
+        clear_os_cache()
+        # platform.freedesktop_os_release() caches its result for the whole
+        # process, so the file-based tests use the pre-3.10 reader instead
+        patcher = patch("platform.freedesktop_os_release", None, create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Don't leave results detected under mocks behind."""
+        clear_os_cache()
+
+    def test_freedesktop_os_release(self):
+        """Test the standard library os-release parser is used when available."""
+        info = {"NAME": "Fedora Linux", "PRETTY_NAME": "Fedora Linux 39"}
+
+        with patch("platform.freedesktop_os_release", return_value=info, create=True):
+            with patch("builtins.open") as mock_file:
+                result = _get_linux_distribution()
+
+        mock_file.assert_not_called()
+        self.assertEqual(result, "Fedora Linux 39")
+
     @patch(
         "builtins.open",
         new_callable=mock_open,
@@ -164,8 +216,9 @@ DISTRIB_DESCRIPTION="Ubuntu 22.04.1 LTS"
         self.assertEqual(result, "Ubuntu 22.04.1 LTS")
 
     @patch("builtins.open", side_effect=FileNotFoundError)
-    @patch("harmonizer.utils.subprocess_utils.run_command_safe")
-    def test_use_lsb_release_command(self, mock_run, mock_file):
+    @patch("shutil.which", return_value="/usr/bin/lsb_release")
+    @patch("harmonizer.detectors.os_detector.run_command_safe")
+    def test_use_lsb_release_command(self, mock_run, mock_which, mock_file):
         """Test using lsb_release command."""
         mock_run.return_value = (True, "Description:\tUbuntu 22.04.1 LTS\n", "")
 
@@ -173,18 +226,37 @@ DISTRIB_DESCRIPTION="Ubuntu 22.04.1 LTS"
         self.assertEqual(result, "Ubuntu 22.04.1 LTS")
 
     @patch("builtins.open", side_effect=FileNotFoundError)
-    @patch("harmonizer.utils.subprocess_utils.run_command_safe")
-    def test_no_distribution_info(self, mock_run, mock_file):
+    @patch("shutil.which", return_value="/usr/bin/lsb_release")
+    @patch("harmonizer.detectors.os_detector.run_command_safe")
+    def test_no_distribution_info(self, mock_run, mock_which, mock_file):
         """Test when no distribution information is available."""
         mock_run.return_value = (False, "", "Command not found")
 
         result = _get_linux_distribution()
         self.assertEqual(result, "")
 
+    @patch("builtins.open", side_effect=FileNotFoundError)
+    @patch("shutil.which", return_value=None)
+    @patch("harmonizer.detectors.os_detector.run_command_safe")
+    def test_lsb_release_not_installed(self, mock_run, mock_which, mock_file):
+        """Test lsb_release isn't started when it isn't on PATH."""
+        result = _get_linux_distribution()
+
+        mock_run.assert_not_called()
+        self.assertEqual(result, "")
+
 
 class TestWSLVersion(unittest.TestCase):
     """Test cases for WSL version detection."""
 
+    def setUp(self):
+        """Forget OS detection results remembered by earlier tests."""
+        clear_os_cache()
+
+    def tearDown(self):
+        """Don't leave results detected under mocks behind."""
+        clear_os_cache()
+
     @patch("harmonizer.detectors.os_detector.detect_os_type")
     def test_not_wsl(self, mock_os_type):
         """Test WSL version detection when not on WSL."""
@@ -237,5 +309,76 @@ class TestSystemInfo(unittest.TestCase):
         self.assertEqual(os_version, "Ubuntu 22.04.1 LTS")
 
 
+class TestSystemInfoCache(unittest.TestCase):
+    """Test cases for the boot-keyed OS detection cache."""
+
+    def setUp(self):
+        """Point the cache at a temporary directory."""
+        self.test_dir = tempfile.mkdtemp()
+        self.cache_file = Path(self.test_dir) / "os.json"
+        patcher = patch(
+            "harmonizer.detectors.os_detector.OS_CACHE_FILE", self.cache_file
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Clean up temporary directory."""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    @patch("harmonizer.detectors.os_detector._get_boot_id", return_value="boot-1")
+    @patch("harmonizer.detectors.os_detector.get_system_info")
+    def test_cache_reused_within_same_boot(self, mock_info, mock_boot_id):
+        """Test detection runs once per boot."""
+        mock_info.return_value = (OSType.LINUX, "Ubuntu 22.04.1 LTS")
+
+        first = get_system_info_cached()
+        second = get_system_info_cached()
+
+        self.assertEqual(first, (OSType.LINUX, "Ubuntu 22.04.1 LTS"))
+        self.assertEqual(second, first)
+        mock_info.assert_called_once()
+
+    @patch("harmonizer.detectors.os_detector._get_boot_id")
+    @patch("harmonizer.detectors.os_detector.get_system_info")
+    def test_cache_invalidated_after_reboot(self, mock_info, mock_boot_id):
+        """Test a new boot ID triggers fresh detection."""
+        mock_info.return_value = (OSType.LINUX, "Ubuntu 22.04.1 LTS")
+
+        mock_boot_id.return_value = "boot-1"
+        get_system_info_cached()
+        mock_boot_id.return_value = "boot-2"
+        get_system_info_cached()
+
+        self.assertEqual(mock_info.call_count, 2)
+
+    @patch("harmonizer.detectors.os_detector._get_os_release_mtime")
+    @patch("harmonizer.detectors.os_detector._get_boot_id", return_value="boot-1")
+    @patch("harmonizer.detectors.os_detector.get_system_info")
+    def test_cache_invalidated_after_os_upgrade(
+        self, mock_info, mock_boot_id, mock_mtime
+    ):
+        """Test a rewritten os-release triggers fresh detection without a reboot."""
+        mock_info.return_value = (OSType.LINUX, "Ubuntu 22.04.1 LTS")
+        mock_mtime.return_value = 1_000_000_000
+        get_system_info_cached()
+
+        mock_info.return_value = (OSType.LINUX, "Ubuntu 24.04 LTS")
+        mock_mtime.return_value = 2_000_000_000
+
+        self.assertEqual(get_system_info_cached(), (OSType.LINUX, "Ubuntu 24.04 LTS"))
+        self.assertEqual(mock_info.call_count, 2)
+
+    @patch("harmonizer.detectors.os_detector._get_boot_id", return_value=None)
+    @patch("harmonizer.detectors.os_detector.get_system_info")
+    def test_no_cache_without_boot_id(self, mock_info, mock_boot_id):
+        """Test nothing is cached when no boot ID is available."""
+        mock_info.return_value = (OSType.MACOS, "macOS 14.0")
+
+        get_system_info_cached()
+
+        self.assertFalse(self.cache_file.exists())
+
+
 if __name__ == "__main__":
     unittest.main()
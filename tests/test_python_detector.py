@@ -8,6 +8,9 @@ This module tests the Python version detection functionality including:
 - Parsing version specifications from various file formats
 """
 
+import os
+import shutil
+import tempfile
 import unittest
 from unittest.mock import patch, mock_open, MagicMock
 import sys
@@ -20,8 +23,10 @@ from harmonizer.detectors.python_detector import (
     get_python_info_summary,
     _parse_python_version_from_pyproject,
     _parse_python_version_from_setup,
+    _stat_requirement_files,
 )
 from harmonizer.models import IssueSeverity
+from harmonizer.utils.toml_utils import load_toml
 
 
 class TestPythonVersionDetection(unittest.TestCase):
@@ -57,40 +62,102 @@ class TestPythonVersionDetection(unittest.TestCase):
 class TestProjectPythonRequirement(unittest.TestCase):
     """Test cases for detecting project Python requirements."""
 
-    @patch("pathlib.Path.exists")
-    @patch("pathlib.Path.read_text")
-    def test_python_version_file(self, mock_read, mock_exists):
+    def setUp(self):
+        """Create a temporary project directory."""
+        self.test_dir = tempfile.mkdtemp()
+        self.project = Path(self.test_dir)
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.test_dir)
+
+    def _age(self, *names):
+        """Backdate files so they are old enough to be cached."""
+        for name in names:
+            os.utime(self.project / name, (1_000_000_000, 1_000_000_000))
+
+    def test_python_version_file(self):
         """Test reading .python-version file."""
-        mock_exists.return_value = True
-        mock_read.return_value = "3.10.6\n"
+        (self.project / ".python-version").write_text("3.10.6\n")
 
-        result = get_project_python_requirement(".")
+        result = get_project_python_requirement(self.test_dir)
 
         self.assertEqual(result, "3.10.6")
 
-    @patch("pathlib.Path.exists")
-    @patch("pathlib.Path.read_text")
-    def test_runtime_txt(self, mock_read, mock_exists):
+    def test_runtime_txt(self):
         """Test reading runtime.txt file."""
+        (self.project / "runtime.txt").write_text("python-3.10.6")
 
-        def exists_side_effect(self):
-            # .python-version doesn't exist, runtime.txt does
-            return self.name == "runtime.txt"
+        result = get_project_python_requirement(self.test_dir)
 
-        with patch.object(Path, "exists", exists_side_effect):
-            mock_read.return_value = "python-3.10.6"
+        self.assertEqual(result, "3.10.6")
+
+    def test_tool_versions(self):
+        """Test reading the python line of an asdf .tool-versions file."""
+        (self.project / ".tool-versions").write_text("nodejs 20.1.0\npython 3.11.4\n")
 
-            result = get_project_python_requirement(".")
+        result = get_project_python_requirement(self.test_dir)
 
-            self.assertEqual(result, "3.10.6")
+        self.assertEqual(result, "3.11.4")
 
-    @patch("pathlib.Path.exists", return_value=False)
-    def test_no_python_requirement(self, mock_exists):
+    def test_no_python_requirement(self):
         """Test when no Python requirement file exists."""
-        result = get_project_python_requirement(".")
+        result = get_project_python_requirement(self.test_dir)
 
         self.assertIsNone(result)
 
+    def test_single_directory_read(self):
+        """Test candidate files are found by listing, not checked one by one."""
+        (self.project / "setup.py").write_text('setup(python_requires=">=3.9")\n')
+        (self.project / ".tool-versions").mkdir()
+
+        with patch("pathlib.Path.exists") as mock_exists:
+            result = get_project_python_requirement(self.test_dir)
+
+        mock_exists.assert_not_called()
+        self.assertEqual(result, "3.9")
+
+    def test_unchanged_files_are_not_read_again(self):
+        """Test the requirement is reused while the files are unchanged."""
+        (self.project / ".python-version").write_text("3.10.6\n")
+        self._age(".python-version")
+        get_project_python_requirement(self.test_dir)
+
+        with patch(
+            "harmonizer.detectors.python_detector._find_project_python_requirement"
+        ) as mock_find:
+            result = get_project_python_requirement(self.test_dir)
+
+        mock_find.assert_not_called()
+        self.assertEqual(result, "3.10.6")
+
+    def test_new_file_is_seen(self):
+        """Test adding a higher-priority file invalidates the cached result."""
+        (self.project / "runtime.txt").write_text("python-3.9.1")
+        self._age("runtime.txt")
+        self.assertEqual(get_project_python_requirement(self.test_dir), "3.9.1")
+
+        (self.project / ".python-version").write_text("3.12.0\n")
+
+        self.assertEqual(get_project_python_requirement(self.test_dir), "3.12.0")
+
+    @patch("harmonizer.detectors.python_detector._CASE_INSENSITIVE_FS", True)
+    def test_case_insensitive_filesystem(self):
+        """Test candidate files in another case are found where case is ignored."""
+        (self.project / "Setup.py").write_text("")
+        (self.project / "RUNTIME.TXT").write_text("")
+
+        stats = _stat_requirement_files(self.test_dir)
+
+        self.assertEqual(set(stats), {"setup.py", "runtime.txt"})
+
+    @patch("harmonizer.detectors.python_detector._CASE_INSENSITIVE_FS", False)
+    def test_case_sensitive_filesystem(self):
+        """Test candidate names must match exactly where case matters."""
+        (self.project / "Setup.py").write_text("")
+
+        self.assertEqual(_stat_requirement_files(self.test_dir), {})
+
 
 class TestPyprojectParsing(unittest.TestCase):
     """Test cases for parsing pyproject.toml files."""
@@ -145,6 +212,39 @@ python = ">=3.9,<4.0"
 
         self.assertEqual(result, "3.9")
 
+    @unittest.skipIf(load_toml("") is None, "needs tomllib or tomli")
+    def test_parse_pyproject_ignores_other_tables(self):
+        """Test a python key outside the requirement tables is ignored."""
+        content = """
+[tool.some-tool]
+python = "2.7"
+
+[project]
+name = "myproject"
+requires-python = ">=3.10"
+"""
+        mock_file = mock_open(read_data=content)
+
+        with patch("builtins.open", mock_file):
+            result = _parse_python_version_from_pyproject(Path("pyproject.toml"))
+
+        self.assertEqual(result, "3.10")
+
+    @patch("harmonizer.detectors.python_detector.load_toml", return_value=None)
+    def test_parse_pyproject_regex_fallback(self, mock_load):
+        """Test requires-python is still found without a TOML parser."""
+        content = """
+[project]
+name = "myproject"
+requires-python = ">=3.10"
+"""
+        mock_file = mock_open(read_data=content)
+
+        with patch("builtins.open", mock_file):
+            result = _parse_python_version_from_pyproject(Path("pyproject.toml"))
+
+        self.assertEqual(result, "3.10")
+
     def test_parse_pyproject_file_not_found(self):
         """Test handling of missing pyproject.toml."""
         with patch("builtins.open", side_effect=FileNotFoundError):